@@ -0,0 +1,206 @@
+import re
+from typing import List, Dict, Any, Tuple, Iterable, Optional
+
+import utils
+from join_engine import CANCEL_CHECK_INTERVAL
+from models import AggregateResult
+
+
+AGGREGATE_FUNCTIONS = ["COUNT", "SUM", "AVG", "MIN", "MAX"]
+
+# "COUNT(*)", "avg(B_budget)" 형태의 집계 식을 인식하는 정규식
+_AGGREGATE_PATTERN = re.compile(r"^\s*([A-Za-z]+)\s*\(\s*([^()]*?)\s*\)\s*$")
+
+
+def parse_aggregate_spec(spec_text: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    핵심: "COUNT(*), AVG(salary)" 형태의 집계 식 문자열을 파싱합니다.
+
+    매개변수:
+        spec_text: 쉼표로 구분된 집계 식 문자열
+
+    반환값:
+        (집계_함수, 열_이름) 튜플의 리스트, COUNT(*)의 열 이름은 None입니다.
+    """
+    specs = []
+    for part in spec_text.split(","):
+        if not part.strip():
+            continue
+        match = _AGGREGATE_PATTERN.match(part)
+        if not match:
+            raise ValueError(f"집계 식을 해석할 수 없습니다: {part.strip()}")
+
+        function = match.group(1).upper()
+        column = match.group(2)
+        if function not in AGGREGATE_FUNCTIONS:
+            raise ValueError(f"지원하지 않는 집계 함수입니다: {function}")
+        if column == "*":
+            if function != "COUNT":
+                raise ValueError(f"{function}(*)는 지원하지 않습니다. 열 이름을 지정해야 합니다.")
+            column = None
+        elif not column:
+            raise ValueError(f"{function}에 사용할 열 이름이 없습니다.")
+        specs.append((function, column))
+
+    if not specs:
+        raise ValueError("최소 하나의 집계 식이 필요합니다.")
+    return specs
+
+
+class HashAggregator:
+    """
+    핵심: JOIN 결과 행을 생성되는 즉시 그룹별로 접어 넣는 스트리밍 해시 집계기입니다.
+
+    그룹마다 집계 상태(개수, 합계, 최솟값, 최댓값)만 보관하므로
+    JOIN 결과 전체를 메모리에 만들지 않고도 GROUP BY 결과를 계산할 수 있습니다.
+    """
+    def __init__(self, group_by: List[str], aggregates: List[Tuple[str, Optional[str]]]):
+        """
+        핵심: 집계기를 초기화합니다.
+
+        매개변수:
+            group_by: 그룹화할 열 이름 목록 (빈 목록이면 전체를 하나의 그룹으로 집계)
+            aggregates: parse_aggregate_spec이 반환한 (집계_함수, 열_이름) 목록
+        """
+        self.group_by = list(group_by)
+        self.aggregates = list(aggregates)
+        self.groups = {}  # 그룹 키 -> (그룹 값 목록, 집계 상태 목록)
+        self.row_count = 0
+        # 아직 어떤 행에서도 보지 못한 참조 열과, 그동안 본 열 이름 (오류 메시지용)
+        self._unseen_columns = set(self.group_by) | {column for _, column in self.aggregates if column is not None}
+        self._seen_columns = {}
+
+    def add(self, row: Dict[str, Any]):
+        """
+        핵심: 한 행을 해당 그룹의 집계 상태에 반영합니다.
+
+        매개변수:
+            row: JOIN 결과의 병합된 행
+        """
+        if self._unseen_columns:
+            self._track_columns(row)
+
+        group_values = [row.get(col) for col in self.group_by]
+        group_key = tuple(utils.make_hashable(v) for v in group_values)
+
+        entry = self.groups.get(group_key)
+        if entry is None:
+            entry = self._new_group(group_key, group_values)
+
+        for (function, column), state in zip(self.aggregates, entry[1]):
+            if column is None:
+                state[0] += 1
+                continue
+
+            value = row.get(column)
+            if value is None:
+                continue  # SQL과 같이 NULL 값은 집계에서 제외합니다
+
+            state[0] += 1
+            if function in ("SUM", "AVG"):
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    raise ValueError(f"{column} 열의 값 {value!r}은(는) 숫자가 아니므로 {function}을 계산할 수 없습니다.")
+                state[1] += value
+            elif function in ("MIN", "MAX"):
+                try:
+                    if state[2] is None or value < state[2]:
+                        state[2] = value
+                    if state[3] is None or value > state[3]:
+                        state[3] = value
+                except TypeError:
+                    raise ValueError(f"{column} 열에 서로 비교할 수 없는 값이 섞여 있어 {function}을 계산할 수 없습니다.")
+
+        self.row_count += 1
+
+    def consume(self, join_rows: Iterable[Tuple[Dict[str, Any], bool]],
+                check_cancelled=None) -> "HashAggregator":
+        """
+        핵심: JOIN 결과 목록이나 JoinEngine.iter_join_with_strategy가 생성하는 (행, 일치_여부) 스트림을 모두 집계합니다.
+
+        매개변수:
+            join_rows: (병합된_행, 일치_여부) 튜플의 이터러블
+            check_cancelled: 행 CANCEL_CHECK_INTERVAL개마다 호출하여 취소되었으면 예외를 발생시키는 함수 (선택)
+
+        반환값:
+            메서드 체이닝을 위한 집계기 자신
+        """
+        for position, (row, _) in enumerate(join_rows):
+            if check_cancelled is not None and position % CANCEL_CHECK_INTERVAL == 0:
+                check_cancelled()
+            self.add(row)
+        return self
+
+    def result(self, join_type: str = "", key_a: str = "", key_b: str = "") -> AggregateResult:
+        """
+        핵심: 현재까지의 집계 상태로 결과를 생성합니다.
+
+        매개변수:
+            join_type: 집계 대상 JOIN의 유형
+            key_a: 테이블 A의 JOIN 키
+            key_b: 테이블 B의 JOIN 키
+
+        반환값:
+            그룹별 결과 행을 담은 AggregateResult
+
+        예외:
+            ValueError: 집계한 행 중 어디에도 없는 열을 참조한 경우
+        """
+        if self.row_count and self._unseen_columns:
+            missing = ", ".join(sorted(self._unseen_columns))
+            raise ValueError(f"JOIN 결과에 {missing} 열이 없습니다. 사용 가능한 열: {', '.join(self._seen_columns)}")
+        if not self.group_by and not self.groups:
+            # SQL과 같이 GROUP BY 없는 집계는 입력 행이 없어도 COUNT=0, 나머지는 NULL인 한 행을 반환합니다
+            self._new_group((), [])
+
+        labels = [self._label(function, column) for function, column in self.aggregates]
+
+        rows = []
+        for group_values, states in self.groups.values():
+            result_row = dict(zip(self.group_by, group_values))
+            for label, (function, _), state in zip(labels, self.aggregates, states):
+                result_row[label] = self._finalize(function, state)
+            rows.append(result_row)
+
+        return AggregateResult(rows, self.group_by, labels, self.row_count, join_type, key_a, key_b)
+
+    def _new_group(self, group_key: tuple, group_values: List[Any]) -> Tuple[List[Any], List[List[Any]]]:
+        """
+        핵심: 빈 집계 상태를 가진 새 그룹을 만들어 등록합니다.
+        """
+        # 상태: [개수, 합계, 최솟값, 최댓값]
+        entry = (group_values, [[0, 0, None, None] for _ in self.aggregates])
+        self.groups[group_key] = entry
+        return entry
+
+    def _track_columns(self, row: Dict[str, Any]):
+        """
+        핵심: 참조한 열 중 이 행에 있는 열을 확인된 것으로 표시합니다.
+
+        행마다 열 구성이 다를 수 있으므로 존재하지 않는 열인지는 모든 행을 본 뒤 result에서 판단합니다.
+        모든 참조 열을 확인하면 이후 행에서는 호출되지 않습니다.
+        """
+        self._seen_columns.update(dict.fromkeys(row))
+        self._unseen_columns.difference_update(row.keys())
+
+    @staticmethod
+    def _label(function: str, column: Optional[str]) -> str:
+        """
+        핵심: 결과 열 이름으로 사용할 집계 식 레이블을 생성합니다.
+        """
+        return f"{function}({column if column is not None else '*'})"
+
+    @staticmethod
+    def _finalize(function: str, state: List[Any]) -> Any:
+        """
+        핵심: 누적된 집계 상태에서 최종 집계 값을 계산합니다.
+        """
+        count, total, minimum, maximum = state
+        if function == "COUNT":
+            return count
+        if function == "SUM":
+            return total if count else None
+        if function == "AVG":
+            return total / count if count else None
+        if function == "MIN":
+            return minimum
+        return maximum
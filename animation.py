@@ -1,8 +1,25 @@
+import time
+from collections import OrderedDict
 from tkinter import ttk
 import tkinter as tk
 from typing import List, Dict, Any, Tuple, Callable
 from join_engine import JoinEngine
+from explanation import JoinExplanation
 import utils
+import widgets
+
+# 동시에 유지하는 애니메이션 프레임 위젯 트리의 최대 개수
+MAX_REALIZED_FRAMES = 8
+
+# 행 평가 단계 앞에 오는 고정 단계 수 (초기 상태, 카르테시안 곱, JOIN 유형 설명)
+ROW_STEP_OFFSET = 3
+
+# 자동 재생 속도 선택지 (초당 단계 수)와 기본값
+PLAYBACK_SPEEDS = (1, 2, 5, 10, 30, 60)
+DEFAULT_PLAYBACK_SPEED = 5
+
+# 자동 재생 중 유휴 시간에 미리 준비해 두는 다음 단계 수
+PREFETCH_STEPS = 4
 
 """
 핵심: JOIN 연산의 단계별 애니메이션을 관리하는 클래스입니다.
@@ -14,27 +31,55 @@ class AnimationManager:
     
     주요 기능:
     - JOIN 연산의 각 단계를 시각적으로 보여주는 애니메이션 생성
-    - 단계별 프레임 관리 및 렌더링
+    - 단계별 프레임 관리 및 렌더링 (이동할 때 생성하고, 최근 프레임만 LRU로 유지)
     - 다양한 JOIN 유형에 대한 시각적 설명 제공
     - 사용자 인터페이스 상호작용 처리
     """
-    def __init__(self, parent_frame, step_label):
+    def __init__(self, parent_frame, step_label, on_playback_change: Callable = None, populator=None):
         """
         핵심 : 애니메이션 관리자를 초기화합니다.
         
         매개변수:
             parent_frame: 애니메이션 프레임을 표시할 상위 프레임
             step_label: 현재 단계 정보를 표시할 레이블
+            on_playback_change: 자동 재생 상태(재생 중 여부)가 바뀔 때 호출할 콜백 (선택)
+            populator: 테이블 행을 나눠서 삽입할 widgets.IncrementalPopulator (선택)
         """
         self.parent_frame = parent_frame
         self.step_label = step_label
-        self.animation_frames = []
+        self.on_playback_change = on_playback_change
+        self.populator = populator
+        self.animation_frames = OrderedDict()  # 단계 인덱스 -> 생성된 프레임 (LRU 순서)
+        self.row_frame = None  # 모든 행 평가 단계가 함께 쓰는 프레임
+        self.row_widgets = {}
+        self.shown_frame = None
+        self.step_count = 0
         self.current_step = 0
         self.animation_active = False
+        self.normalizer = None
+        
+        # 프레임을 필요할 때 만들기 위해 보관하는 애니메이션 입력
+        self.cartesian_product = []
+        self.table_a = []
+        self.table_b = []
+        self.key_a = None
+        self.key_b = None
+        self.join_type = None
+        self.callback_show_results = None
+        
+        # 자동 재생 상태
+        self.playing = False
+        self.playback_speed = DEFAULT_PLAYBACK_SPEED
+        self._play_origin_step = 0
+        self._play_origin_time = 0.0
+        self._tick_id = None
+        self._prefetch_id = None
+        self._prepared_rows = {}  # 조합 인덱스 -> 미리 계산한 행 평가 표시 내용
         
     def setup_step_animation(self, cartesian_product: List[Tuple[Dict, Dict]], 
                          key_a: str, key_b: str, join_type: str, 
-                         callback_show_results: Callable = None):
+                         callback_show_results: Callable = None, normalizer=None,
+                         explanation_model: JoinExplanation = None):
         """
         핵심 : JOIN 프로세스의 단계별 애니메이션을 설정합니다.
         
@@ -44,50 +89,36 @@ class AnimationManager:
             key_b: 테이블 B의 JOIN 키
             join_type: JOIN 유형 (INNER, LEFT, RIGHT, FULL, CROSS)
             callback_show_results: 결과 탭을 표시하기 위한 선택적 콜백 함수
+            normalizer: JOIN 키 정규화 규칙 (기본값: 정규화 없음)
+            explanation_model: 같은 카르테시안 곱으로 만든 설명 모델 (요약 단계의 행 수에 사용, 없으면 요약 단계에서 생성)
         """
+        self.pause()
+        self._prepared_rows.clear()
+        self.normalizer = normalizer
+        
         # 기존 프레임 제거
-        for frame in self.animation_frames:
+        for frame in self.animation_frames.values():
             frame.destroy()
-        self.animation_frames = []
+        self.animation_frames.clear()
+        if self.row_frame is not None:
+            self.row_frame.pack_forget()  # 행 평가 프레임은 데이터와 무관하므로 다음 실행에서도 재사용
+        self.shown_frame = None
         
         # 카르테시안 곱에서 테이블 추출
-        table_a, table_b = [], []
-        seen_a, seen_b = set(), set()
-        
-        for row_a, row_b in cartesian_product:
-            if id(row_a) not in seen_a:
-                seen_a.add(id(row_a))
-                table_a.append(row_a)
-            if id(row_b) not in seen_b:
-                seen_b.add(id(row_b))
-                table_b.append(row_b)
-        
-        # 프레임 0 생성: 초기 상태 - 두 테이블을 별도로 표시
-        initial_frame = self._create_initial_frame(table_a, table_b, join_type)
-        self.animation_frames.append(initial_frame)
-        
-        # 프레임 1 생성: 카르테시안 곱 설명
-        cartesian_frame = self._create_cartesian_frame(cartesian_product, table_a, table_b)
-        self.animation_frames.append(cartesian_frame)
-        
-        # 프레임 2 생성: JOIN 유형 설명
-        join_explanation_frame = self._create_join_explanation_frame(join_type, key_a, key_b)
-        self.animation_frames.append(join_explanation_frame)
-        
-        # 프레임 3+ 생성: 개별 행 평가
-        max_rows = min(10, len(cartesian_product))  # 성능을 위해 10개 프레임으로 제한
-        for i in range(max_rows):
-            row_frame = self._create_row_evaluation_frame(
-                i, cartesian_product[i][0], cartesian_product[i][1], 
-                key_a, key_b, join_type, cartesian_product
-            )
-            self.animation_frames.append(row_frame)
+        table_a, table_b = utils.get_unique_rows(cartesian_product)
         
-        # 최종 프레임 생성: 요약
-        summary_frame = self._create_summary_frame(
-            cartesian_product, key_a, key_b, join_type, callback_show_results
-        )
-        self.animation_frames.append(summary_frame)
+        # 프레임은 만들지 않고 입력만 보관합니다 (각 단계의 프레임은 처음 표시될 때 생성)
+        self.cartesian_product = cartesian_product
+        self.table_a = table_a
+        self.table_b = table_b
+        self.key_a = key_a
+        self.key_b = key_b
+        self.join_type = join_type
+        self.callback_show_results = callback_show_results
+        self.explanation_model = explanation_model
+        
+        # 단계 구성: 초기 상태, 카르테시안 곱, JOIN 유형 설명, 모든 조합의 행 평가, 요약
+        self.step_count = ROW_STEP_OFFSET + len(cartesian_product) + 1
         
         # 애니메이션 상태 초기화
         self.current_step = 0
@@ -95,7 +126,70 @@ class AnimationManager:
         self.show_animation_frame(0)
         
         # 단계 레이블 업데이트
-        self.step_label.config(text=f"단계 1/{len(self.animation_frames)}")
+        self._update_step_label()
+        
+    def _build_frame(self, index):
+        """
+        핵심 : 단계 인덱스에 해당하는 프레임을 생성합니다.
+        
+        매개변수:
+            index: 단계 인덱스
+            
+        반환값:
+            생성된 프레임
+        """
+        if index == 0:
+            # 초기 상태 - 두 테이블을 별도로 표시
+            return self._create_initial_frame(self.table_a, self.table_b, self.join_type)
+        if index == 1:
+            # 카르테시안 곱 설명
+            return self._create_cartesian_frame(self.cartesian_product, self.table_a, self.table_b)
+        if index == 2:
+            # JOIN 유형 설명
+            return self._create_join_explanation_frame(self.join_type, self.key_a, self.key_b)
+        # 요약
+        if self.explanation_model is None:
+            self.explanation_model = JoinExplanation(
+                self.cartesian_product, self.key_a, self.key_b, self.join_type, self.normalizer
+            )
+        return self._create_summary_frame(
+            self.cartesian_product, self.explanation_model, self.join_type, self.callback_show_results
+        )
+        
+    def _get_frame(self, index):
+        """
+        핵심 : 단계 프레임을 LRU 캐시에서 가져오거나 새로 생성합니다.
+        
+        행 평가 단계는 LRU를 거치지 않고 공용 행 평가 프레임의 내용만 바꿉니다.
+        캐시가 가득 차면 가장 오래 표시되지 않은 프레임을 파괴하여
+        위젯 수가 MAX_REALIZED_FRAMES개 프레임 분량을 넘지 않게 합니다.
+        
+        매개변수:
+            index: 단계 인덱스
+            
+        반환값:
+            단계 프레임
+        """
+        if self._is_row_step(index):
+            return self._show_row_evaluation(index - ROW_STEP_OFFSET)
+        
+        frame = self.animation_frames.get(index)
+        if frame is not None:
+            self.animation_frames.move_to_end(index)
+            return frame
+        
+        frame = self._build_frame(index)
+        self.animation_frames[index] = frame
+        while len(self.animation_frames) > MAX_REALIZED_FRAMES:
+            _, evicted = self.animation_frames.popitem(last=False)
+            evicted.destroy()
+        return frame
+        
+    def _is_row_step(self, index):
+        """
+        핵심 : 단계 인덱스가 행 평가 단계인지 확인합니다.
+        """
+        return ROW_STEP_OFFSET <= index < self.step_count - 1
         
     def _create_initial_frame(self, table_a, table_b, join_type):
         """
@@ -179,9 +273,8 @@ class AnimationManager:
         sample_tree.heading("table_b", text="테이블 B 행")
         
         # 몇 개의 샘플 행 추가
-        for i, (row_a, row_b) in enumerate(cartesian_product[:min(5, len(cartesian_product))]):
-            row_a_str = utils.format_row_as_string(row_a)
-            row_b_str = utils.format_row_as_string(row_b)
+        for i in range(min(5, len(cartesian_product))):
+            row_a_str, row_b_str = utils.pair_display_texts(cartesian_product, i)
             sample_tree.insert("", tk.END, text=f"{i+1}", values=(row_a_str, row_b_str))
         
         if len(cartesian_product) > 5:
@@ -220,9 +313,40 @@ class AnimationManager:
         
         return frame
         
-    def _create_row_evaluation_frame(self, index, row_a, row_b, key_a, key_b, join_type, cartesian_product):
+    def _create_row_evaluation_frame(self):
         """
-        핵심 : 단일 행 조합을 평가하기 위한 프레임을 생성합니다.
+        핵심 : 모든 행 평가 단계가 함께 쓰는 프레임을 한 번만 생성합니다.
+        
+        내용은 비워 두고, 단계를 이동할 때 _update_row_evaluation_frame이
+        레이블의 텍스트와 색상만 바꿉니다.
+        
+        반환값:
+            생성된 프레임
+        """
+        frame = ttk.Frame(self.parent_frame)
+        labels = self.row_widgets
+        
+        labels["title"] = ttk.Label(frame, font=("TkDefaultFont", 12, "bold"))
+        labels["title"].pack(pady=10)
+        
+        labels["row_a"] = ttk.Label(frame, wraplength=600, justify=tk.LEFT)
+        labels["row_a"].pack(anchor=tk.W, pady=2)
+        labels["row_b"] = ttk.Label(frame, wraplength=600, justify=tk.LEFT)
+        labels["row_b"].pack(anchor=tk.W, pady=2)
+        
+        # 결과 레이블 (색상 코딩 적용)
+        labels["result"] = tk.Label(frame, font=("TkDefaultFont", 10, "bold"), padx=5, pady=5)
+        labels["result"].pack(fill=tk.X, pady=10)
+        
+        # 설명
+        labels["explanation"] = ttk.Label(frame, wraplength=600, justify=tk.LEFT)
+        labels["explanation"].pack(fill=tk.X, pady=5)
+        
+        return frame
+        
+    def _update_row_evaluation_frame(self, index, row_a, row_b, key_a, key_b, join_type, cartesian_product):
+        """
+        핵심 : 공용 행 평가 프레임에 단일 행 조합의 평가 내용을 표시합니다.
         
         매개변수:
             index: 행 평가 인덱스
@@ -232,49 +356,76 @@ class AnimationManager:
             key_b: 테이블 B의 JOIN 키
             join_type: JOIN 유형
             cartesian_product: 카르테시안 곱 데이터
-            
-        반환값:
-            생성된 프레임
         """
-        frame = ttk.Frame(self.parent_frame)
+        content = self._prepared_rows.pop(index, None)
+        if content is None:
+            content = self._prepare_row_evaluation(index, row_a, row_b, key_a, key_b, join_type, cartesian_product)
+        title, row_a_text, row_b_text, result_text, result_color, explanation = content
         
-        ttk.Label(frame, text=f"단계 {index+4}: 행 조합 {index+1} 평가",
-                font=("TkDefaultFont", 12, "bold")).pack(pady=10)
+        labels = self.row_widgets
+        labels["title"].config(text=title)
+        labels["row_a"].config(text=row_a_text)
+        labels["row_b"].config(text=row_b_text)
+        labels["result"].config(text=result_text, bg=result_color)
+        labels["explanation"].config(text=explanation)
         
-        # 행 데이터 형식 지정
-        row_a_str = utils.format_row_as_string(row_a)
-        row_b_str = utils.format_row_as_string(row_b)
+    def _prepare_row_evaluation(self, index, row_a, row_b, key_a, key_b, join_type, cartesian_product):
+        """
+        핵심 : 행 평가 프레임에 표시할 텍스트와 색상을 계산합니다. 위젯은 건드리지 않습니다.
+        
+        매개변수:
+            _update_row_evaluation_frame과 같습니다.
+            
+        반환값:
+            (제목, 테이블 A 행, 테이블 B 행, 결과 텍스트, 결과 색상, 설명) 튜플
+        """
+        # 행 데이터 형식 지정 (카르테시안 곱의 행별 표시 문자열 캐시를 공유)
+        row_a_str, row_b_str = utils.pair_display_texts(cartesian_product, index)
         
-        ttk.Label(frame, text=f"테이블 A: {{{row_a_str}}}", wraplength=600, justify=tk.LEFT).pack(anchor=tk.W, pady=2)
-        ttk.Label(frame, text=f"테이블 B: {{{row_b_str}}}", wraplength=600, justify=tk.LEFT).pack(anchor=tk.W, pady=2)
-          # 상세 평가
+        # 상세 평가
         matched = self._evaluate_match(row_a, row_b, key_a, key_b, join_type)
         explanation = self._generate_evaluation_explanation(
             row_a, row_b, key_a, key_b, join_type, cartesian_product
         )
         
-        # 결과 레이블 (색상 코딩 적용)
         result_text = "결과에 포함됨 ✅" if matched else "결과에서 제외됨 ❌"
         result_color = "#e6ffe6" if matched else "#fff0f0"  # 포함된 경우 녹색, 제외된 경우 빨간색
+        return (
+            f"단계 {index+4:,}: 행 조합 {index+1:,} 평가",
+            f"테이블 A: {{{row_a_str}}}",
+            f"테이블 B: {{{row_b_str}}}",
+            result_text,
+            result_color,
+            explanation,
+        )
         
-        result_label = tk.Label(frame, text=result_text, bg=result_color, 
-                              font=("TkDefaultFont", 10, "bold"), padx=5, pady=5)
-        result_label.pack(fill=tk.X, pady=10)
-        
-        # 설명
-        explanation_label = ttk.Label(frame, text=explanation, wraplength=600, justify=tk.LEFT)
-        explanation_label.pack(fill=tk.X, pady=5)
+    def _show_row_evaluation(self, pair_index):
+        """
+        핵심 : 공용 행 평가 프레임을 (없으면 생성하여) 해당 조합의 내용으로 갱신합니다.
         
-        return frame
+        매개변수:
+            pair_index: 카르테시안 곱에서의 조합 인덱스
+            
+        반환값:
+            행 평가 프레임
+        """
+        if self.row_frame is None:
+            self.row_frame = self._create_row_evaluation_frame()
+        row_a, row_b = self.cartesian_product[pair_index]
+        self._update_row_evaluation_frame(
+            pair_index, row_a, row_b, self.key_a, self.key_b, self.join_type, self.cartesian_product
+        )
+        return self.row_frame
         
-    def _create_summary_frame(self, cartesian_product, key_a, key_b, join_type, callback_show_results):
+    def _create_summary_frame(self, cartesian_product, explanation_model, join_type, callback_show_results):
         """
         핵심 : 최종 결과가 포함된 요약 프레임을 생성합니다.
         
+        행 수는 설명 모델이 키 코드로 미리 센 값을 사용하므로 조합마다 키를 다시 비교하지 않습니다.
+        
         매개변수:
             cartesian_product: 카르테시안 곱 데이터
-            key_a: 테이블 A의 JOIN 키
-            key_b: 테이블 B의 JOIN 키
+            explanation_model: 같은 카르테시안 곱으로 만든 explanation.JoinExplanation
             join_type: JOIN 유형
             callback_show_results: 결과 탭을 표시하기 위한 콜백 함수
             
@@ -287,14 +438,14 @@ class AnimationManager:
                 font=("TkDefaultFont", 12, "bold")).pack(pady=10)
         
         # 일치하는 행 수 세기
-        matched_count = self._count_matched_rows(cartesian_product, key_a, key_b, join_type)
+        matched_count = explanation_model.matched_pair_count
         
         summary_text = f"카르테시안 곱의 {len(cartesian_product)}개의 가능한 조합 중:\n\n" \
                       f"- {matched_count}개의 조합이 {join_type} 결과에 직접 포함됩니다.\n"
         
         # OUTER JOIN의 null 행에 대한 설명 추가 (해당되는 경우)
         if join_type in ["LEFT OUTER JOIN", "RIGHT OUTER JOIN", "FULL OUTER JOIN"]:
-            unmatched_count = self._count_unmatched_rows(cartesian_product, key_a, key_b, join_type)
+            unmatched_count = explanation_model.included_count - matched_count
             summary_text += f"- {unmatched_count}개의 추가 행이 OUTER JOIN 논리로 인해 NULL 값으로 포함됩니다.\n"
             summary_text += f"\n결과의 총 행 수: {matched_count + unmatched_count}"
         else:
@@ -316,39 +467,200 @@ class AnimationManager:
         매개변수:
             index: 표시할 프레임의 인덱스
         """
-        if not self.animation_frames:
+        if not self.step_count or not 0 <= index < self.step_count:
             return
+        
+        # 요청된 프레임 준비 (없으면 지금 생성, 행 평가 단계는 내용만 갱신)
+        frame = self._get_frame(index)
+        
+        # 다른 프레임일 때만 현재 프레임을 숨기고 교체
+        if frame is not self.shown_frame:
+            if self.shown_frame is not None and self.shown_frame.winfo_exists():
+                self.shown_frame.pack_forget()
+            frame.pack(fill=tk.BOTH, expand=True)
+            self.shown_frame = frame
+        self.current_step = index
             
-        # 모든 프레임 숨기기
-        for frame in self.animation_frames:
-            frame.pack_forget()
-            
-        if 0 <= index < len(self.animation_frames):
-            # 요청된 프레임 표시
-            self.animation_frames[index].pack(fill=tk.BOTH, expand=True)
-            self.current_step = index
-            
+    def _update_step_label(self):
+        """
+        핵심 : 단계 레이블에 현재 단계와 전체 단계 수를 표시합니다.
+        """
+        self.step_label.config(text=f"단계 {self.current_step+1:,}/{self.step_count:,}")
+        
     def next_animation_step(self):
         """
-        핵심 : 애니메이션의 다음 단계로 이동합니다.
+        핵심 : 애니메이션의 다음 단계로 이동합니다. 자동 재생 중이면 재생을 멈춥니다.
         """
-        if not self.animation_active or not self.animation_frames:
+        if not self.animation_active or not self.step_count:
             return
             
-        next_step = min(self.current_step + 1, len(self.animation_frames) - 1)
+        self.pause()
+        next_step = min(self.current_step + 1, self.step_count - 1)
         self.show_animation_frame(next_step)
-        self.step_label.config(text=f"단계 {next_step+1}/{len(self.animation_frames)}")
+        self._update_step_label()
         
     def prev_animation_step(self):
         """
-        핵심 : 애니메이션의 이전 단계로 이동합니다.
+        핵심 : 애니메이션의 이전 단계로 이동합니다. 자동 재생 중이면 재생을 멈춥니다.
         """
-        if not self.animation_active or not self.animation_frames:
+        if not self.animation_active or not self.step_count:
             return
             
+        self.pause()
         prev_step = max(self.current_step - 1, 0)
         self.show_animation_frame(prev_step)
-        self.step_label.config(text=f"단계 {prev_step+1}/{len(self.animation_frames)}")
+        self._update_step_label()
+        
+    def show_pair_evaluation(self, pair_index):
+        """
+        핵심 : 카르테시안 곱의 특정 조합을 평가하는 단계로 바로 이동합니다.
+        
+        매개변수:
+            pair_index: 카르테시안 곱에서의 조합 인덱스
+        """
+        if not self.animation_active or not 0 <= pair_index < len(self.cartesian_product):
+            return
+        
+        self.pause()
+        self.show_animation_frame(ROW_STEP_OFFSET + pair_index)
+        self._update_step_label()
+        
+    def toggle_playback(self):
+        """
+        핵심 : 자동 재생을 시작하거나 멈춥니다.
+        """
+        if self.playing:
+            self.pause()
+        else:
+            self.play()
+        
+    def play(self):
+        """
+        핵심 : 현재 단계부터 설정된 속도로 자동 재생을 시작합니다.
+        
+        마지막 단계에서 시작하면 처음부터 다시 재생합니다.
+        """
+        if not self.animation_active or not self.step_count or self.playing:
+            return
+        
+        if self.current_step >= self.step_count - 1:
+            self.show_animation_frame(0)
+            self._update_step_label()
+        
+        self.playing = True
+        self._restart_clock()
+        self._schedule_tick()
+        self._schedule_prefetch()
+        if self.on_playback_change:
+            self.on_playback_change(True)
+        
+    def pause(self):
+        """
+        핵심 : 자동 재생을 멈추고 예약된 타이머와 유휴 작업을 취소합니다.
+        """
+        for after_id in (self._tick_id, self._prefetch_id):
+            if after_id is not None:
+                self.parent_frame.after_cancel(after_id)
+        self._tick_id = None
+        self._prefetch_id = None
+        
+        if self.playing:
+            self.playing = False
+            if self.on_playback_change:
+                self.on_playback_change(False)
+        
+    def set_playback_speed(self, steps_per_second):
+        """
+        핵심 : 자동 재생 속도를 변경합니다. 재생 중이면 현재 단계부터 새 속도를 적용합니다.
+        
+        매개변수:
+            steps_per_second: 초당 진행할 단계 수
+        """
+        self.playback_speed = max(float(steps_per_second), 0.1)
+        if self.playing:
+            self._restart_clock()
+            if self._tick_id is not None:
+                self.parent_frame.after_cancel(self._tick_id)
+            self._schedule_tick()
+        
+    def _restart_clock(self):
+        """
+        핵심 : 재생 기준 시각과 기준 단계를 현재로 맞춥니다.
+        """
+        self._play_origin_step = self.current_step
+        self._play_origin_time = time.perf_counter()
+        
+    def _schedule_tick(self):
+        """
+        핵심 : 다음 단계가 표시되어야 할 시각에 맞춰 타이머를 예약합니다.
+        """
+        due_step = self.current_step + 1 - self._play_origin_step
+        due_time = self._play_origin_time + due_step / self.playback_speed
+        delay_ms = max(1, int((due_time - time.perf_counter()) * 1000))
+        self._tick_id = self.parent_frame.after(delay_ms, self._on_tick)
+        
+    def _on_tick(self):
+        """
+        핵심 : 경과 시간으로 표시할 단계를 계산해 이동합니다.
+        
+        화면 갱신이 늦어져 여러 단계가 밀렸으면 중간 단계는 건너뛰고(프레임 드롭)
+        지금 시각에 맞는 단계만 그리므로 타이머 작업이 쌓이지 않습니다.
+        """
+        self._tick_id = None
+        if not self.playing:
+            return
+        
+        elapsed = time.perf_counter() - self._play_origin_time
+        target = self._play_origin_step + int(elapsed * self.playback_speed)
+        target = min(max(target, self.current_step + 1), self.step_count - 1)
+        
+        self.show_animation_frame(target)
+        self._update_step_label()
+        
+        if self.current_step >= self.step_count - 1:
+            self.pause()
+            return
+        self._schedule_tick()
+        self._schedule_prefetch()
+        
+    def _schedule_prefetch(self):
+        """
+        핵심 : 다음 단계들을 미리 준비하는 작업을 유휴 시간에 예약합니다.
+        """
+        if self._prefetch_id is None:
+            self._prefetch_id = self.parent_frame.after_idle(self._prefetch_next)
+        
+    def _prefetch_next(self):
+        """
+        핵심 : 아직 준비되지 않은 다음 단계 하나를 준비하고, 남은 단계가 있으면 다시 예약합니다.
+        
+        한 번에 한 단계만 준비하여 입력 처리를 막지 않습니다. 행 평가 단계는 표시 내용을,
+        그 밖의 단계는 프레임을 미리 만들어 LRU 캐시에 넣습니다.
+        """
+        self._prefetch_id = None
+        if not self.playing:
+            return
+        
+        # 이미 지나간 단계의 준비 내용은 버립니다
+        for index in [i for i in self._prepared_rows if i < self.current_step - ROW_STEP_OFFSET]:
+            del self._prepared_rows[index]
+        
+        last = min(self.current_step + PREFETCH_STEPS, self.step_count - 1)
+        for step in range(self.current_step + 1, last + 1):
+            if self._is_row_step(step):
+                pair_index = step - ROW_STEP_OFFSET
+                if pair_index in self._prepared_rows:
+                    continue
+                row_a, row_b = self.cartesian_product[pair_index]
+                self._prepared_rows[pair_index] = self._prepare_row_evaluation(
+                    pair_index, row_a, row_b, self.key_a, self.key_b, self.join_type, self.cartesian_product
+                )
+            elif step not in self.animation_frames:
+                self._get_frame(step)
+            else:
+                continue
+            self._prefetch_id = self.parent_frame.after_idle(self._prefetch_next)
+            return
         
     def _create_table_display(self, parent, table_data):
         """
@@ -362,22 +674,22 @@ class AnimationManager:
             ttk.Label(parent, text="데이터가 없습니다").pack(pady=10)
             return
             
-        tree = ttk.Treeview(parent)
-        tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # 열 구성
+        # 열 구성 (큰 테이블도 보이는 행만 그리는 테이블 위젯 사용)
         columns = list(table_data[0].keys())
-        tree["columns"] = columns
-        tree.column("#0", width=0, stretch=tk.NO)
-        
-        for col in columns:
-            tree.column(col, anchor=tk.W, width=100)
-            tree.heading(col, text=col)
+        table_view = widgets.create_table_view(parent, columns, show_row_numbers=False)
+        table_view.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        # 데이터 행 추가
-        for i, row in enumerate(table_data):
+        # 데이터 행 추가 (도우미가 있으면 첫 묶음만 바로 넣고 나머지는 유휴 시간에 삽입)
+        def insert_row(item):
+            i, row = item
             values = [row.get(col, "") for col in columns]
-            tree.insert("", tk.END, text=str(i+1), values=values)
+            table_view.add_row(values, i + 1)
+        
+        if self.populator is not None:
+            self.populator.populate(table_view.frame, enumerate(table_data), insert_row)
+        else:
+            for item in enumerate(table_data):
+                insert_row(item)
             
     def _create_join_filter_visualization(self, parent, join_type, key_a, key_b):
         """
@@ -564,17 +876,8 @@ class AnimationManager:
         if join_type == "CROSS JOIN":
             return True
             
-        # 조인 키가 존재하는지 확인하기
-        a_key_exists = key_a in row_a
-        b_key_exists = key_b in row_b
-        
-        if not a_key_exists or not b_key_exists:
-            return False
-            
-        # 키가 일치하는지 확인하기
-        keys_match = row_a[key_a] == row_b[key_b]
-        
-        return keys_match
+        # 조인 키가 존재하고 정규화된 값이 일치하는지 확인하기
+        return JoinEngine.keys_match(row_a, row_b, key_a, key_b, self.normalizer)
         
     def _generate_evaluation_explanation(self, row_a, row_b, key_a, key_b, join_type, cartesian_product):
         """
@@ -593,7 +896,7 @@ class AnimationManager:
         """
         # JoinEngine에서 일치 설명 가져오기
         from join_engine import JoinEngine
-        match_explanation = JoinEngine.get_match_explanation(row_a, row_b, key_a, key_b, join_type)
+        match_explanation = JoinEngine.get_match_explanation(row_a, row_b, key_a, key_b, join_type, self.normalizer)
         
         # 조인 유형에 따른 구체적인 설명 추가하기
         if join_type == "INNER JOIN":
@@ -624,58 +927,3 @@ class AnimationManager:
             return "CROSS JOIN은 키 일치 여부에 관계없이 모든 행 조합을 포함합니다."
             
         return match_explanation
-        
-    def _count_matched_rows(self, cartesian_product, key_a, key_b, join_type):
-        """
-        핵심 : JOIN 결과에서 일치하는 행의 수를 계산합니다.
-        
-        매개변수:
-            cartesian_product: 카르테시안 곱 데이터
-            key_a: 테이블 A의 JOIN 키
-            key_b: 테이블 B의 JOIN 키
-            join_type: JOIN 유형
-            
-        반환값:
-            일치하는 행의 수
-        """
-        count = 0
-        for row_a, row_b in cartesian_product:
-            if self._evaluate_match(row_a, row_b, key_a, key_b, join_type):
-                count += 1
-        return count
-        
-    def _count_unmatched_rows(self, cartesian_product, key_a, key_b, join_type):
-        """
-        핵심 : OUTER JOIN에서 NULL 값으로 포함될 행의 수를 계산합니다.
-        
-        매개변수:
-            cartesian_product: 카르테시안 곱 데이터
-            key_a: 테이블 A의 JOIN 키
-            key_b: 테이블 B의 JOIN 키
-            join_type: JOIN 유형
-            
-        반환값:
-            외부 조인에 추가될 행의 수
-        """
-        # 일치하는 행 식별하기
-        matched_a_ids, matched_b_ids = JoinEngine.identify_matched_rows(
-            cartesian_product, key_a, key_b
-        )
-        
-        # 카르테시안 곱에서 고유한 행 추출하기
-        unique_rows_a, unique_rows_b = utils.get_unique_rows(cartesian_product)
-        
-        unmatched_count = 0
-        
-        # 조인 유형에 따라 일치하지 않는 행 계산하기
-        if join_type in ["LEFT OUTER JOIN", "FULL OUTER JOIN"]:
-            for row_a in unique_rows_a:
-                if id(row_a) not in matched_a_ids:
-                    unmatched_count += 1
-                    
-        if join_type in ["RIGHT OUTER JOIN", "FULL OUTER JOIN"]:
-            for row_b in unique_rows_b:
-                if id(row_b) not in matched_b_ids:
-                    unmatched_count += 1
-                    
-        return unmatched_count
\ No newline at end of file
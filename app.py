@@ -1,5 +1,6 @@
 import tkinter as tk
 import json
+import os
 import platform
 from typing import List, Dict, Any, Tuple
 
@@ -9,6 +10,19 @@ import join_engine
 import gui_layout
 import animation
 import widgets
+import aggregation
+import benchmark
+import background
+import explanation
+import loaders
+import table_cache
+import preview
+from key_normalization import KeyNormalizer
+from encoding import TableEncoder
+
+
+# 실시간 갱신 모드에서 입력이 멈춘 뒤 JOIN을 다시 계산하기까지 기다리는 시간 (밀리초)
+LIVE_UPDATE_DELAY_MS = 400
 
 
 class JoinVisualizerApp:
@@ -34,23 +48,69 @@ class JoinVisualizerApp:
           # 애니메이션 변수 초기화
         self.animation_manager = None
         
+        # 마지막으로 실행한 JOIN 입력 (GROUP BY 집계에서 재사용)
+        self.last_join_inputs = None
+        
+        # 진행 중인 JOIN 계산 작업 (새 실행이 시작되면 이전 작업은 취소되고 결과가 버려짐)
+        self.join_task = None
+        
+        # 취소를 요청했지만 작업 스레드가 아직 끝나지 않은 이전 JOIN 작업
+        self._cancelled_join_task = None
+        
+        # 진행 중인 알고리즘 비교 작업과 GROUP BY 집계 작업
+        self.race_task = None
+        self.aggregation_task = None
+        
+        # 테이블별로 진행 중인 파일 불러오기 작업
+        self.file_tasks = {}
+        
+        # 실시간 갱신 모드의 예약된 재계산, 마지막으로 계산을 시작한 입력,
+        # 취소된 작업이 끝나기를 기다리는 최신 입력
+        self._live_after_id = None
+        self.live_join_inputs = None
+        self._pending_live_inputs = None
+        
+        # 테이블별 마지막 입력 텍스트와 파싱 결과 (입력이 그대로면 같은 테이블 객체를 재사용하여
+        # 인덱스 캐시가 적중하도록 함)
+        self.parsed_inputs = {}
+        
+        # 테이블별로 파일에서 불러온 (파일 경로, 테이블, 캐시 키). 불러온 테이블은 텍스트 입력 대신 사용됩니다
+        self.loaded_tables = {}
+        
+        # 파싱된 테이블과 정렬 인덱스의 디스크 캐시 (앱을 다시 시작해도 큰 입력을 다시 파싱하지 않음)
+        self.table_cache = table_cache.TableCache()
+        
         # UI 컴포넌트 생성
         self.input_panel = gui_layout.InputPanel(
             self.root,
             on_join_type_change=self.on_join_type_change,
             on_run_simulation=self.run_join_simulation,
-            on_show_help=self.show_help
+            on_show_help=self.show_help,
+            on_load_file=self.load_table_file,
+            on_clear_file=self.clear_table_file,
+            on_input_change=self.schedule_live_join
         )
         
         self.output_panel = gui_layout.OutputPanel(
             self.root,
             on_prev_step=self.prev_animation_step,
-            on_next_step=self.next_animation_step
+            on_next_step=self.next_animation_step,
+            on_run_aggregation=self.run_aggregation,
+            on_run_race=self.run_algorithm_race,
+            on_cancel=self.cancel_background_tasks,
+            on_toggle_playback=self.toggle_animation_playback,
+            on_speed_change=self.set_animation_speed
         )
+        # 탭별 결과 뷰를 재사용하는 결과 표시 관리자
+        self.result_display = gui_layout.ResultDisplayManager()
+        # 많은 행을 나눠서 삽입하는 도우미 (새 시뮬레이션을 시작하면 진행 중인 삽입을 취소)
+        self.populator = widgets.IncrementalPopulator(self.root)
           # 애니메이션 관리자 초기화
         self.animation_manager = animation.AnimationManager(
             self.output_panel.get_animation_frame(),
-            self.output_panel.get_step_label()
+            self.output_panel.get_step_label(),
+            self.output_panel.set_playback_state,
+            self.populator
         )
         
         # 예제 데이터로 채우기
@@ -81,71 +141,642 @@ class JoinVisualizerApp:
         """
         join_type = self.input_panel.get_join_type()
         self.input_panel.update_explanation(join_type)
+        self.schedule_live_join()
 
     def run_join_simulation(self):
         """
         핵심 : 현재 설정으로 JOIN 시뮬레이션을 실행합니다.
         
-        사용자 입력을 처리하고, 카르테시안 곱과 JOIN 결과를 계산하며,
-        결과를 시각적으로 표시합니다.
+        입력 위젯의 값은 메인 스레드에서 읽고, 파싱과 카르테시안 곱, JOIN 계산은
+        작업 스레드에서 실행하여 큰 입력에서도 창이 멈추지 않게 합니다.
+        계산이 끝나면 show_join_results가 메인 스레드에서 결과 위젯을 만듭니다.
+        이전 실행이 아직 진행 중이면 취소하고 그 결과는 버립니다.
         """
-        try:            # 테이블 입력 파싱
-            table_a = utils.parse_table_input(self.input_panel.get_table_a_input())
-            table_b = utils.parse_table_input(self.input_panel.get_table_b_input())
-            
-            if not table_a or not table_b:
-                tk.messagebox.showerror("입력 오류", "테이블은 비어있으면 안됩니다.")
-                return
-              # 조인 키와 조인 유형 가져오기
-            key_a = self.input_panel.get_key_a()
-            key_b = self.input_panel.get_key_b()
-            join_type = self.input_panel.get_join_type()
-              # CROSS JOIN은 키가 필요하지 않음
-            if join_type != "CROSS JOIN" and (not key_a or not key_b):
-                tk.messagebox.showerror("입력 오류", "비-CROSS JOIN 작업을 위한 조인 키를 지정해야 합니다.")
+        join_inputs = self.read_join_inputs()
+        if join_inputs is None:
+            tk.messagebox.showerror("입력 오류", "비-CROSS JOIN 작업을 위한 조인 키를 지정해야 합니다.")
+            return
+        self.start_join_task(join_inputs)
+    def read_join_inputs(self):
+        """
+        핵심 : 입력 위젯에서 JOIN 계산에 필요한 값을 읽습니다. 메인 스레드에서 호출합니다.
+        
+        반환값:
+            입력 값 딕셔너리, CROSS JOIN이 아닌데 조인 키가 비어 있으면 None
+        """
+          # 조인 키와 조인 유형 가져오기
+        key_a = self.input_panel.get_key_a()
+        key_b = self.input_panel.get_key_b()
+        join_type = self.input_panel.get_join_type()
+          # CROSS JOIN은 키가 필요하지 않음
+        if join_type != "CROSS JOIN" and (not key_a or not key_b):
+            return None
+        
+        return {
+            "text_a": self.input_panel.get_table_a_input(),
+            "text_b": self.input_panel.get_table_b_input(),
+            "key_a": key_a,
+            "key_b": key_b,
+            "join_type": join_type,
+            "strategy": self.input_panel.get_join_strategy(),
+            "normalization": self.input_panel.get_key_normalization_options(),
+            "preview_threshold": self.input_panel.get_preview_threshold(),
+            "loaded_files": {side: loaded[0] for side, loaded in self.loaded_tables.items()},
+        }
+    def schedule_live_join(self):
+        """
+        핵심 : 실시간 갱신 모드에서 입력이 멈춘 뒤 LIVE_UPDATE_DELAY_MS가 지나면 JOIN을 다시 계산하도록 예약합니다.
+        
+        입력이 바뀌면 진행 중인 실시간 계산은 이미 낡은 입력에 대한 것이므로 바로 취소합니다.
+        """
+        if self._live_after_id is not None:
+            self.root.after_cancel(self._live_after_id)
+            self._live_after_id = None
+        if not self.input_panel.is_live_mode():
+            self._pending_live_inputs = None
+            return
+        if self.live_join_inputs is not None and self.join_task is not None and not self.join_task.finished:
+            self.cancel_join_task()
+            self.live_join_inputs = None
+        self._live_after_id = self.root.after(LIVE_UPDATE_DELAY_MS, self.run_live_join)
+    def run_live_join(self):
+        """
+        핵심 : 실시간 갱신 모드의 재계산입니다. 마지막 계산 이후 입력이 바뀌었을 때만 실행합니다.
+        
+        텍스트가 그대로인 테이블은 parse_table이 이전 파싱 결과를 재사용하므로 바뀐 테이블만 다시 파싱하고,
+        결과 화면은 탭별 뷰에 새 데이터만 전달합니다. 입력 테이블 창은 새로 띄우지 않습니다.
+        """
+        self._live_after_id = None
+        join_inputs = self.read_join_inputs()
+        if join_inputs is None:
+            self.output_panel.set_status("실시간 갱신: 조인 키를 입력하면 다시 계산합니다")
+            return
+        if join_inputs == self.live_join_inputs:
+            return
+        if self._cancelled_join_task is not None:
+            # 취소된 작업 스레드가 아직 돌고 있으면 스레드를 늘리지 않고 최신 입력만 기억했다가 끝나면 시작합니다
+            self._pending_live_inputs = join_inputs
+            self.output_panel.set_status("실시간 갱신: 이전 계산이 중단되면 다시 계산합니다...")
+            return
+        self.start_join_task(join_inputs, live=True)
+    def start_join_task(self, join_inputs, live=False):
+        """
+        핵심 : 읽어 둔 입력으로 JOIN 계산 작업을 작업 스레드에서 시작합니다.
+        
+        매개변수:
+            join_inputs: read_join_inputs가 반환한 입력 값
+            live: 실시간 갱신으로 시작한 계산인지 여부
+        """
+        self.live_join_inputs = join_inputs if live else None
+        self._pending_live_inputs = None
+        
+        if self.join_task is not None and not self.join_task.finished:
+            self.cancel_join_task()
+        
+        # 이전 결과 화면에 아직 삽입 중인 행이 있으면 중단
+        self.populator.cancel_all()
+        
+        task = None
+        
+        def is_current():
+            # 새 실행이 시작된 뒤 도착한 이전 실행의 메시지는 버립니다
+            return task is self.join_task
+        
+        def on_progress(text, fraction):
+            if is_current():
+                self.output_panel.set_progress(text, fraction)
+        
+        def on_done(computed):
+            if is_current():
+                self.show_join_results(computed, live)
+        
+        def on_error(error):
+            if is_current():
+                self.on_join_error(error, live)
+        
+        def on_cancelled():
+            # 취소된 작업 스레드가 끝났으면 그동안 기다린 실시간 갱신 입력으로 계산을 시작합니다
+            if task is not self._cancelled_join_task:
                 return
-              # 데카르트 곱(Cartesian product) 계산
-            cartesian_product = utils.compute_cartesian_product(table_a, table_b)
-              # JOIN 결과 필터링
-            join_result = join_engine.JoinEngine.filter_join_result(cartesian_product, key_a, key_b, join_type)
+            self._cancelled_join_task = None
+            pending_inputs = self._pending_live_inputs
+            self._pending_live_inputs = None
+            if pending_inputs is not None and self.input_panel.is_live_mode():
+                self.start_join_task(pending_inputs, live=True)
+        
+        task = background.BackgroundTask(
+            self.root,
+            lambda task: self.compute_join(task, join_inputs),
+            on_done,
+            on_error,
+            on_progress,
+            on_cancelled
+        )
+        self.join_task = task
+        self.output_panel.start_progress("실시간 갱신: JOIN 계산 시작..." if live else "JOIN 계산 시작...")
+        task.start()
+    def compute_join(self, task, join_inputs):
+        """
+        핵심 : 작업 스레드에서 테이블 파싱, 카르테시안 곱, JOIN 결과를 계산합니다.
+        
+        위젯에 접근하지 않으며, 진행 상황은 task.report로만 보냅니다.
+        
+        매개변수:
+            task: 진행 상황 보고와 취소 확인에 사용할 BackgroundTask
+            join_inputs: 메인 스레드에서 읽은 입력 값
+            
+        반환값:
+            결과 표시에 필요한 값을 담은 딕셔너리
+            
+        예외:
+            ValueError: 테이블 입력 형식이 잘못되었거나 테이블이 비어 있는 경우
+            background.TaskCancelled: 작업이 취소된 경우
+        """
+        def parse_progress(side, start, span):
+            total_chars = max(len(join_inputs[f"text_{side.lower()}"]), 1)
+            return lambda row_count, chars_read: task.report(
+                f"테이블 {side} 파싱 중: {row_count:,}개 행 ({chars_read / total_chars:.0%})",
+                start + span * chars_read / total_chars
+            )
+        
+          # 테이블 입력 파싱 (두 테이블이 열별 문자열 딕셔너리를 공유)
+        table_encoder = TableEncoder()
+        table_a = self.get_table("A", join_inputs["text_a"], table_encoder, parse_progress("A", 0.0, 0.35),
+                                 task.check_cancelled)
+        table_b = self.get_table("B", join_inputs["text_b"], table_encoder, parse_progress("B", 0.35, 0.35),
+                                 task.check_cancelled)
+        
+        if not table_a or not table_b:
+            raise ValueError("테이블은 비어있으면 안됩니다.")
+        
+        key_a = join_inputs["key_a"]
+        key_b = join_inputs["key_b"]
+        join_type = join_inputs["join_type"]
+        normalizer = KeyNormalizer(**join_inputs["normalization"])
+        strategy = join_inputs["strategy"]
+        
+          # 곱을 만들기 전에 크기를 추정하고, 기준을 넘으면 화면에는 표본만 표시
+        preview_sample = None
+        if preview.needs_preview(len(table_a), len(table_b), join_inputs["preview_threshold"]):
+            task.report(f"미리보기 표본 추출 중: 전체 {len(table_a) * len(table_b):,}개 조합", 0.7)
+            preview_sample = preview.PreviewSample(table_a, table_b)
+            if strategy == "nested_loop":
+                # 모든 조합을 훑는 중첩 루프 대신 결과가 같은 해시 JOIN으로 전체 결과를 계산합니다
+                strategy = "hash"
+          # 데카르트 곱(Cartesian product) 계산
+        task.report(f"카티션 곱 계산 중: {len(table_a) * len(table_b):,}개 조합", 0.7)
+        cartesian_product = utils.compute_cartesian_product(table_a, table_b)
+        display_product = cartesian_product if preview_sample is None else preview_sample.cartesian_product
+          # JOIN 결과 필터링 (미리보기 모드에서도 전체 테이블로 계산)
+        task.report("JOIN 결과 계산 중...", 0.8)
+        join_result = join_engine.JoinEngine.join_with_strategy(
+            strategy,
+            table_a, table_b, key_a, key_b, join_type, normalizer,
+            cartesian_product,
+            check_cancelled=task.check_cancelled
+        )
+        self.store_table_indexes(task.check_cancelled)
+        
+          # JOIN 설명 탭의 키별 일치 개수 (페이지별 설명 텍스트는 표시할 때 생성)
+        task.report("JOIN 설명 준비 중...", 0.9)
+        explanation_model = explanation.JoinExplanation(display_product, key_a, key_b, join_type, normalizer,
+                                                        task.check_cancelled)
+        
+        task.report("결과 화면 구성 중...", 0.95)
+        return {
+            "table_a": table_a,
+            "table_b": table_b,
+            "cartesian_product": cartesian_product,
+            "display_product": display_product,
+            "preview": preview_sample,
+            "join_result": join_result,
+            "explanation": explanation_model,
+            "key_a": key_a,
+            "key_b": key_b,
+            "join_type": join_type,
+            "normalizer": normalizer,
+            "strategy": strategy,
+        }
+    def show_join_results(self, computed, live=False):
+        """
+        핵심 : 작업 스레드가 계산한 JOIN 결과를 메인 스레드에서 화면에 표시합니다.
+        
+        매개변수:
+            computed: compute_join이 반환한 딕셔너리
+            live: 실시간 갱신 결과이면 True. 입력 테이블 창은 열려 있을 때만 갱신하고 탭을 전환하지 않습니다
+        """
+        try:
+            table_a = computed["table_a"]
+            table_b = computed["table_b"]
+            cartesian_product = computed["cartesian_product"]
+            join_result = computed["join_result"]
+            key_a = computed["key_a"]
+            key_b = computed["key_b"]
+            join_type = computed["join_type"]
+            normalizer = computed["normalizer"]
+            # 미리보기 모드에서는 JOIN 결과 외의 탭에 표본 테이블과 표본 조합을 표시
+            preview_sample = computed["preview"]
+            display_product = computed["display_product"]
+            display_a, display_b = (table_a, table_b) if preview_sample is None else (
+                preview_sample.table_a, preview_sample.table_b)
+            
+            self.last_join_inputs = {
+                "table_a": table_a,
+                "table_b": table_b,
+                "cartesian_product": cartesian_product,
+                "join_result": join_result,
+                "key_a": key_a,
+                "key_b": key_b,
+                "join_type": join_type,
+                "normalizer": normalizer,
+                "strategy": computed["strategy"],
+            }
               # 참조를 위한 입력 테이블 표시
-            gui_layout.ResultDisplayManager.display_tables(self.root, table_a, table_b)
+            if live:
+                self.result_display.refresh_tables(display_a, display_b, self.populator)
+            else:
+                self.result_display.display_tables(self.root, display_a, display_b, self.populator)
               # 데카르트 곱 표시
-            gui_layout.ResultDisplayManager.display_cartesian_product(
+            self.result_display.display_cartesian_product(
                 self.output_panel.get_cartesian_frame(),
-                cartesian_product,
+                display_product,
                 key_a,
                 key_b,
-                join_type
+                join_type,
+                normalizer,
+                preview_sample
             )
               # JOIN 결과 표시
-            gui_layout.ResultDisplayManager.display_join_result(
+            self.result_display.display_join_result(
                 self.output_panel.get_join_result_frame(),
                 join_result
             )
               # JOIN 설명 표시
-            gui_layout.ResultDisplayManager.display_join_explanation(
+            self.result_display.display_join_explanation(
                 self.output_panel.get_explanation_frame(),
-                cartesian_product,
+                display_product,
                 key_a,
                 key_b,
-                join_type
+                join_type,
+                normalizer,
+                computed["explanation"]
             )
               # 애니메이션 설정
             self.animation_manager.setup_step_animation(
-                cartesian_product,
+                display_product,
                 key_a,
                 key_b,
                 join_type,
-                lambda: self.output_panel.select_tab(1)  # JOIN 결과 탭을 표시하기 위한 콜백
+                lambda: self.output_panel.select_tab(1),  # JOIN 결과 탭을 표시하기 위한 콜백
+                normalizer,
+                computed["explanation"]
             )
-              # 먼저 데카르트 곱 탭으로 전환
-            self.output_panel.select_tab(0)
+            # 일치 히트맵 표시
+            self.result_display.display_heatmap(
+                self.output_panel.get_heatmap_frame(),
+                computed["explanation"],
+                self.show_pair_in_animation
+            )
+              # 먼저 데카르트 곱 탭으로 전환 (실시간 갱신에서는 보던 탭 유지)
+            if not live:
+                self.output_panel.select_tab(0)
+            summary = f"완료: 테이블 A {len(table_a):,}개 행, 테이블 B {len(table_b):,}개 행, JOIN 결과 {len(join_result):,}개 행"
+            if preview_sample is not None:
+                summary += f" | {preview_sample.describe()}"
+            self.output_panel.finish_progress(summary)
             
         except Exception as e:
-            tk.messagebox.showerror("오류", f"오류 발생: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            self.on_join_error(e, live)
+    def on_join_error(self, error, live=False):
+        """
+        핵심 : JOIN 계산 또는 결과 표시 중 발생한 오류를 알립니다.
+        
+        매개변수:
+            error: 발생한 예외
+            live: 실시간 갱신 중의 오류이면 True. 입력 중에는 잠시 잘못된 입력이 흔하므로
+                입력 오류는 대화상자 대신 상태 표시줄에만 표시합니다
+        """
+        if live and isinstance(error, ValueError):
+            self.output_panel.finish_progress(f"실시간 갱신 대기 (입력 오류: {error})")
+            return
+        self.show_task_error(error)
+    def show_task_error(self, error, failure_text="오류로 중단됨", error_title="입력 오류",
+                        input_errors=(ValueError,), error_prefix=""):
+        """
+        핵심 : 작업 중 발생한 오류를 상태 표시줄과 대화상자로 알립니다.
+        
+        input_errors에 해당하는 오류는 사용자가 고칠 수 있는 입력 문제이므로 메시지만 보여주고,
+        그 밖의 오류는 추적 정보를 함께 출력합니다.
+        
+        매개변수:
+            error: 발생한 예외
+            failure_text: 상태 표시줄에 표시할 텍스트
+            error_title: 입력 오류 대화상자의 제목
+            input_errors: 메시지만 보여줄 예외 유형 튜플
+            error_prefix: 입력 오류 메시지 앞에 붙일 텍스트 (예: 파일 이름)
+        """
+        self.output_panel.finish_progress(failure_text)
+        if isinstance(error, input_errors):
+            tk.messagebox.showerror(error_title, f"{error_prefix}{error}")
+            return
+        tk.messagebox.showerror("오류", f"오류 발생: {str(error)}")
+        import traceback
+        traceback.print_exception(type(error), error, error.__traceback__)
+    def start_background_task(self, attr, work, on_done, start_text, key=None, **error_options):
+        """
+        핵심 : 작업 스레드에서 work를 실행하는 BackgroundTask를 시작하고 self.<attr>에 보관합니다.
+        
+        attr이 딕셔너리이면 key 자리에 보관합니다. 같은 자리에서 진행 중인 이전 작업은 취소되고,
+        진행 상황과 완료/오류 콜백은 그 자리에 보관된 최신 작업일 때만 처리됩니다.
+        작업이 끝나면 자리를 비운 뒤 on_done을 호출하며, on_done에서 발생한 예외도 오류로 표시합니다.
+        
+        매개변수:
+            attr: 작업을 보관하는 속성 이름
+            work: BackgroundTask를 받아 작업 스레드에서 실행할 함수
+            on_done: 메인 스레드에서 작업 결과를 받는 콜백
+            start_text: 상태 표시줄에 표시할 시작 메시지
+            key: attr이 딕셔너리일 때 작업을 보관할 키 (선택)
+            error_options: 오류를 표시할 때 show_task_error에 전달할 키워드 인수
+        """
+        def current():
+            slot = getattr(self, attr)
+            return slot if key is None else slot.get(key)
+        
+        def release():
+            if key is None:
+                setattr(self, attr, None)
+            else:
+                getattr(self, attr).pop(key, None)
+        
+        previous_task = current()
+        if previous_task is not None and not previous_task.finished:
+            previous_task.cancel()
+        
+        task = None
+        
+        def handle_progress(text, fraction):
+            if current() is task:
+                self.output_panel.set_progress(text, fraction)
+        
+        def handle_done(result):
+            if current() is not task:
+                return
+            release()
+            try:
+                on_done(result)
+            except Exception as e:
+                self.show_task_error(e, **error_options)
+        
+        def handle_error(error):
+            if current() is task:
+                release()
+                self.show_task_error(error, **error_options)
+        
+        task = background.BackgroundTask(self.root, work, handle_done, handle_error, handle_progress)
+        if key is None:
+            setattr(self, attr, task)
+        else:
+            getattr(self, attr)[key] = task
+        self.output_panel.start_progress(start_text)
+        task.start()
+    def cancel_join_simulation(self):
+        """
+        핵심 : 진행 중인 JOIN 계산을 취소합니다. 작업 스레드가 돌려주는 결과는 버려집니다.
+        """
+        if self.join_task is not None and not self.join_task.finished:
+            self.cancel_join_task()
+            self.output_panel.finish_progress("취소됨")
+    def cancel_background_tasks(self):
+        """
+        핵심 : 상태 표시줄의 취소 버튼 동작입니다. 진행 중인 JOIN 계산, 알고리즘 비교, 집계, 파일 불러오기를 취소합니다.
+        """
+        self.cancel_join_simulation()
+        if self.race_task is not None and not self.race_task.finished:
+            self.race_task.cancel()
+            self.race_task = None
+            self.output_panel.finish_progress("취소됨")
+        if self.aggregation_task is not None and not self.aggregation_task.finished:
+            self.aggregation_task.cancel()
+            self.aggregation_task = None
+            self.output_panel.finish_progress("취소됨")
+        for side in list(self.file_tasks):
+            self.file_tasks.pop(side).cancel()
+            self.output_panel.finish_progress("취소됨")
+    def cancel_join_task(self):
+        """
+        핵심 : 진행 중인 JOIN 작업에 취소를 요청합니다.
+        
+        작업 스레드는 다음 취소 확인 지점에서 멈추므로, 끝날 때까지 취소된 작업으로 기억하여
+        실시간 갱신이 그 사이에 새 작업 스레드를 더 만들지 않도록 합니다.
+        """
+        self.join_task.cancel()
+        self._cancelled_join_task = self.join_task
+        self.join_task = None
+    def get_table(self, side, input_text, table_encoder, progress_callback=None, check_cancelled=None):
+        """
+        핵심 : JOIN에 사용할 테이블을 반환합니다. 파일을 불러온 테이블은 텍스트 입력 대신 파일 내용을 사용합니다.
+        
+        매개변수:
+            side: 테이블 구분 ("A" 또는 "B")
+            input_text: 테이블 입력 텍스트
+            table_encoder: 문자열 값을 인코딩할 TableEncoder
+            progress_callback: (파싱된 행 수, 읽은 문자 수)를 받는 진행 상황 콜백 (선택)
+            check_cancelled: 파싱 결과를 저장하기 전에 호출하여 취소되었으면 예외를 발생시키는 함수 (선택)
+            
+        반환값:
+            테이블 행 목록
+        """
+        loaded = self.loaded_tables.get(side)
+        if loaded is not None:
+            return loaded[1]
+        return self.parse_table(side, input_text, table_encoder, progress_callback, check_cancelled)
+    def store_table_indexes(self, check_cancelled=None):
+        """
+        핵심 : JOIN 중에 만들어진 정렬 인덱스를 테이블 캐시에 저장하여 다음 실행에서 재사용합니다.
+        
+        매개변수:
+            check_cancelled: 캐시에 쓰기 전에 호출하여 취소되었으면 예외를 발생시키는 함수 (선택)
+        """
+        for side in ("A", "B"):
+            entry = self.loaded_tables.get(side) or self.parsed_inputs.get(side)
+            if entry is not None and entry[2] is not None:
+                if check_cancelled is not None:
+                    check_cancelled()
+                self.table_cache.store_indexes(entry[2], entry[1])
+    def load_table_file(self, side, path):
+        """
+        핵심 : CSV, TSV, JSON Lines 또는 JSON 파일을 메모리 매핑으로 읽어 테이블로 사용합니다.
+        
+        캐시 확인과 파싱은 작업 스레드에서 실행하고, 불러온 테이블은 완료 콜백에서 메인 스레드가 등록합니다.
+        
+        매개변수:
+            side: 테이블 구분 ("A" 또는 "B")
+            path: 불러올 파일 경로
+        """
+        file_name = os.path.basename(path)
+        
+        def work(task):
+            total_bytes = max(os.path.getsize(path), 1)
+            digest = table_cache.file_digest(path)
+            table = self.table_cache.load_table(digest)
+            if table is None:
+                table = loaders.load_table_file(
+                    path, TableEncoder(),
+                    lambda row_count, bytes_read: task.report(
+                        f"테이블 {side} 파일 불러오는 중 ({file_name}): {row_count:,}개 행", bytes_read / total_bytes
+                    )
+                )
+                task.check_cancelled()
+                self.table_cache.store_table(digest, table)
+            return table, digest
+        
+        def on_done(loaded):
+            table, digest = loaded
+            self.loaded_tables[side] = (path, table, digest)
+            self.input_panel.set_loaded_file(side, f"{file_name} ({len(table):,}개 행)")
+            self.output_panel.finish_progress(f"테이블 {side} 파일 불러오기 완료: {file_name}, {len(table):,}개 행")
+            self.schedule_live_join()
+        
+        self.start_background_task(
+            "file_tasks", work, on_done, f"테이블 {side} 파일 불러오기 시작: {file_name}", key=side,
+            failure_text=f"테이블 {side} 파일 불러오기 실패", error_title="파일 오류",
+            input_errors=(OSError, ValueError), error_prefix=f"{file_name}: "
+        )
+    def clear_table_file(self, side):
+        """
+        핵심 : 불러온 테이블 파일을 해제하고 텍스트 입력을 다시 사용합니다.
+        
+        매개변수:
+            side: 테이블 구분 ("A" 또는 "B")
+        """
+        loading_task = self.file_tasks.pop(side, None)
+        if loading_task is not None:
+            loading_task.cancel()
+            self.output_panel.finish_progress(f"테이블 {side} 파일 불러오기 취소됨")
+        if self.loaded_tables.pop(side, None) is not None:
+            self.output_panel.set_status(f"테이블 {side} 파일 해제됨")
+        self.input_panel.clear_loaded_file(side)
+        self.schedule_live_join()
+    def parse_table(self, side, input_text, table_encoder, progress_callback=None, check_cancelled=None):
+        """
+        핵심 : 테이블 입력을 파싱합니다. 입력 텍스트가 이전 실행과 같으면 이전 결과를 재사용하고,
+        큰 입력은 내용 해시로 디스크 캐시를 먼저 확인합니다. 작업 스레드에서 호출되므로 위젯에 접근하지 않습니다.
+        
+        매개변수:
+            side: 테이블 구분 ("A" 또는 "B")
+            input_text: 테이블 입력 텍스트
+            table_encoder: 문자열 값을 인코딩할 TableEncoder
+            progress_callback: (파싱된 행 수, 읽은 문자 수)를 받는 진행 상황 콜백 (선택)
+            check_cancelled: 파싱 결과와 캐시를 쓰기 전에 호출하여 취소되었으면 예외를 발생시키는 함수 (선택)
+            
+        반환값:
+            파싱된 테이블 행 목록
+            
+        예외:
+            ValueError: 입력 형식이 잘못된 경우 (어느 테이블의 어느 위치인지 포함)
+        """
+        check_cancelled = check_cancelled or (lambda: None)
+        previous = self.parsed_inputs.get(side)
+        if previous is not None and previous[0] == input_text:
+            return previous[1]
+        
+        digest = None
+        if len(input_text) >= table_cache.MIN_CACHED_TEXT_LENGTH:
+            digest = table_cache.text_digest(input_text)
+            table = self.table_cache.load_table(digest)
+            if table is not None:
+                check_cancelled()
+                self.parsed_inputs[side] = (input_text, table, digest)
+                return table
+        
+        try:
+            table = utils.parse_table_input(input_text, table_encoder, progress_callback)
+        except ValueError as e:
+            raise ValueError(f"테이블 {side} 입력 오류: {e}") from e
+        # 취소된 낡은 작업이 최신 입력의 파싱 결과나 캐시를 덮어쓰지 않도록 합니다
+        check_cancelled()
+        if digest is not None and table:
+            self.table_cache.store_table(digest, table)
+        self.parsed_inputs[side] = (input_text, table, digest)
+        return table
+    def run_aggregation(self):
+        """
+        핵심 : 마지막 JOIN 결과에 대해 GROUP BY 집계를 실행합니다.
+        
+        작업 스레드에서 선택한 JOIN 알고리즘(미리보기 모드에서 바꾼 알고리즘 포함)이 전체 테이블로
+        결과 행을 하나씩 만들면 해시 집계기가 바로 접어 넣으므로, 집계를 위해 JOIN 결과 목록을 만들지 않습니다.
+        결과 탭에 보관된 JOIN 결과 목록은 페이지 이동, 정렬, 검색에 임의 접근이 필요한 결과 탭 전용이며
+        집계는 이 목록에 의존하지 않습니다.
+        """
+        if self.last_join_inputs is None:
+            tk.messagebox.showinfo("안내", "먼저 JOIN 시뮬레이션을 실행해야 합니다.")
+            return
+        
+        try:
+            aggregates = aggregation.parse_aggregate_spec(self.output_panel.get_aggregate_spec())
+        except ValueError as e:
+            tk.messagebox.showerror("집계 오류", str(e))
+            return
+        group_by = self.output_panel.get_group_by_columns()
+        
+        inputs = self.last_join_inputs
+        
+        def work(task):
+            task.report("GROUP BY 집계 중: JOIN 결과 행을 생성하는 대로 집계")
+            join_rows = join_engine.JoinEngine.iter_join_with_strategy(
+                inputs["strategy"],
+                inputs["table_a"], inputs["table_b"], inputs["key_a"], inputs["key_b"],
+                inputs["join_type"], inputs["normalizer"],
+                inputs["cartesian_product"],
+                check_cancelled=task.check_cancelled
+            )
+            aggregator = aggregation.HashAggregator(group_by, aggregates).consume(join_rows, task.check_cancelled)
+            return aggregator.result(inputs["join_type"], inputs["key_a"], inputs["key_b"])
+        
+        def on_done(aggregate_result):
+            self.result_display.display_aggregate_result(
+                self.output_panel.get_aggregate_frame(),
+                aggregate_result,
+                self.populator
+            )
+            self.output_panel.finish_progress(f"집계 완료: {aggregate_result.group_count:,}개 그룹")
+        
+        self.start_background_task("aggregation_task", work, on_done, "GROUP BY 집계 시작...", error_title="집계 오류")
+    def run_algorithm_race(self):
+        """
+        핵심 : 마지막 JOIN 입력으로 모든 JOIN 알고리즘을 실행하여 성능을 비교합니다.
+        
+        각 알고리즘의 실행 시간, 키 비교 횟수, 해시 조회 횟수, 최대 메모리를 표시하고
+        결과가 중첩 루프 결과와 같은지 검증합니다. 알고리즘마다 두 번씩 실행하므로 작업 스레드에서 실행하며,
+        입력이 미리보기 기준을 넘으면 중첩 루프는 건너뜁니다.
+        """
+        if self.last_join_inputs is None:
+            tk.messagebox.showinfo("안내", "먼저 JOIN 시뮬레이션을 실행해야 합니다.")
+            return
+        
+        inputs = self.last_join_inputs
+        pair_threshold = self.input_panel.get_preview_threshold()
+        
+        def work(task):
+            return benchmark.run_algorithm_race(
+                inputs["table_a"], inputs["table_b"], inputs["key_a"], inputs["key_b"],
+                inputs["join_type"], inputs["normalizer"], pair_threshold,
+                lambda name, completed, total: task.report(
+                    f"알고리즘 비교 중: {name} ({completed + 1}/{total})", completed / total
+                ),
+                task.check_cancelled
+            )
+        
+        def on_done(race_results):
+            self.result_display.display_algorithm_race(
+                self.output_panel.get_race_frame(),
+                race_results,
+                len(inputs["table_a"]),
+                len(inputs["table_b"])
+            )
+            self.output_panel.finish_progress(f"알고리즘 비교 완료: {len(race_results)}개 알고리즘")
+        
+        self.start_background_task("race_task", work, on_done, "알고리즘 비교 시작...", input_errors=())
     def prev_animation_step(self):
         """
         핵심 : 이전 애니메이션 단계로 이동합니다.
@@ -162,6 +793,31 @@ class JoinVisualizerApp:
         """
         if self.animation_manager:
             self.animation_manager.next_animation_step()
+    def show_pair_in_animation(self, pair_index):
+        """
+        핵심 : 히트맵에서 선택한 조합의 행 평가 단계를 애니메이션 탭에서 보여줍니다.
+        
+        매개변수:
+            pair_index: 카티션 곱에서의 조합 인덱스
+        """
+        if self.animation_manager:
+            self.animation_manager.show_pair_evaluation(pair_index)
+            self.output_panel.select_tab(3)
+    def toggle_animation_playback(self):
+        """
+        핵심 : 애니메이션 자동 재생을 시작하거나 멈춥니다.
+        """
+        if self.animation_manager:
+            self.animation_manager.toggle_playback()
+    def set_animation_speed(self, steps_per_second):
+        """
+        핵심 : 애니메이션 자동 재생 속도를 변경합니다.
+        
+        매개변수:
+            steps_per_second: 초당 진행할 단계 수
+        """
+        if self.animation_manager:
+            self.animation_manager.set_playback_speed(steps_per_second)
     def show_help(self):
         """
         핵심 : 도움말 대화상자를 표시합니다.
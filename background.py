@@ -0,0 +1,137 @@
+import queue
+import threading
+from typing import Callable, Any, Optional
+
+
+# 작업 스레드가 보낸 메시지를 메인 스레드에서 확인하는 간격 (밀리초)
+POLL_INTERVAL_MS = 50
+
+
+class TaskCancelled(Exception):
+    """
+    핵심: 백그라운드 작업이 취소되었을 때 작업 함수 안에서 발생하는 예외입니다.
+    """
+
+
+class BackgroundTask:
+    """
+    핵심: 계산 작업을 작업 스레드에서 실행하고 진행 상황과 결과를 Tk 메인 스레드로 전달합니다.
+
+    Tkinter 위젯은 메인 스레드에서만 다룰 수 있으므로 작업 스레드는 큐에 메시지만 넣고,
+    메인 스레드가 root.after로 큐를 주기적으로 확인하여 콜백을 호출합니다.
+    작업 함수는 report()로 진행 상황을 알리고, 취소되면 report()나 check_cancelled()에서
+    TaskCancelled 예외가 발생하여 작업이 중단됩니다.
+    """
+    def __init__(self, root, work: Callable[["BackgroundTask"], Any],
+                 on_done: Callable[[Any], None],
+                 on_error: Callable[[BaseException], None],
+                 on_progress: Optional[Callable[[str, Optional[float]], None]] = None,
+                 on_cancelled: Optional[Callable[[], None]] = None):
+        """
+        핵심: 백그라운드 작업을 설정합니다. start()를 호출해야 실행됩니다.
+
+        매개변수:
+            root: 루트 Tkinter 윈도우 (after 예약에 사용)
+            work: 작업 스레드에서 실행할 함수. 이 작업 객체를 인수로 받아 결과를 반환합니다
+            on_done: 작업 결과를 받는 완료 콜백 (메인 스레드에서 호출)
+            on_error: 작업 중 발생한 예외를 받는 오류 콜백 (메인 스레드에서 호출)
+            on_progress: (상태 텍스트, 0~1 진행률 또는 None)을 받는 진행 상황 콜백 (선택)
+            on_cancelled: 작업이 취소되어 끝났을 때 호출할 콜백 (선택)
+        """
+        self.root = root
+        self.work = work
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self.on_cancelled = on_cancelled
+        self._messages = queue.Queue()
+        self._cancel_event = threading.Event()
+        self._thread = None
+        self._finished = False
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        핵심: 작업 취소가 요청되었는지 여부를 반환합니다.
+        """
+        return self._cancel_event.is_set()
+
+    @property
+    def finished(self) -> bool:
+        """
+        핵심: 작업이 끝나고 마지막 콜백까지 호출되었는지 여부를 반환합니다.
+        """
+        return self._finished
+
+    def start(self):
+        """
+        핵심: 작업 스레드를 시작하고 메인 스레드에서 메시지 확인을 예약합니다.
+        """
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.root.after(POLL_INTERVAL_MS, self._poll)
+
+    def cancel(self):
+        """
+        핵심: 작업 취소를 요청합니다. 이후 작업 결과는 콜백으로 전달되지 않습니다.
+        """
+        self._cancel_event.set()
+
+    def check_cancelled(self):
+        """
+        핵심: 취소가 요청되었으면 TaskCancelled를 발생시킵니다. 작업 스레드에서 호출합니다.
+        """
+        if self._cancel_event.is_set():
+            raise TaskCancelled()
+
+    def report(self, text: str, fraction: Optional[float] = None):
+        """
+        핵심: 진행 상황을 메인 스레드로 보내고 취소 여부를 확인합니다. 작업 스레드에서 호출합니다.
+
+        매개변수:
+            text: 상태 표시줄에 표시할 텍스트
+            fraction: 0~1 사이의 진행률, 알 수 없으면 None
+        """
+        self.check_cancelled()
+        self._messages.put(("progress", (text, fraction)))
+
+    def _run(self):
+        """
+        핵심: 작업 스레드 본문입니다. 결과나 예외를 큐에 넣습니다.
+        """
+        try:
+            result = self.work(self)
+            self.check_cancelled()
+            self._messages.put(("done", result))
+        except TaskCancelled:
+            self._messages.put(("cancelled", None))
+        except BaseException as e:
+            self._messages.put(("error", e))
+
+    def _poll(self):
+        """
+        핵심: 메인 스레드에서 큐에 쌓인 메시지를 처리하고, 작업이 끝나지 않았으면 다시 예약합니다.
+        """
+        latest_progress = None
+        while True:
+            try:
+                kind, payload = self._messages.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == "progress":
+                latest_progress = payload  # 밀린 진행 상황은 마지막 것만 표시합니다
+                continue
+
+            self._finished = True
+            if kind == "done" and not self.cancelled:
+                self.on_done(payload)
+            elif kind == "error" and not self.cancelled:
+                self.on_error(payload)
+            elif self.on_cancelled is not None:
+                self.on_cancelled()
+            return
+
+        if latest_progress is not None and self.on_progress is not None and not self.cancelled:
+            self.on_progress(*latest_progress)
+        self.root.after(POLL_INTERVAL_MS, self._poll)
@@ -0,0 +1,96 @@
+import time
+import tracemalloc
+from collections import Counter
+from typing import List, Dict, Any, Tuple, Callable
+
+import preview
+import utils
+from join_engine import JoinEngine, JOIN_STRATEGIES
+from join_index import INDEX_CACHE
+from key_normalization import KeyNormalizer
+from models import JoinStats, AlgorithmRunResult
+
+
+def _canonical_rows(join_result: List[Tuple[Dict[str, Any], bool]]) -> Counter:
+    """
+    핵심: JOIN 결과를 순서와 무관하게 비교할 수 있는 다중 집합으로 변환합니다.
+    """
+    return Counter((utils.make_hashable(row), matched) for row, matched in join_result)
+
+
+def run_algorithm_race(table_a: List[Dict[str, Any]], table_b: List[Dict[str, Any]],
+                       key_a: str, key_b: str, join_type: str,
+                       normalizer: KeyNormalizer = None,
+                       pair_threshold: int = None,
+                       progress_callback: Callable[[str, int, int], None] = None,
+                       check_cancelled: Callable[[], None] = None) -> List[AlgorithmRunResult]:
+    """
+    핵심: 같은 입력에 대해 모든 JOIN 알고리즘을 실행하고 시간, 작업량, 메모리를 비교합니다.
+
+    각 알고리즘은 두 번 실행됩니다. 첫 번째 실행은 실행 시간과 작업량을 측정하고,
+    두 번째 실행은 tracemalloc으로 최대 메모리를 측정합니다(tracemalloc은 실행 시간을 왜곡하므로 분리).
+    해시 JOIN이 해시 테이블 생성을 포함하듯 인덱스 중첩 루프도 매 실행 전에 캐시된 인덱스를 지워
+    두 측정 모두 인덱스 생성을 포함하므로, 비교를 반복해도 같은 조건으로 측정됩니다.
+    모든 결과는 카티션 곱을 필터링하는 중첩 루프 결과와 같은지 검증됩니다.
+    입력이 미리보기 기준을 넘으면 모든 조합을 두 번 훑는 중첩 루프는 건너뛰고,
+    첫 번째로 실행한 알고리즘의 결과를 기준으로 검증합니다.
+
+    매개변수:
+        table_a: 테이블 A의 행 목록
+        table_b: 테이블 B의 행 목록
+        key_a: 테이블 A의 JOIN 키
+        key_b: 테이블 B의 JOIN 키
+        join_type: JOIN 유형
+        normalizer: JOIN 키 정규화 규칙 (각 실행마다 같은 규칙의 새 캐시를 사용)
+        pair_threshold: 중첩 루프를 건너뛰는 조합 수 기준 (preview.needs_preview와 같은 기준, None이면 항상 실행)
+        progress_callback: 알고리즘을 실행하기 전에 (알고리즘 이름, 완료한 알고리즘 수, 전체 알고리즘 수)를 받는 콜백 (선택)
+        check_cancelled: 알고리즘 사이와 JOIN 루프에서 호출하여 취소되었으면 예외를 발생시키는 함수 (선택)
+
+    반환값:
+        알고리즘별 AlgorithmRunResult 목록 (JOIN_STRATEGIES 순서)
+    """
+    rules = normalizer.rules if normalizer is not None else (False, False, False)
+
+    def run(strategy, stats):
+        # 이전 실행의 정규화 캐시와 인덱스가 측정에 영향을 주지 않도록 매번 새로 만듭니다
+        normalizer = KeyNormalizer(*rules)
+        INDEX_CACHE.discard(table_a, key_a, normalizer)
+        INDEX_CACHE.discard(table_b, key_b, normalizer)
+        return JoinEngine.join_with_strategy(
+            strategy, table_a, table_b, key_a, key_b, join_type, normalizer, stats=stats,
+            check_cancelled=check_cancelled
+        )
+
+    skip_nested_loop = preview.needs_preview(len(table_a), len(table_b), pair_threshold)
+
+    results = []
+    reference = None
+    for completed, (name, strategy) in enumerate(JOIN_STRATEGIES.items()):
+        if check_cancelled is not None:
+            check_cancelled()
+        if strategy == "nested_loop" and skip_nested_loop:
+            results.append(AlgorithmRunResult(name, 0.0, JoinStats(), 0, 0, False, skipped=True))
+            continue
+        if progress_callback is not None:
+            progress_callback(name, completed, len(JOIN_STRATEGIES))
+        stats = JoinStats()
+        start = time.perf_counter()
+        join_result = run(strategy, stats)
+        seconds = time.perf_counter() - start
+
+        canonical = _canonical_rows(join_result)
+        if reference is None:
+            reference = canonical  # 첫 번째로 실행한 전략(보통 중첩 루프)이 기준
+        row_count = len(join_result)
+        del join_result
+
+        tracemalloc.start()
+        try:
+            run(strategy, None)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        results.append(AlgorithmRunResult(name, seconds, stats, peak, row_count, canonical == reference))
+
+    return results
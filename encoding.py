@@ -0,0 +1,97 @@
+from typing import Dict, Any
+
+import utils
+
+
+class DictionaryEncoder:
+    """
+    핵심: 값을 작은 정수 코드로 변환하는 딕셔너리 인코더입니다.
+
+    같은 값은 항상 같은 코드를 받으므로 코드끼리 비교하면 원본 값을 비교한 것과 같고,
+    코드 목록에 원본 값을 한 번만 저장하여 반복되는 문자열이 하나의 객체를 공유합니다.
+    """
+    def __init__(self):
+        self._codes = {}  # 해시 가능한 값 -> 코드
+        self._values = []  # 코드 -> 원본 값
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def encode(self, value: Any) -> int:
+        """
+        핵심: 값에 해당하는 정수 코드를 반환하고, 처음 보는 값이면 새 코드를 할당합니다.
+
+        NaN은 자기 자신과도 같지 않으므로 매번 새 코드를 받아 다른 어떤 값과도 일치하지 않습니다.
+
+        매개변수:
+            value: 인코딩할 값
+
+        반환값:
+            값의 정수 코드
+        """
+        if utils.is_nan(value):
+            self._values.append(value)
+            return len(self._values) - 1
+        lookup = utils.make_hashable(value)
+        code = self._codes.get(lookup)
+        if code is None:
+            code = len(self._values)
+            self._codes[lookup] = code
+            self._values.append(value)
+        return code
+
+    def canonical(self, value: Any) -> Any:
+        """
+        핵심: 같은 값을 가진 객체 중 딕셔너리에 저장된 대표 객체를 반환합니다.
+
+        매개변수:
+            value: 찾을 값
+
+        반환값:
+            값과 같은 대표 객체
+        """
+        return self._values[self.encode(value)]
+
+
+class TableEncoder:
+    """
+    핵심: 열 이름별 DictionaryEncoder를 관리하며 파싱된 테이블의 문자열 값을 공유 객체로 바꿉니다.
+
+    같은 TableEncoder로 두 테이블을 인코딩하면 이름이 같은 열은 딕셔너리를 공유하므로
+    부서 코드처럼 카디널리티가 낮은 문자열 열은 고유 값 개수만큼의 문자열만 메모리에 남습니다.
+    """
+    def __init__(self):
+        self.columns = {}  # 열 이름 -> DictionaryEncoder
+
+    def encoder_for(self, column: str) -> DictionaryEncoder:
+        """
+        핵심: 열 이름에 해당하는 딕셔너리 인코더를 반환합니다. 없으면 새로 만듭니다.
+
+        매개변수:
+            column: 열 이름
+
+        반환값:
+            열의 DictionaryEncoder
+        """
+        encoder = self.columns.get(column)
+        if encoder is None:
+            encoder = DictionaryEncoder()
+            self.columns[column] = encoder
+        return encoder
+
+    def encode_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        핵심: 한 행의 문자열 값을 열별 딕셔너리의 대표 객체로 교체합니다.
+
+        스트리밍 파서가 행을 하나씩 만들 때마다 호출할 수 있습니다.
+
+        매개변수:
+            row: 파싱된 행
+
+        반환값:
+            같은 행 (제자리에서 수정됨)
+        """
+        for column, value in row.items():
+            if isinstance(value, str):
+                row[column] = self.encoder_for(column).canonical(value)
+        return row
@@ -0,0 +1,282 @@
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Tuple
+
+import utils
+from join_engine import JoinEngine
+from key_normalization import KeyNormalizer, MISSING
+
+
+# 설명 탭의 한 페이지에 표시하는 항목 수
+EXPLANATION_PAGE_SIZE = 100
+
+# 설명 항목 표시 방식
+DETAIL_MODE = "detail"  # 조합별 상세 설명
+SUMMARY_MODE = "summary"  # 행별 요약
+
+
+class JoinExplanation:
+    """
+    핵심: JOIN 설명 탭의 항목을 필요한 범위만 생성하는 설명 모델입니다.
+
+    생성 시에는 두 테이블의 키 코드를 한 번씩 읽어 키별 B 행 위치와 A 행별 일치 개수만
+    계산합니다(O(n+m)). 조합별 설명 텍스트는 화면에 표시할 페이지의 항목에 대해서만
+    만들어지므로 카티션 곱 전체(O(n·m))를 미리 순회하거나 문자열로 만들지 않습니다.
+
+    상세 모드의 항목 순서는 기존 설명과 같습니다. CROSS/INNER JOIN은 모든 조합,
+    OUTER JOIN은 일치하는 조합 뒤에 NULL로 채워지는 A 행과 B 행이 이어집니다.
+    요약 모드는 A 행마다 일치/불일치한 B 행 수를 한 항목으로 보여줍니다.
+    """
+    def __init__(self, cartesian_product, key_a: str, key_b: str, join_type: str,
+                 normalizer: KeyNormalizer = None, check_cancelled=None):
+        """
+        핵심: 카티션 곱과 JOIN 조건으로 설명 모델을 만듭니다.
+
+        매개변수:
+            cartesian_product: 카티션 곱 데이터
+            key_a: 테이블 A의 조인 키
+            key_b: 테이블 B의 조인 키
+            join_type: JOIN의 유형
+            normalizer: 조인 키 정규화 규칙 (기본값: 정규화 없음)
+            check_cancelled: 단계마다 호출하여 취소되었으면 예외를 발생시키는 함수 (선택)
+        """
+        check_cancelled = check_cancelled or (lambda: None)
+        self.key_a = key_a
+        self.key_b = key_b
+        self.join_type = join_type
+        self.normalizer = JoinEngine.resolve_normalizer(normalizer)
+        self.rows_a, self.rows_b = utils.get_unique_rows(cartesian_product)
+        check_cancelled()
+        self.texts_a, self.texts_b = self._row_texts(cartesian_product)
+        check_cancelled()
+
+        n, m = len(self.rows_a), len(self.rows_b)
+        self.include_unmatched_a = join_type in ["LEFT OUTER JOIN", "FULL OUTER JOIN"]
+        self.include_unmatched_b = join_type in ["RIGHT OUTER JOIN", "FULL OUTER JOIN"]
+
+        if join_type == "CROSS JOIN":
+            self.codes_a = []
+            self.b_positions_by_code = {}
+            self.match_counts_a = [m] * n
+            self.unmatched_a_positions = []
+            self.unmatched_b_positions = []
+        else:
+            # 키 코드별 B 행 위치 (행 순서대로) - 해시 JOIN의 빌드 단계와 같습니다
+            self.codes_a = self.normalizer.codes_for(self.rows_a, key_a)
+            check_cancelled()
+            codes_b = self.normalizer.codes_for(self.rows_b, key_b)
+            check_cancelled()
+            self.b_positions_by_code = {}
+            for position, code in enumerate(codes_b):
+                if code is not MISSING:
+                    self.b_positions_by_code.setdefault(code, []).append(position)
+
+            self.match_counts_a = [
+                len(self.b_positions_by_code.get(code, ())) if code is not MISSING else 0
+                for code in self.codes_a
+            ]
+            codes_in_a = {code for code in self.codes_a if code is not MISSING}
+            self.unmatched_a_positions = [i for i, count in enumerate(self.match_counts_a) if count == 0]
+            self.unmatched_b_positions = [
+                j for j, code in enumerate(codes_b) if code is MISSING or code not in codes_in_a
+            ]
+
+        # A 행별 누적 일치 수 (k번째 일치 조합이 어느 A 행에 속하는지 bisect로 찾기 위함)
+        self._match_prefix = list(accumulate(self.match_counts_a))
+        self.matched_pair_count = self._match_prefix[-1] if self._match_prefix else 0
+
+    @property
+    def included_count(self) -> int:
+        """
+        핵심: JOIN 결과에 포함되는 행 수를 반환합니다.
+        """
+        count = self.matched_pair_count
+        if self.include_unmatched_a:
+            count += len(self.unmatched_a_positions)
+        if self.include_unmatched_b:
+            count += len(self.unmatched_b_positions)
+        return count
+
+    def entry_count(self, mode: str = DETAIL_MODE) -> int:
+        """
+        핵심: 표시 방식별 전체 설명 항목 수를 반환합니다.
+
+        매개변수:
+            mode: DETAIL_MODE 또는 SUMMARY_MODE
+
+        반환값:
+            설명 항목 수
+        """
+        if mode == SUMMARY_MODE:
+            extra_b = len(self.unmatched_b_positions) if self.include_unmatched_b else 0
+            return len(self.rows_a) + extra_b
+
+        if self.join_type in ["CROSS JOIN", "INNER JOIN"]:
+            return len(self.rows_a) * len(self.rows_b)
+        return self.included_count
+
+    def page_count(self, mode: str = DETAIL_MODE, page_size: int = EXPLANATION_PAGE_SIZE) -> int:
+        """
+        핵심: 표시 방식별 전체 페이지 수를 반환합니다. 항목이 없어도 1페이지입니다.
+        """
+        return max((self.entry_count(mode) + page_size - 1) // page_size, 1)
+
+    def page_segments(self, page: int, mode: str = DETAIL_MODE,
+                      page_size: int = EXPLANATION_PAGE_SIZE) -> List[Tuple[str, str]]:
+        """
+        핵심: 한 페이지에 해당하는 항목들의 설명 텍스트를 생성합니다.
+
+        매개변수:
+            page: 0부터 시작하는 페이지 번호
+            mode: DETAIL_MODE 또는 SUMMARY_MODE
+            page_size: 페이지당 항목 수
+
+        반환값:
+            (텍스트 스타일 태그, 텍스트) 목록
+        """
+        start = page * page_size
+        end = min(start + page_size, self.entry_count(mode))
+        entry = self.summary_entry if mode == SUMMARY_MODE else self.detail_entry
+        segments = []
+        for index in range(start, end):
+            segments.extend(entry(index))
+        return segments
+
+    def header_segments(self) -> List[Tuple[str, str]]:
+        """
+        핵심: 설명 탭 맨 위에 표시할 제목과 전체 요약을 생성합니다.
+        """
+        n, m = len(self.rows_a), len(self.rows_b)
+        segments = [
+            ("title", f"{self.join_type}에 대한 자세한 설명\n\n"),
+            ("row_header", f"요약: {self.included_count:,}개의 고유한 행이 {self.join_type} 결과에 포함되었습니다.\n"),
+            ("explanation", f"   카티션 곱 {n * m:,}개 조합 중 키가 일치하는 조합 {self.matched_pair_count:,}개\n"),
+        ]
+        if self.include_unmatched_a:
+            segments.append(("explanation", f"   일치하지 않아 NULL로 채워지는 A 행 {len(self.unmatched_a_positions):,}개\n"))
+        if self.include_unmatched_b:
+            segments.append(("explanation", f"   일치하지 않아 NULL로 채워지는 B 행 {len(self.unmatched_b_positions):,}개\n"))
+        segments.append(("explanation", "\n"))
+        return segments
+
+    def _matched_pair(self, k: int) -> Tuple[int, int]:
+        """
+        핵심: 카티션 곱 순서로 k번째 일치 조합의 (A 행 위치, B 행 위치)를 반환합니다.
+        """
+        position_a = bisect_right(self._match_prefix, k)
+        offset = k - (self._match_prefix[position_a - 1] if position_a else 0)
+        return position_a, self.b_positions_by_code[self.codes_a[position_a]][offset]
+
+    def _row_texts(self, cartesian_product) -> Tuple[utils.RowDisplayCache, utils.RowDisplayCache]:
+        """
+        핵심: 행별 표시 문자열 캐시를 반환합니다. 곱의 행 목록을 그대로 쓰면 곱의 캐시를 공유합니다.
+        """
+        if isinstance(cartesian_product, utils.CartesianProduct):
+            if len(self.rows_a) == len(cartesian_product.table_a) and len(self.rows_b) == len(cartesian_product.table_b):
+                return cartesian_product.texts_a, cartesian_product.texts_b
+        return utils.RowDisplayCache(self.rows_a), utils.RowDisplayCache(self.rows_b)
+
+    def detail_entry(self, index: int) -> List[Tuple[str, str]]:
+        """
+        핵심: 상세 모드의 index번째 항목 설명을 생성합니다.
+        """
+        m = len(self.rows_b)
+        if self.join_type in ["CROSS JOIN", "INNER JOIN"]:
+            return self._pair_segments(*divmod(index, m))
+
+        if index < self.matched_pair_count:
+            return self._pair_segments(*self._matched_pair(index))
+        index -= self.matched_pair_count
+
+        if self.include_unmatched_a:
+            if index < len(self.unmatched_a_positions):
+                return self._unmatched_a_segments(self.texts_a[self.unmatched_a_positions[index]])
+            index -= len(self.unmatched_a_positions)
+        return self._unmatched_b_segments(self.texts_b[self.unmatched_b_positions[index]])
+
+    def _pair_segments(self, position_a: int, position_b: int) -> List[Tuple[str, str]]:
+        """
+        핵심: 카티션 곱의 한 조합에 대한 비교 설명을 생성합니다.
+        """
+        row_a = self.rows_a[position_a]
+        row_b = self.rows_b[position_b]
+        pair_number = position_a * len(self.rows_b) + position_b + 1
+        segments = [
+            ("row_header", f"행 {pair_number}: 비교 중\n"),
+            ("explanation", f"   테이블 A: {{{self.texts_a[position_a]}}}\n"),
+            ("explanation", f"   테이블 B: {{{self.texts_b[position_b]}}}\n"),
+        ]
+
+        if self.join_type == "CROSS JOIN":
+            explanation = "모든 조합이 CROSS JOIN에 포함됩니다."
+        elif self.normalizer.keys_match(row_a, self.key_a, row_b, self.key_b):
+            explanation = (f"{self.key_a}={row_a[self.key_a]}와 {self.key_b}={row_b[self.key_b]} 비교: 일치합니다! "
+                           f"키가 일치하므로 {self.join_type}에 이 행이 포함됩니다.")
+        else:
+            if self.key_a not in row_a:
+                explanation = f"행 A에 키 {self.key_a}가 없습니다. "
+            elif self.key_b not in row_b:
+                explanation = f"행 B에 키 {self.key_b}가 없습니다. "
+            else:
+                explanation = (f"{self.key_a}={row_a[self.key_a]}와 {self.key_b}={row_b[self.key_b]} 비교: 일치하지 않습니다. "
+                               f"키가 일치하지 않으므로 이 행은 INNER JOIN에서 제외됩니다.")
+            segments.append(("excluded", f"   결과: {explanation}\n"))
+            segments.append(("excluded", "   → 결과에서 행 제외\n\n"))
+            return segments
+
+        segments.append(("included", f"   결과: {explanation}\n"))
+        segments.append(("included", "   → 결과에 행 포함\n\n"))
+        return segments
+
+    @staticmethod
+    def _unmatched_a_segments(text_a: str) -> List[Tuple[str, str]]:
+        return [
+            ("row_header", "LEFT JOIN 추가 행: 일치하지 않는 A 행\n"),
+            ("explanation", f"   테이블 A: {{{text_a}}}\n"),
+            ("explanation", "   테이블 B: NULL 값\n"),
+            ("included", "   결과: 테이블 A의 행이 테이블 B의 어떤 행과도 일치하지 않아 "
+                         "NULL 값으로 채워진 B 열과 함께 결과에 포함됩니다.\n"),
+            ("included", "   → 결과에 행 포함 (NULL 채움)\n\n"),
+        ]
+
+    @staticmethod
+    def _unmatched_b_segments(text_b: str) -> List[Tuple[str, str]]:
+        return [
+            ("row_header", "RIGHT JOIN 추가 행: 일치하지 않는 B 행\n"),
+            ("explanation", "   테이블 A: NULL 값\n"),
+            ("explanation", f"   테이블 B: {{{text_b}}}\n"),
+            ("included", "   결과: 테이블 B의 행이 테이블 A의 어떤 행과도 일치하지 않아 "
+                         "NULL 값으로 채워진 A 열과 함께 결과에 포함됩니다.\n"),
+            ("included", "   → 결과에 행 포함 (NULL 채움)\n\n"),
+        ]
+
+    def summary_entry(self, index: int) -> List[Tuple[str, str]]:
+        """
+        핵심: 요약 모드의 index번째 항목(A 행 하나 또는 일치하지 않는 B 행 하나)을 생성합니다.
+        """
+        n, m = len(self.rows_a), len(self.rows_b)
+        if index >= n:
+            position_b = self.unmatched_b_positions[index - n]
+            return [
+                ("row_header", f"행 B#{position_b + 1}: {{{self.texts_b[position_b]}}}\n"),
+                ("included", "   A의 어떤 행과도 일치하지 않음 → NULL 채움으로 결과에 1개 행 포함\n\n"),
+            ]
+
+        matched = self.match_counts_a[index]
+        segments = [("row_header", f"행 A#{index + 1}: {{{self.texts_a[index]}}}\n")]
+
+        if self.join_type == "CROSS JOIN":
+            segments.append(("included", f"   B의 모든 행 {m:,}개와 결합 → 결과에 {m:,}개 행 포함\n\n"))
+            return segments
+        if self.codes_a[index] is MISSING:
+            segments.append(("excluded", f"   행 A에 키 {self.key_a}가 없어 B 행 {m:,}개와 모두 불일치\n"))
+        else:
+            segments.append(("explanation", f"   B 행 {matched:,}개와 일치, {m - matched:,}개와 불일치\n"))
+
+        if matched:
+            segments.append(("included", f"   → 결과에 {matched:,}개 행 포함\n\n"))
+        elif self.include_unmatched_a:
+            segments.append(("included", "   → 일치하는 B 행이 없어 NULL 채움으로 결과에 1개 행 포함\n\n"))
+        else:
+            segments.append(("excluded", "   → 결과에서 제외\n\n"))
+        return segments
@@ -1,8 +1,17 @@
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+from bisect import bisect_left
+from tkinter import ttk, scrolledtext, messagebox, filedialog
 from typing import Callable, Dict, Any
 import models
+import animation
+import preview
+import heatmap
+import background
+import result_index
+import utils
 import widgets
+import explanation
+from join_engine import JoinEngine, JOIN_STRATEGIES
 
 
 class InputPanel:
@@ -10,7 +19,8 @@ class InputPanel:
     핵심: 사용자 입력 설정을 위한 패널.
     테이블 입력 필드, 조인 구성 및 설명 영역을 포함합니다.
     """
-    def __init__(self, parent, on_join_type_change: Callable, on_run_simulation: Callable, on_show_help: Callable):
+    def __init__(self, parent, on_join_type_change: Callable, on_run_simulation: Callable, on_show_help: Callable,
+                 on_load_file: Callable, on_clear_file: Callable, on_input_change: Callable = None):
         """
         핵심:입력 패널을 초기화합니다.
         
@@ -19,11 +29,20 @@ class InputPanel:
             on_join_type_change: 조인 유형 변경 콜백
             on_run_simulation: 시뮬레이션 실행 콜백
             on_show_help: 도움말 표시 콜백
+            on_load_file: 테이블 파일 불러오기 콜백 (테이블 구분, 파일 경로)
+            on_clear_file: 불러온 테이블 파일 해제 콜백 (테이블 구분)
+            on_input_change: 테이블, 조인 키, 알고리즘, 정규화 입력이 바뀌거나
+                실시간 갱신을 켤 때 호출할 콜백 (선택)
         """
         self.parent = parent
         self.on_join_type_change = on_join_type_change
         self.on_run_simulation = on_run_simulation
         self.on_show_help = on_show_help
+        self.on_load_file = on_load_file
+        self.on_clear_file = on_clear_file
+        self.on_input_change = on_input_change
+        self.table_inputs = {}  # 테이블 구분 -> 텍스트 입력 위젯
+        self.file_labels = {}  # 테이블 구분 -> 불러온 파일 표시 레이블
         
         # 메인 프레임 생성
         self.frame = ttk.LabelFrame(parent, text="입력 설정")
@@ -47,6 +66,8 @@ class InputPanel:
         ttk.Label(table_a_frame, text="테이블 A 데이터 입력 (딕셔너리 리스트):").pack(anchor=tk.W, padx=5, pady=2)
         self.table_a_input = scrolledtext.ScrolledText(table_a_frame, height=10, width=40, wrap=tk.WORD)
         self.table_a_input.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.table_inputs["A"] = self.table_a_input
+        self._setup_file_controls(table_a_frame, "A")
         
         ttk.Label(table_a_frame, text="테이블 A의 조인 키:").pack(anchor=tk.W, padx=5, pady=2)
         self.key_a_input = ttk.Entry(table_a_frame)
@@ -59,15 +80,51 @@ class InputPanel:
         ttk.Label(table_b_frame, text="테이블 B 데이터 입력 (딕셔너리 리스트):").pack(anchor=tk.W, padx=5, pady=2)
         self.table_b_input = scrolledtext.ScrolledText(table_b_frame, height=10, width=40, wrap=tk.WORD)
         self.table_b_input.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.table_inputs["B"] = self.table_b_input
+        self._setup_file_controls(table_b_frame, "B")
         
         ttk.Label(table_b_frame, text="테이블 B의 조인 키:").pack(anchor=tk.W, padx=5, pady=2)
         self.key_b_input = ttk.Entry(table_b_frame)
         self.key_b_input.pack(fill=tk.X, padx=5, pady=5)
         
+        # 입력이 바뀌면 알림 (키 입력과 붙여넣기 모두 KeyRelease로 감지)
+        for widget in (self.table_a_input, self.key_a_input, self.table_b_input, self.key_b_input):
+            widget.bind("<KeyRelease>", self._notify_input_change, add="+")
+        
         # 그리드 가중치 구성
         tables_frame.columnconfigure(0, weight=1)
         tables_frame.columnconfigure(1, weight=1)
         tables_frame.rowconfigure(0, weight=1)
+    def _setup_file_controls(self, table_frame, side):
+        """
+        핵심: 테이블 입력 아래에 CSV/TSV/JSON Lines 파일 불러오기 컨트롤을 추가합니다.
+        
+        매개변수:
+            table_frame: 테이블 입력 프레임
+            side: 테이블 구분 ("A" 또는 "B")
+        """
+        file_frame = ttk.Frame(table_frame)
+        file_frame.pack(fill=tk.X, padx=5, pady=2)
+        
+        ttk.Button(file_frame, text="파일 불러오기", command=lambda: self._ask_table_file(side)).pack(side=tk.LEFT)
+        ttk.Button(file_frame, text="해제", command=lambda: self.on_clear_file(side)).pack(side=tk.LEFT, padx=5)
+        
+        self.file_labels[side] = ttk.Label(file_frame, text="불러온 파일 없음", foreground="gray")
+        self.file_labels[side].pack(side=tk.LEFT, padx=5)
+    def _ask_table_file(self, side):
+        """
+        핵심: 파일 선택 대화상자를 열고 선택된 파일 경로를 불러오기 콜백에 전달합니다.
+        """
+        path = filedialog.askopenfilename(
+            parent=self.parent,
+            title=f"테이블 {side} 파일 불러오기",
+            filetypes=[
+                ("테이블 파일", "*.csv *.tsv *.tab *.jsonl *.ndjson *.json"),
+                ("모든 파일", "*.*"),
+            ]
+        )
+        if path:
+            self.on_load_file(side, path)
     def _setup_join_config(self):
         """
         핵심: JOIN 구성 섹션을 설정합니다.
@@ -91,6 +148,43 @@ class InputPanel:
         help_button = ttk.Button(join_config_frame, text="도움말", command=self.on_show_help)
         help_button.grid(row=0, column=3, padx=5, pady=5, sticky="ew")
         
+        # JOIN 알고리즘 선택
+        ttk.Label(join_config_frame, text="JOIN 알고리즘:").grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
+        self.join_strategy = ttk.Combobox(join_config_frame, values=list(JOIN_STRATEGIES.keys()), state="readonly")
+        self.join_strategy.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
+        self.join_strategy.current(0)  # 기본은 카티션 곱을 필터링하는 중첩 루프
+        self.join_strategy.bind("<<ComboboxSelected>>", self._notify_input_change)
+        
+        # 입력을 고치면 잠시 뒤 자동으로 다시 계산하는 실시간 갱신 모드
+        self.live_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(join_config_frame, text="실시간 갱신", variable=self.live_var,
+                        command=self._notify_input_change).grid(row=1, column=2, padx=5, pady=5, sticky=tk.W)
+        
+        # 카르테시안 곱이 이 기준보다 크면 표본으로 미리보기
+        preview_frame = ttk.Frame(join_config_frame)
+        preview_frame.grid(row=1, column=3, padx=5, pady=5, sticky=tk.W)
+        ttk.Label(preview_frame, text="미리보기 기준:").pack(side=tk.LEFT)
+        self.preview_threshold = ttk.Combobox(preview_frame, values=list(preview.PREVIEW_THRESHOLD_CHOICES.keys()),
+                                              state="readonly", width=12)
+        self.preview_threshold.set(preview.DEFAULT_PREVIEW_THRESHOLD)
+        self.preview_threshold.pack(side=tk.LEFT, padx=5)
+        self.preview_threshold.bind("<<ComboboxSelected>>", self._notify_input_change)
+        
+        # 조인 키 정규화 규칙
+        normalization_frame = ttk.Frame(join_config_frame)
+        normalization_frame.grid(row=2, column=0, columnspan=4, padx=5, pady=2, sticky=tk.W)
+        
+        ttk.Label(normalization_frame, text="조인 키 정규화:").pack(side=tk.LEFT, padx=(0, 5))
+        self.coerce_numeric_var = tk.BooleanVar(value=False)
+        self.casefold_var = tk.BooleanVar(value=False)
+        self.strip_whitespace_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(normalization_frame, text="숫자 문자열을 숫자로 (\"1\" = 1)",
+                        variable=self.coerce_numeric_var, command=self._notify_input_change).pack(side=tk.LEFT, padx=5)
+        ttk.Checkbutton(normalization_frame, text="대소문자 무시",
+                        variable=self.casefold_var, command=self._notify_input_change).pack(side=tk.LEFT, padx=5)
+        ttk.Checkbutton(normalization_frame, text="앞뒤 공백 제거",
+                        variable=self.strip_whitespace_var, command=self._notify_input_change).pack(side=tk.LEFT, padx=5)
+        
         # 그리드 가중치 구성
         join_config_frame.columnconfigure(0, weight=0)  # Label - fixed size
         join_config_frame.columnconfigure(1, weight=1, minsize=300)  # Combobox - controlled expansion
@@ -125,6 +219,19 @@ class InputPanel:
         self.explanation_text.delete(1.0, tk.END)
         self.explanation_text.insert(tk.END, explanation["text"])
         self.explanation_text.config(state=tk.DISABLED)
+    def _notify_input_change(self, event=None):
+        """
+        핵심: JOIN 입력이 바뀌었음을 입력 변경 콜백에 알립니다.
+        """
+        if self.on_input_change is not None:
+            self.on_input_change()
+    
+    def is_live_mode(self):
+        """
+        핵심: 실시간 갱신 모드가 켜져 있는지 여부를 반환합니다.
+        """
+        return self.live_var.get()
+    
     def get_table_a_input(self):
         """
         핵심: 테이블 A 입력의 텍스트 내용을 가져옵니다.
@@ -155,6 +262,28 @@ class InputPanel:
         """
         return self.join_type.get()
     
+    def get_join_strategy(self):
+        """
+        핵심: 선택된 JOIN 알고리즘의 내부 전략 이름을 가져옵니다.
+        """
+        return JOIN_STRATEGIES.get(self.join_strategy.get(), "nested_loop")
+    
+    def get_preview_threshold(self):
+        """
+        핵심: 미리보기 모드로 전환하는 조합 수 기준을 가져옵니다. None이면 미리보기를 사용하지 않습니다.
+        """
+        return preview.PREVIEW_THRESHOLD_CHOICES.get(self.preview_threshold.get())
+    
+    def get_key_normalization_options(self):
+        """
+        핵심: 선택된 조인 키 정규화 규칙을 KeyNormalizer 인수 형태로 가져옵니다.
+        """
+        return {
+            "coerce_numeric": self.coerce_numeric_var.get(),
+            "casefold": self.casefold_var.get(),
+            "strip_whitespace": self.strip_whitespace_var.get(),
+        }
+    
     def set_table_a_input(self, text):
         """
         핵심: 테이블 A 입력의 텍스트 내용을 설정합니다.
@@ -169,6 +298,27 @@ class InputPanel:
         self.table_b_input.delete(1.0, tk.END)
         self.table_b_input.insert(tk.END, text)
     
+    def set_loaded_file(self, side, description):
+        """
+        핵심: 테이블에 파일이 불러와졌음을 표시하고 텍스트 입력을 비활성화합니다.
+        
+        매개변수:
+            side: 테이블 구분 ("A" 또는 "B")
+            description: 표시할 파일 이름과 행 수
+        """
+        self.file_labels[side].config(text=description, foreground="")
+        self.table_inputs[side].config(state=tk.DISABLED, background="#eeeeee")
+    
+    def clear_loaded_file(self, side):
+        """
+        핵심: 불러온 파일 표시를 지우고 텍스트 입력을 다시 활성화합니다.
+        
+        매개변수:
+            side: 테이블 구분 ("A" 또는 "B")
+        """
+        self.file_labels[side].config(text="불러온 파일 없음", foreground="gray")
+        self.table_inputs[side].config(state=tk.NORMAL, background="white")
+    
     def set_key_a(self, text):
         """
         핵심: 테이블 A의 조인 키를 설정합니다.
@@ -190,7 +340,9 @@ class OutputPanel:
     카티션 곱, JOIN 결과, JOIN 설명 및 애니메이션을 위한 탭을 포함합니다.
     """
     
-    def __init__(self, parent, on_prev_step: Callable, on_next_step: Callable):
+    def __init__(self, parent, on_prev_step: Callable, on_next_step: Callable, on_run_aggregation: Callable,
+                 on_run_race: Callable, on_cancel: Callable, on_toggle_playback: Callable,
+                 on_speed_change: Callable):
         """
         핵심: 출력 패널을 초기화합니다.
         
@@ -198,21 +350,109 @@ class OutputPanel:
             parent: 부모 위젯
             on_prev_step: 이전 애니메이션 단계를 위한 콜백
             on_next_step: 다음 애니메이션 단계를 위한 콜백
+            on_run_aggregation: GROUP BY 집계 실행을 위한 콜백
+            on_run_race: 알고리즘 비교 실행을 위한 콜백
+            on_cancel: 진행 중인 계산 취소를 위한 콜백
+            on_toggle_playback: 애니메이션 자동 재생/일시정지를 위한 콜백
+            on_speed_change: 자동 재생 속도(초당 단계 수) 변경을 위한 콜백
         """
         self.parent = parent
         self.on_prev_step = on_prev_step
         self.on_next_step = on_next_step
+        self.on_run_aggregation = on_run_aggregation
+        self.on_run_race = on_run_race
+        self.on_cancel = on_cancel
+        self.on_toggle_playback = on_toggle_playback
+        self.on_speed_change = on_speed_change
         
         # 메인 프레임 생성
         self.frame = ttk.LabelFrame(parent, text="JOIN 시각화")
         self.frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        # 상태 표시줄 (탭 아래에 고정되도록 먼저 배치)
+        self._setup_status_bar()
+        
         # 탭 생성
         self._setup_tabs()
         self._setup_cartesian_tab()
         self._setup_join_result_tab()
         self._setup_explanation_tab()
         self._setup_animation_tab()
+        self._setup_heatmap_tab()
+        self._setup_aggregate_tab()
+        self._setup_race_tab()
+    
+    def _setup_status_bar(self):
+        """
+        핵심: 파싱 및 계산 진행 상황을 표시하는 상태 표시줄을 설정합니다.
+        """
+        status_frame = ttk.Frame(self.frame)
+        status_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=(0, 5))
+        
+        self.cancel_button = ttk.Button(status_frame, text="취소", command=self.on_cancel, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.RIGHT, padx=5)
+        
+        self.progress_bar = ttk.Progressbar(status_frame, mode="determinate", maximum=1.0, length=200)
+        self.progress_bar.pack(side=tk.RIGHT, padx=5)
+        
+        self.status_label = ttk.Label(status_frame, text="준비", anchor=tk.W)
+        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+    
+    def set_status(self, text):
+        """
+        핵심: 상태 표시줄의 텍스트를 변경합니다.
+        
+        매개변수:
+            text: 표시할 상태 텍스트
+        """
+        self.status_label.config(text=text)
+    
+    def start_progress(self, text):
+        """
+        핵심: 백그라운드 계산 시작을 표시하고 취소 버튼을 활성화합니다.
+        
+        매개변수:
+            text: 표시할 상태 텍스트
+        """
+        self.set_status(text)
+        self.set_progress_fraction(0.0)
+        self.cancel_button.config(state=tk.NORMAL)
+    
+    def set_progress(self, text, fraction=None):
+        """
+        핵심: 상태 텍스트와 진행률 막대를 갱신합니다.
+        
+        매개변수:
+            text: 표시할 상태 텍스트
+            fraction: 0~1 사이의 진행률, 알 수 없으면 None (막대가 계속 움직임)
+        """
+        self.set_status(text)
+        self.set_progress_fraction(fraction)
+    
+    def set_progress_fraction(self, fraction):
+        """
+        핵심: 진행률 막대만 갱신합니다. 진행률을 알 수 없으면 움직이는 막대로 바꿉니다.
+        """
+        if fraction is None:
+            if str(self.progress_bar.cget("mode")) != "indeterminate":
+                self.progress_bar.config(mode="indeterminate")
+                self.progress_bar.start(20)
+            return
+        if str(self.progress_bar.cget("mode")) != "determinate":
+            self.progress_bar.stop()
+            self.progress_bar.config(mode="determinate")
+        self.progress_bar.config(value=fraction)
+    
+    def finish_progress(self, text):
+        """
+        핵심: 백그라운드 계산 종료를 표시하고 취소 버튼을 비활성화합니다.
+        
+        매개변수:
+            text: 표시할 상태 텍스트
+        """
+        self.set_status(text)
+        self.set_progress_fraction(0.0)
+        self.cancel_button.config(state=tk.DISABLED)
     
     def _setup_tabs(self):
         """
@@ -226,11 +466,17 @@ class OutputPanel:
         self.tab_join_result = ttk.Frame(self.output_tabs)
         self.tab_explanation = ttk.Frame(self.output_tabs)
         self.tab_animation = ttk.Frame(self.output_tabs)
+        self.tab_heatmap = ttk.Frame(self.output_tabs)
+        self.tab_aggregate = ttk.Frame(self.output_tabs)
+        self.tab_race = ttk.Frame(self.output_tabs)
         
         self.output_tabs.add(self.tab_cartesian, text="카티션 곱")
         self.output_tabs.add(self.tab_join_result, text="JOIN 결과")
         self.output_tabs.add(self.tab_explanation, text="JOIN 설명")
         self.output_tabs.add(self.tab_animation, text="단계별 애니메이션")
+        self.output_tabs.add(self.tab_heatmap, text="일치 히트맵")
+        self.output_tabs.add(self.tab_aggregate, text="GROUP BY 집계")
+        self.output_tabs.add(self.tab_race, text="알고리즘 비교")
     
     def _setup_cartesian_tab(self):
         """
@@ -277,6 +523,22 @@ class OutputPanel:
         self.next_button = ttk.Button(controls_frame, text="다음 단계 ▶", command=self.on_next_step, width=15)
         self.next_button.grid(row=0, column=2, padx=10, pady=5, sticky=tk.E)
         
+        # 자동 재생 컨트롤 (재생/일시정지, 속도)
+        playback_frame = ttk.Frame(controls_frame)
+        playback_frame.grid(row=1, column=0, columnspan=3, pady=(0, 5))
+        
+        self.play_button = ttk.Button(playback_frame, text="▶ 재생", command=self.on_toggle_playback, width=12)
+        self.play_button.pack(side=tk.LEFT, padx=5)
+        
+        ttk.Label(playback_frame, text="속도 (단계/초):").pack(side=tk.LEFT, padx=(10, 2))
+        self.speed_var = tk.StringVar(value=str(animation.DEFAULT_PLAYBACK_SPEED))
+        speed_combo = ttk.Combobox(
+            playback_frame, textvariable=self.speed_var, state="readonly", width=5,
+            values=[str(speed) for speed in animation.PLAYBACK_SPEEDS]
+        )
+        speed_combo.pack(side=tk.LEFT)
+        speed_combo.bind("<<ComboboxSelected>>", lambda event: self.on_speed_change(int(self.speed_var.get())))
+        
         # 그리드 열 가중치 설정 - 가운데 라벨이 더 많은 공간을 차지하도록 설정
         controls_frame.columnconfigure(0, weight=1)  # 왼쪽 버튼
         controls_frame.columnconfigure(1, weight=10)  # 중앙 라벨 (더 많은 비중)
@@ -323,6 +585,72 @@ class OutputPanel:
         # 바인딩 (Windows용)
         canvas.bind_all("<MouseWheel>", on_mousewheel)
     
+    def set_playback_state(self, playing):
+        """
+        핵심: 자동 재생 상태에 맞게 재생 버튼의 텍스트를 바꿉니다.
+        
+        매개변수:
+            playing: 재생 중 여부
+        """
+        self.play_button.config(text="⏸ 일시정지" if playing else "▶ 재생")
+    
+    def _setup_heatmap_tab(self):
+        """
+        핵심: A 행 × B 행 일치 행렬을 보여주는 히트맵 탭을 설정합니다.
+        """
+        ttk.Label(self.tab_heatmap, text="""
+        가로는 테이블 B의 행, 세로는 테이블 A의 행입니다. 진한 녹색일수록 해당 영역의 조합이 많이 일치합니다.
+        블록 단위로 축소된 그림에서 클릭하면 그 위치로 확대되고, 조합 단위에서 클릭하면 단계별 애니메이션에서 해당 조합을 보여줍니다.
+        """, wraplength=800, justify=tk.LEFT).pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
+        
+        self.heatmap_frame = ttk.Frame(self.tab_heatmap)
+        self.heatmap_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+    
+    def _setup_aggregate_tab(self):
+        """
+        핵심: GROUP BY 집계 탭을 설정합니다.
+        """
+        controls_frame = ttk.Frame(self.tab_aggregate)
+        controls_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
+        
+        ttk.Label(controls_frame, text="GROUP BY 열 (쉼표로 구분):").grid(row=0, column=0, padx=5, pady=5, sticky=tk.W)
+        self.group_by_input = ttk.Entry(controls_frame)
+        self.group_by_input.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
+        self.group_by_input.insert(0, "B_department")
+        
+        ttk.Label(controls_frame, text="집계 식:").grid(row=0, column=2, padx=5, pady=5, sticky=tk.W)
+        self.aggregate_spec_input = ttk.Entry(controls_frame)
+        self.aggregate_spec_input.grid(row=0, column=3, padx=5, pady=5, sticky="ew")
+        self.aggregate_spec_input.insert(0, "COUNT(*)")
+        
+        run_button = ttk.Button(controls_frame, text="집계 실행", command=self.on_run_aggregation, width=15)
+        run_button.grid(row=0, column=4, padx=5, pady=5)
+        
+        ttk.Label(controls_frame, text="지원 함수: COUNT(*), COUNT(열), SUM(열), AVG(열), MIN(열), MAX(열)").grid(
+            row=1, column=0, columnspan=5, padx=5, pady=2, sticky=tk.W)
+        
+        controls_frame.columnconfigure(1, weight=1)
+        controls_frame.columnconfigure(3, weight=1)
+        
+        # 집계 결과가 표시될 프레임
+        self.aggregate_frame = ttk.Frame(self.tab_aggregate)
+        self.aggregate_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+    
+    def _setup_race_tab(self):
+        """
+        핵심: JOIN 알고리즘 비교 탭을 설정합니다.
+        """
+        controls_frame = ttk.Frame(self.tab_race)
+        controls_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
+        
+        ttk.Label(controls_frame, text="마지막 JOIN 입력으로 모든 JOIN 알고리즘을 실행하여 성능을 비교합니다.",
+                  wraplength=800, justify=tk.LEFT).pack(side=tk.LEFT, padx=5)
+        ttk.Button(controls_frame, text="비교 실행", command=self.on_run_race, width=15).pack(side=tk.RIGHT, padx=5)
+        
+        # 비교 결과가 표시될 프레임
+        self.race_frame = ttk.Frame(self.tab_race)
+        self.race_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+    
     def select_tab(self, index):
         """
         핵심: 특정 탭을 선택합니다.
@@ -361,6 +689,36 @@ class OutputPanel:
         핵심: 애니메이션 단계 레이블을 가져옵니다.
         """
         return self.step_label
+    
+    def get_heatmap_frame(self):
+        """
+        핵심: 일치 히트맵을 위한 프레임을 가져옵니다.
+        """
+        return self.heatmap_frame
+    
+    def get_aggregate_frame(self):
+        """
+        핵심: GROUP BY 집계 결과를 위한 프레임을 가져옵니다.
+        """
+        return self.aggregate_frame
+    
+    def get_race_frame(self):
+        """
+        핵심: 알고리즘 비교 결과를 위한 프레임을 가져옵니다.
+        """
+        return self.race_frame
+    
+    def get_group_by_columns(self):
+        """
+        핵심: 입력된 GROUP BY 열 이름 목록을 가져옵니다.
+        """
+        return [col.strip() for col in self.group_by_input.get().split(",") if col.strip()]
+    
+    def get_aggregate_spec(self):
+        """
+        핵심: 입력된 집계 식 문자열을 가져옵니다.
+        """
+        return self.aggregate_spec_input.get().strip()
 
 
 class HelpDialog:
@@ -387,363 +745,802 @@ class HelpDialog:
         text_widget.configure(state="disabled")
 
 
-class ResultDisplayManager:
+class CartesianProductView:
     """
-    핵심: 출력 패널에 결과 표시를 관리합니다.
+    핵심: 카티션 곱 탭의 가상 그리드와 툴팁을 한 번만 만들고 실행마다 데이터만 바꾸는 뷰.
     """
     
-    @staticmethod
-    def display_cartesian_product(parent_frame, cartesian_product, key_a, key_b, join_type):
+    def __init__(self, parent_frame):
         """
-        핵심: 일치하는 행에 대한 강조 표시와 함께 카티션 곱을 그리드에 표시합니다.
+        핵심: 카티션 곱 뷰의 위젯을 생성합니다.
         
         매개변수:
             parent_frame: 표시할 프레임
+        """
+        self.header_label = ttk.Label(parent_frame, font=("TkDefaultFont", 12, "bold"))
+        self.header_label.pack(anchor=tk.W, padx=5, pady=10)
+        
+        self.grid = widgets.VirtualGrid(
+            parent_frame,
+            columns=[("행 A", 200, 1), ("행 B", 200, 1), ("일치 여부", 70, 0)],
+            row_provider=lambda index: ((), None)
+        )
+        self.grid.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # 뷰 전체가 툴팁 창 하나를 공유하고, 일치 여부 열에 마우스를 올린 조합의 설명만 생성
+        self.tooltip = widgets.SharedTooltip(self.grid.canvas)
+        self.explanation_for = None
+        self.cartesian_product = None
+        self.grid.on_hover = self._on_hover
+        self.grid.on_leave = self.tooltip.hide
+    
+    def show(self, cartesian_product, key_a, key_b, join_type, normalizer=None, preview_sample=None):
+        """
+        핵심: 새 카티션 곱을 그리드에 연결합니다.
+        
+        매개변수:
             cartesian_product: 카티션 곱 데이터
             key_a: 테이블 A의 조인 키
             key_b: 테이블 B의 조인 키
             join_type: JOIN의 유형
+            normalizer: 조인 키 정규화 규칙 (기본값: 정규화 없음)
+            preview_sample: 미리보기 모드이면 표본 정보(preview.PreviewSample), 아니면 None
         """
-        # 이전 내용 지우기
-        for widget in parent_frame.winfo_children():
-            widget.destroy()
-            
-        # 스크롤 가능한 프레임 생성
-        scrollable = widgets.ScrollableFrame(parent_frame)
-        content_frame = scrollable.get_frame()
-        
-        # 헤더 추가
-        ttk.Label(content_frame, text="카르테시안 곱 시각화", font=("TkDefaultFont", 12, "bold")).grid(
-            row=0, column=0, columnspan=3, pady=10, sticky=tk.W)
-        
-        # 열 헤더
-        ttk.Label(content_frame, text="행 A", font=("TkDefaultFont", 10, "bold")).grid(
-            row=1, column=0, padx=10, pady=5, sticky=tk.W)
-        ttk.Label(content_frame, text="행 B", font=("TkDefaultFont", 10, "bold")).grid(
-            row=1, column=1, padx=10, pady=5, sticky=tk.W)
-        ttk.Label(content_frame, text="일치 여부", font=("TkDefaultFont", 10, "bold")).grid(
-            row=1, column=2, padx=10, pady=5, sticky=tk.W)
-        
-        # 카티션 곱에서 각 쌍 표시
-        for i, (row_a, row_b) in enumerate(cartesian_product):
-            # 행 데이터 형식화
-            row_a_str = ", ".join([f"{k}: {v}" for k, v in row_a.items()])
-            row_b_str = ", ".join([f"{k}: {v}" for k, v in row_b.items()])
-            
-            # 이 행이 JOIN 결과에 포함되는지 확인
-            matched = False
-            match_explanation = ""
-            
-            if join_type == "CROSS JOIN":
-                matched = True
-                match_explanation = "모든 행이 CROSS JOIN에 포함됩니다. 키에 관계없이 모든 행이 포함됩니다."
-            elif key_a in row_a and key_b in row_b:
-                if row_a[key_a] == row_b[key_b]:
-                    matched = True
-                    match_explanation = f"키가 일치합니다: {key_a}={row_a[key_a]}는 {key_b}={row_b[key_b]}와 같습니다."
-                else:
-                    match_explanation = f"키가 일치하지 않습니다: {key_a}={row_a[key_a]}는 {key_b}={row_b[key_b]}와 같지 않습니다."
-            else:
-                if key_a not in row_a:
-                    match_explanation = f"행 A에 키 {key_a}가 없습니다."
-                elif key_b not in row_b:
-                    match_explanation = f"행 B에 키 {key_b}가 없습니다."
-            
-            # Create frame for this row and set background color
-            row_frame = ttk.Frame(content_frame)
-            row_frame.grid(row=i+2, column=0, columnspan=3, padx=5, pady=2, sticky=tk.W+tk.E)
-            
-            # 일치하는 행에 대한 특정 스타일 사용
-            bg_color = "#e6ffe6" if matched else "#fff0f0"  # 일치하는 경우 연한 녹색, 일치하지 않는 경우 연한 빨강색
-            
-            # 배경색이 있는 레이블 사용
-            cell_a = tk.Label(row_frame, text=row_a_str, anchor=tk.W, bg=bg_color)
-            cell_a.grid(row=0, column=0, padx=5, pady=2, sticky=tk.W)
-            
-            cell_b = tk.Label(row_frame, text=row_b_str, anchor=tk.W, bg=bg_color)
-            cell_b.grid(row=0, column=1, padx=5, pady=2, sticky=tk.W)
-            
-            # 일치 상태에 대한 체크/십자 표시 사용
-            match_text = "✅" if matched else "❌"
-            cell_match = tk.Label(row_frame, text=match_text, anchor=tk.W, bg=bg_color, font=("TkDefaultFont", 10, "bold"))
-            cell_match.grid(row=0, column=2, padx=5, pady=2, sticky=tk.W)
-            
-            # 일치 설명에 대한 툴팁 추가
-            widgets.TooltipManager.create_tooltip(cell_match, match_explanation)
-            
-            # 그리드 구성
-            row_frame.columnconfigure(0, weight=1, minsize=200)
-            row_frame.columnconfigure(1, weight=1, minsize=200)
-            row_frame.columnconfigure(2, weight=0, minsize=50)
+        if preview_sample is None:
+            self.header_label.config(text=f"카르테시안 곱 시각화 ({len(cartesian_product):,}개 조합)")
+        else:
+            self.header_label.config(text=f"카르테시안 곱 시각화 - {preview_sample.describe()}")
+        
+        def row_provider(index):
+            # 보이는 행만 요청되므로 텍스트와 일치 여부를 그때그때 계산합니다
+            row_a, row_b = cartesian_product[index]
+            # 행 문자열은 행마다 한 번만 형식화된 것을 다른 탭과 함께 사용합니다
+            row_a_str, row_b_str = utils.pair_display_texts(cartesian_product, index)
+            matched = join_type == "CROSS JOIN" or JoinEngine.keys_match(row_a, row_b, key_a, key_b, normalizer)
+            # 일치하는 경우 연한 녹색, 일치하지 않는 경우 연한 빨강색
+            bg_color = "#e6ffe6" if matched else "#fff0f0"
+            return (row_a_str, row_b_str, "✅" if matched else "❌"), bg_color
+        
+        def explanation_for(index):
+            row_a, row_b = cartesian_product[index]
+            return JoinEngine.get_match_explanation(row_a, row_b, key_a, key_b, join_type, normalizer)
+        
+        self.cartesian_product = cartesian_product
+        self.explanation_for = explanation_for
+        self.tooltip.current_key = None  # 이전 실행의 조합 번호로 툴팁을 재사용하지 않도록 합니다
+        self.grid.set_data(row_provider, len(cartesian_product))
     
-    @staticmethod
-    def display_join_result(parent_frame, join_result):
+    def _on_hover(self, index, column, event):
+        if column in (0, 1) and isinstance(self.cartesian_product, utils.CartesianProduct):
+            # 잘려서 표시된 행 위에서는 행 전체 문자열을 툴팁으로 보여줍니다
+            position = self.cartesian_product.pair_positions(index)[column]
+            texts = self.cartesian_product.texts_a if column == 0 else self.cartesian_product.texts_b
+            if texts.is_truncated(position):
+                self.tooltip.show_for((index, column), lambda: texts.full_text(position), event.x_root, event.y_root)
+                return
+        if column != 2 or self.explanation_for is None:
+            self.tooltip.hide()
+            return
+        explanation_for = self.explanation_for
+        self.tooltip.show_for(index, lambda: explanation_for(index), event.x_root, event.y_root)
+
+
+class JoinResultView:
+    """
+    핵심: JOIN 결과 탭의 페이지 방식 트리뷰와 컨트롤을 한 번만 만들고 실행마다 데이터만 바꾸는 뷰.
+    
+    검색은 결과마다 한 번 만드는 열별 역색인(result_index.ResultSearchIndex)으로 수행하며,
+    색인은 결과가 표시된 뒤 작업 스레드에서 만들어집니다. 검색어 입력은 디바운스되고,
+    일치하는 행 인덱스 목록만 가상 트리뷰에 연결합니다.
+    열 머리글을 클릭하면 오름차순, 내림차순, 원래 순서 순으로 정렬이 바뀝니다.
+    열별 정렬 순열(result_index.ResultSortOrder)은 처음 정렬할 때 작업 스레드에서 한 번만
+    계산되므로, 이후 정렬과 방향 전환은 순열 조회와 보이는 행의 재표시뿐입니다.
+    """
+    
+    ALL_COLUMNS_LABEL = "(모든 열)"
+    
+    def __init__(self, parent_frame):
         """
-        핵심: JOIN 결과를 테이블에 표시합니다.
+        핵심: JOIN 결과 뷰의 위젯을 생성합니다.
         
         매개변수:
             parent_frame: 표시할 프레임
+        """
+        self.parent_frame = parent_frame
+        self.join_result = []
+        self.columns = []
+        self.view_rows = None  # 검색 필터가 적용된 결과 행 인덱스 목록 (None이면 전체)
+        self.display_rows = None  # 정렬까지 적용해 화면에 표시하는 순서 (None이면 원래 순서 전체)
+        self.display_ranks = None  # 정렬된 검색 결과의 표시 순서별 정렬 순위 (행 번호 이동의 bisect용)
+        self.search_index = None
+        self.sort_order = None
+        self.sort_column = None
+        self.sort_descending = False
+        self._index_task = None
+        self._sort_task = None
+        self._search_after_id = None
+        self.empty_label = ttk.Label(parent_frame, text="표시할 결과가 없습니다")
+        
+        self.content = ttk.Frame(parent_frame)
+        
+        # 검색 컨트롤
+        search_frame = ttk.Frame(self.content)
+        search_frame.pack(fill=tk.X, padx=5, pady=(5, 0))
+        
+        ttk.Label(search_frame, text="검색:").pack(side=tk.LEFT, padx=5)
+        self.search_column_var = tk.StringVar(value=self.ALL_COLUMNS_LABEL)
+        self.search_column_combo = ttk.Combobox(search_frame, textvariable=self.search_column_var,
+                                                state="readonly", width=18)
+        self.search_column_combo.pack(side=tk.LEFT, padx=5)
+        self.search_column_combo.bind("<<ComboboxSelected>>", lambda event: self.apply_search())
+        
+        self.search_input = ttk.Entry(search_frame, width=30)
+        self.search_input.pack(side=tk.LEFT, padx=5)
+        self.search_input.bind("<KeyRelease>", self._schedule_search)
+        self.search_input.bind("<Return>", lambda event: self.apply_search())
+        
+        self.exact_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(search_frame, text="값 전체 일치", variable=self.exact_var,
+                        command=self.apply_search).pack(side=tk.LEFT, padx=5)
+        
+        self.search_status = ttk.Label(search_frame)
+        self.search_status.pack(side=tk.LEFT, padx=10)
+        
+        # 행 번호로 이동하는 컨트롤
+        jump_frame = ttk.Frame(self.content)
+        jump_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        ttk.Label(jump_frame, text="행 번호로 이동:").pack(side=tk.LEFT, padx=5)
+        self.jump_input = ttk.Entry(jump_frame, width=12)
+        self.jump_input.pack(side=tk.LEFT, padx=5)
+        self.jump_input.bind("<Return>", self._jump_to_row)
+        ttk.Button(jump_frame, text="이동", command=self._jump_to_row).pack(side=tk.LEFT, padx=5)
+        
+        # 요약 정보 (트리뷰 아래에 고정되도록 먼저 배치)
+        self.summary_label = ttk.Label(self.content)
+        self.summary_label.pack(side=tk.BOTTOM, anchor=tk.W, padx=10, pady=10)
+        
+        # 보이는 행만큼의 항목만 유지하는 트리뷰 생성
+        self.tree_view = widgets.PagedTreeView(self.content, [], self._row_provider,
+                                               on_heading_click=self._on_heading_click)
+        self.tree_view.pack(fill=tk.BOTH, expand=True)
+    
+    def show(self, join_result):
+        """
+        핵심: 새 JOIN 결과를 트리뷰에 연결하고 검색 색인 생성을 시작합니다.
+        
+        매개변수:
             join_result: JOIN 결과 데이터
         """
-        # 이전 내용 지우기
-        for widget in parent_frame.winfo_children():
-            widget.destroy()
+        for task in (self._index_task, self._sort_task):
+            if task is not None:
+                task.cancel()
+        self._index_task = None
+        self._sort_task = None
+        self.join_result = join_result
+        self.view_rows = None
+        self.display_rows = None
+        self.display_ranks = None
+        self.search_index = None
+        self.sort_order = None
+        self.search_status.config(text="")
         
         if not join_result:
-            ttk.Label(parent_frame, text="표시할 결과가 없습니다").pack(pady=20)
+            self.content.pack_forget()
+            self.empty_label.pack(pady=20)
             return
+        self.empty_label.pack_forget()
+        self.content.pack(fill=tk.BOTH, expand=True)
+        
+        # 열 정의
+        self.columns = list(join_result[0][0].keys())
+        self.search_column_combo.config(values=[self.ALL_COLUMNS_LABEL] + self.columns)
+        if self.search_column_var.get() not in self.columns:
+            self.search_column_var.set(self.ALL_COLUMNS_LABEL)
+        
+        # 같은 열이 있으면 이전 실행의 정렬 기준을 유지합니다
+        self.sort_order = result_index.ResultSortOrder(join_result)
+        if self.sort_column not in self.columns:
+            self.sort_column = None
+            self.sort_descending = False
+        self.tree_view.set_data(self.columns, self._row_provider, len(join_result))
+        self.tree_view.set_sort_indicator(self.sort_column, self.sort_descending)
+        self._apply_sort()
         
-        # 테이블 표시를 위한 트리뷰 생성
-        tree_frame = ttk.Frame(parent_frame)
-        tree_frame.pack(fill=tk.BOTH, expand=True)
+        matched_count = sum(1 for _, matched in join_result if matched)
+        unmatched_count = len(join_result) - matched_count
+        self.summary_label.config(
+            text=f"결과 총 {len(join_result):,}개 행 "
+                 f"({matched_count:,}개 직접 일치, {unmatched_count:,}개 OUTER JOIN으로 추가)"
+        )
+        
+        # 결과마다 한 번 열별 색인을 작업 스레드에서 만듭니다
+        search_index = result_index.ResultSearchIndex(join_result, self.columns)
+        self.search_index = search_index
+        self._index_task = background.BackgroundTask(
+            self.parent_frame,
+            lambda task: search_index.build(task.check_cancelled),
+            on_done=lambda _: self._on_index_ready(search_index),
+            on_error=lambda error: self.search_status.config(text=f"색인 생성 실패: {error}")
+        )
+        self._index_task.start()
+        if self.search_input.get().strip():
+            self.apply_search()
+    
+    def _row_provider(self, position):
+        # 화면에 보이는 행만 요청되므로 값 목록을 그때그때 만듭니다
+        index = self.display_rows[position] if self.display_rows is not None else position
+        row, matched = self.join_result[index]
+        values = [row.get(col, "") for col in self.columns]
+        return str(index + 1), values, ("matched",) if matched else ("unmatched",)
+    
+    def _schedule_search(self, event=None):
+        """
+        핵심: 입력이 멈춘 뒤 SEARCH_DEBOUNCE_MS가 지나면 검색하도록 예약합니다.
+        """
+        if event is not None and event.keysym == "Return":
+            return
+        if self._search_after_id is not None:
+            self.parent_frame.after_cancel(self._search_after_id)
+        self._search_after_id = self.parent_frame.after(result_index.SEARCH_DEBOUNCE_MS, self.apply_search)
+    
+    def apply_search(self):
+        """
+        핵심: 현재 검색 조건으로 결과를 거르고 트리뷰에 일치하는 행만 연결합니다.
         
-        # 수평 스크롤바 생성
-        h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL)
-        h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        색인이 아직 만들어지는 중이면 색인이 준비된 뒤에 검색합니다.
+        """
+        if self._search_after_id is not None:
+            self.parent_frame.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        if self.search_index is None:
+            return
         
-        # 수직 스크롤바 생성
-        v_scrollbar = ttk.Scrollbar(tree_frame)
-        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        query = self.search_input.get()
+        column = self.search_column_var.get()
+        column = None if column == self.ALL_COLUMNS_LABEL else column
         
-        # 트리뷰 생성
-        tree = ttk.Treeview(tree_frame, xscrollcommand=h_scrollbar.set, yscrollcommand=v_scrollbar.set)
-        tree.pack(fill=tk.BOTH, expand=True)
+        if query.strip() and not self.search_index.is_indexed(column):
+            self.search_status.config(text="검색 색인을 만드는 중...")
+            return
         
-        # 스크롤바 구성
-        h_scrollbar.config(command=tree.xview)
-        v_scrollbar.config(command=tree.yview)
+        self.view_rows = self.search_index.search(query, column, self.exact_var.get())
+        self._update_display()
+    
+    def _on_heading_click(self, column):
+        """
+        핵심: 머리글을 클릭한 열로 오름차순 -> 내림차순 -> 원래 순서 순으로 정렬을 바꿉니다.
+        """
+        if self.sort_order is None:
+            return
+        if column != self.sort_column:
+            self.sort_column, self.sort_descending = column, False
+        elif not self.sort_descending:
+            self.sort_descending = True
+        else:
+            self.sort_column, self.sort_descending = None, False
+        self.tree_view.set_sort_indicator(self.sort_column, self.sort_descending)
+        self._apply_sort()
+    
+    def _apply_sort(self):
+        """
+        핵심: 현재 정렬 기준을 적용합니다. 순열이 없으면 작업 스레드에서 계산한 뒤 적용합니다.
+        """
+        if self._sort_task is not None:
+            self._sort_task.cancel()
+            self._sort_task = None
+        
+        column = self.sort_column
+        sort_order = self.sort_order
+        if column is not None and not sort_order.is_cached(column):
+            self._sort_task = background.BackgroundTask(
+                self.parent_frame,
+                lambda task: sort_order.compute(column, task.check_cancelled),
+                on_done=lambda _: self._on_sort_ready(sort_order),
+                on_error=lambda error: self.search_status.config(text=f"정렬 실패: {error}")
+            )
+            self._sort_task.start()
+        self._update_display()
+    
+    def _on_sort_ready(self, sort_order):
+        if sort_order is self.sort_order:
+            self._sort_task = None
+            self._update_display()
+    
+    def _update_display(self):
+        """
+        핵심: 검색 필터와 정렬 순열을 합쳐 표시 순서를 정하고 맨 위부터 다시 그립니다.
         
-        # 열 정의
-        columns = list(join_result[0][0].keys()) if join_result else []
-        tree["columns"] = columns
-        tree.column("#0", width=40, stretch=tk.NO)
-        tree.heading("#0", text="행")
-        
-        for col in columns:
-            tree.column(col, anchor=tk.W, width=100)
-            tree.heading(col, text=col)
-        
-        # 트리뷰에 데이터 추가
-        for i, (row, matched) in enumerate(join_result):
-            values = [row.get(col, "") for col in columns]
-            item_id = tree.insert("", tk.END, text=str(i+1), values=values)
-            
-            # 색상 지정
-            if not matched:
-                tree.tag_configure("unmatched", background="#fff0f0")  # 일치하지 않는 행은 연한 빨강색
-                tree.item(item_id, tags=("unmatched",))
+        정렬된 전체 결과는 캐시된 순열을 그대로 쓰고, 검색 결과는 행별 순위로만 정렬합니다.
+        트리뷰는 보이는 행만 다시 읽습니다.
+        """
+        rows = self.view_rows
+        column = self.sort_column
+        sorting = column is not None and not self.sort_order.is_cached(column)
+        self.display_ranks = None
+        if column is not None and not sorting:
+            if rows is None:
+                rows = self.sort_order.permutation(column, self.sort_descending)
             else:
-                tree.tag_configure("matched", background="#e6ffe6")  # 일치하는 행은 연한 녹색
-                tree.item(item_id, tags=("matched",))
+                rows = self.sort_order.order_rows(rows, column, self.sort_descending)
+                ranks = self.sort_order.ranks(column, self.sort_descending)
+                self.display_ranks = [ranks[index] for index in rows]
+        self.display_rows = rows
+        
+        status = "" if self.view_rows is None else f"{len(self.view_rows):,}개 행 일치"
+        if sorting:
+            status = f"{status}  정렬하는 중..." if status else "정렬하는 중..."
+        self.search_status.config(text=status)
+        row_count = len(self.join_result) if rows is None else len(rows)
+        self.tree_view.set_data(self.columns, self._row_provider, row_count)
+    
+    def _on_index_ready(self, search_index):
+        self._index_task = None
+        if search_index is self.search_index and self.search_input.get().strip():
+            self.apply_search()
+    
+    def _jump_to_row(self, event=None):
+        try:
+            row_number = int(self.jump_input.get().strip().replace(",", ""))
+        except ValueError:
+            return
+        if not self.join_result:
+            return
+        row_index = min(max(row_number, 1), len(self.join_result)) - 1
+        if self.display_rows is None:
+            self.tree_view.jump_to_row(row_index)
+        elif self.view_rows is None:
+            # 정렬된 전체 결과에서는 해당 행의 순위가 곧 표시 위치입니다
+            self.tree_view.jump_to_row(self.sort_order.ranks(self.sort_column, self.sort_descending)[row_index])
+        elif self.view_rows:
+            # 검색 결과 중 해당 행 번호 이후의 첫 번째 행으로 이동합니다
+            position = min(bisect_left(self.view_rows, row_index), len(self.view_rows) - 1)
+            if self.display_ranks is not None:
+                # 정렬된 검색 결과에서는 그 행의 순위로 표시 위치를 찾습니다
+                ranks = self.sort_order.ranks(self.sort_column, self.sort_descending)
+                position = bisect_left(self.display_ranks, ranks[self.view_rows[position]])
+            self.tree_view.jump_to_row(position)
+
+
+class JoinExplanationView:
+    """
+    핵심: JOIN 설명 탭의 페이지 컨트롤과 텍스트 위젯을 한 번만 만들고 실행마다 설명 모델만 바꾸는 뷰.
+    """
+    
+    def __init__(self, parent_frame):
+        """
+        핵심: 설명 뷰의 위젯을 생성합니다.
         
-        # 요약 정보 추가
-        matched_count = sum(1 for _, matched in join_result if matched)
-        unmatched_count = len(join_result) - matched_count
+        매개변수:
+            parent_frame: 표시할 프레임
+        """
+        self.explanation_model = None
+        self.page = 0
+        
+        # 페이지 이동 및 보기 방식 컨트롤
+        controls_frame = ttk.Frame(parent_frame)
+        controls_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        self.mode_var = tk.StringVar(value=explanation.DETAIL_MODE)
+        ttk.Radiobutton(controls_frame, text="조합별 상세", variable=self.mode_var, value=explanation.DETAIL_MODE,
+                        command=lambda: self.show_page(0)).pack(side=tk.LEFT, padx=5)
+        ttk.Radiobutton(controls_frame, text="A 행별 요약", variable=self.mode_var, value=explanation.SUMMARY_MODE,
+                        command=lambda: self.show_page(0)).pack(side=tk.LEFT, padx=5)
+        
+        ttk.Button(controls_frame, text="◀ 이전", width=8,
+                   command=lambda: self.show_page(self.page - 1)).pack(side=tk.LEFT, padx=(20, 5))
+        self.page_label = ttk.Label(controls_frame)
+        self.page_label.pack(side=tk.LEFT, padx=5)
+        ttk.Button(controls_frame, text="다음 ▶", width=8,
+                   command=lambda: self.show_page(self.page + 1)).pack(side=tk.LEFT, padx=5)
+        
+        ttk.Label(controls_frame, text="페이지:").pack(side=tk.LEFT, padx=(20, 5))
+        self.page_input = ttk.Entry(controls_frame, width=8)
+        self.page_input.pack(side=tk.LEFT)
+        self.page_input.bind("<Return>", self._jump_to_page)
+        ttk.Button(controls_frame, text="이동", command=self._jump_to_page).pack(side=tk.LEFT, padx=5)
         
-        summary_frame = ttk.Frame(parent_frame)
-        summary_frame.pack(fill=tk.X, pady=10)
+        # 설명을 위한 스크롤 텍스트 위젯 생성
+        self.explanation_text = widgets.ExplanationText(parent_frame, wrap=tk.WORD)
+        self.explanation_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+    
+    def show(self, explanation_model):
+        """
+        핵심: 새 설명 모델의 첫 페이지를 표시합니다.
         
-        summary_text = f"결과 총 {len(join_result)}개 행 " + \
-                      f"({matched_count}개 직접 일치, {unmatched_count}개 OUTER JOIN으로 추가)"
+        매개변수:
+            explanation_model: explanation.JoinExplanation
+        """
+        self.explanation_model = explanation_model
+        self.show_page(0)
+    
+    def show_page(self, page):
+        """
+        핵심: 현재 보기 방식의 지정한 페이지를 표시합니다.
         
-        ttk.Label(summary_frame, text=summary_text).pack(anchor=tk.W, padx=10)
+        매개변수:
+            page: 0부터 시작하는 페이지 번호
+        """
+        if self.explanation_model is None:
+            return
+        mode = self.mode_var.get()
+        page_count = self.explanation_model.page_count(mode)
+        self.page = max(0, min(page, page_count - 1))
+        self.page_label.config(text=f"{self.page + 1:,} / {page_count:,} 페이지 "
+                                    f"(항목 {self.explanation_model.entry_count(mode):,}개)")
+        
+        text = self.explanation_text
+        text.set_read_only(False)
+        text.delete(1.0, tk.END)
+        text.add_segments(self.explanation_model.header_segments())
+        text.add_segments(self.explanation_model.page_segments(self.page, mode))
+        text.set_read_only(True)
+        text.yview_moveto(0)
     
-    @staticmethod
-    def display_join_explanation(parent_frame, cartesian_product, key_a, key_b, join_type):
+    def _jump_to_page(self, event=None):
+        try:
+            self.show_page(int(self.page_input.get().strip().replace(",", "")) - 1)
+        except ValueError:
+            pass
+
+
+class HeatmapTabView:
+    """
+    핵심: 일치 히트맵 탭의 캔버스 뷰를 한 번만 만들고 실행마다 일치 행렬만 바꾸는 뷰.
+    """
+    
+    def __init__(self, parent_frame):
+        """
+        핵심: 히트맵 탭 뷰를 준비합니다. 캔버스 뷰는 처음 행렬을 받을 때 만들어집니다.
+        
+        매개변수:
+            parent_frame: 표시할 프레임
+        """
+        self.parent_frame = parent_frame
+        self.on_pair_selected = None
+        self.view = None
+        self.empty_label = ttk.Label(parent_frame, text="표시할 조합이 없습니다")
+    
+    def show(self, explanation_model, on_pair_selected=None):
+        """
+        핵심: 새 설명 모델로 일치 행렬을 만들어 표시합니다.
+        
+        매개변수:
+            explanation_model: 계산된 explanation.JoinExplanation
+            on_pair_selected: 클릭한 조합의 카티션 곱 인덱스를 받는 콜백 (선택)
+        """
+        self.on_pair_selected = on_pair_selected
+        matrix = heatmap.MatchMatrix(explanation_model)
+        if matrix.row_count == 0 or matrix.column_count == 0:
+            if self.view is not None:
+                self.view.frame.pack_forget()
+            self.empty_label.pack(pady=10)
+            return
+        
+        self.empty_label.pack_forget()
+        if self.view is None:
+            self.view = heatmap.HeatmapView(self.parent_frame, matrix, self._on_pair_selected)
+        else:
+            self.view.set_matrix(matrix)
+        self.view.pack(fill=tk.BOTH, expand=True)
+    
+    def _on_pair_selected(self, pair_index):
+        if self.on_pair_selected:
+            self.on_pair_selected(pair_index)
+
+
+class TableResultView:
+    """
+    핵심: 집계 결과나 알고리즘 비교처럼 테이블 위젯과 요약 문구로 이루어진 결과를 재사용해 표시하는 뷰.
+    """
+    
+    def __init__(self, parent_frame, show_row_numbers=True):
+        """
+        핵심: 결과 테이블과 요약 레이블을 생성합니다.
+        
+        매개변수:
+            parent_frame: 표시할 프레임
+            show_row_numbers: 행 번호 표시 여부
+        """
+        self.empty_label = ttk.Label(parent_frame)
+        self.summary_label = ttk.Label(parent_frame, wraplength=800, justify=tk.LEFT)
+        self.table_view = widgets.create_table_view(parent_frame, show_row_numbers=show_row_numbers)
+    
+    def show_empty(self, text):
+        """
+        핵심: 테이블을 숨기고 안내 문구만 표시합니다.
+        """
+        self.table_view.frame.pack_forget()
+        self.summary_label.pack_forget()
+        self.empty_label.config(text=text)
+        self.empty_label.pack(pady=20)
+    
+    def reset(self, columns, summary_text):
+        """
+        핵심: 테이블의 항목을 지우고 열과 요약 문구를 바꾼 뒤 표시합니다.
+        
+        매개변수:
+            columns: 열 이름 목록
+            summary_text: 테이블 아래에 표시할 요약 문구
+            
+        반환값:
+            행을 추가할 테이블 위젯 (widgets.create_table_view)
+        """
+        self.empty_label.pack_forget()
+        self.table_view.set_columns(columns)
+        self.summary_label.config(text=summary_text)
+        self.summary_label.pack(side=tk.BOTTOM, anchor=tk.W, padx=10, pady=10)
+        self.table_view.pack(fill=tk.BOTH, expand=True)
+        return self.table_view
+
+
+class InputTablesWindow:
+    """
+    핵심: 입력 테이블을 보여주는 창. 실행마다 새 창을 열지 않고 한 창을 재사용합니다.
+    
+    사용자가 창을 닫으면 파괴하지 않고 숨겼다가 다음 실행에서 다시 보여줍니다.
+    """
+    
+    def __init__(self, root):
+        """
+        핵심: 입력 테이블 창과 두 테이블 뷰를 생성합니다.
+        
+        매개변수:
+            root: 루트 창
+        """
+        self.window = tk.Toplevel(root)
+        self.window.title("입력 테이블")
+        self.window.geometry("800x400")
+        self.window.protocol("WM_DELETE_WINDOW", self.window.withdraw)
+        
+        # 테이블 A 표시
+        frame_a = ttk.LabelFrame(self.window, text="테이블 A")
+        frame_a.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.table_view_a = widgets.create_table_view(frame_a)
+        self.table_view_a.pack(fill=tk.BOTH, expand=True)
+        
+        # 테이블 B 표시
+        frame_b = ttk.LabelFrame(self.window, text="테이블 B")
+        frame_b.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.table_view_b = widgets.create_table_view(frame_b)
+        self.table_view_b.pack(fill=tk.BOTH, expand=True)
+    
+    def exists(self):
+        """
+        핵심: 창이 아직 파괴되지 않았는지 여부를 반환합니다.
+        """
+        return bool(self.window.winfo_exists())
+    
+    def is_shown(self):
+        """
+        핵심: 창이 화면에 표시되어 있는지(숨겨지지 않았는지) 여부를 반환합니다.
+        """
+        return self.exists() and self.window.state() != "withdrawn"
+    
+    def show(self, table_a, table_b, populator=None, raise_window=True):
+        """
+        핵심: 두 테이블의 내용을 새 입력으로 바꾸고 창을 표시합니다.
+        
+        매개변수:
+            table_a: 테이블 A 데이터
+            table_b: 테이블 B 데이터
+            populator: 행을 나눠서 삽입할 widgets.IncrementalPopulator (없으면 한 번에 삽입)
+            raise_window: False면 내용만 바꾸고 창을 표시하거나 앞으로 가져오지 않음
+        """
+        for table_view, table in ((self.table_view_a, table_a), (self.table_view_b, table_b)):
+            table_view.set_columns(list(table[0].keys()) if table else [])
+            ResultDisplayManager._populate_table_view(table_view, enumerate(table), populator)
+        if raise_window:
+            self.window.deiconify()
+            self.window.lift()
+
+
+class ResultDisplayManager:
+    """
+    핵심: 출력 패널에 결과 표시를 관리합니다.
+    
+    탭마다 뷰 객체를 처음 표시할 때 한 번만 만들어 두고, 이후 실행에서는 새 데이터만 전달합니다.
+    위젯을 매번 파괴하고 다시 만들지 않으므로 오래 사용해도 Tcl 명령과 위젯이 쌓이지 않습니다.
+    """
+    
+    def __init__(self):
+        """
+        핵심: 결과 표시 관리자를 초기화합니다.
+        """
+        self._views = {}  # (뷰 클래스, 프레임 경로) -> 뷰 객체
+        self._tables_window = None
+    
+    def _view(self, view_class, parent_frame, *args):
+        """
+        핵심: 프레임에 연결된 뷰 객체를 가져오고, 없으면 프레임을 비운 뒤 새로 만듭니다.
+        """
+        key = (view_class, str(parent_frame))
+        view = self._views.get(key)
+        if view is None:
+            for widget in parent_frame.winfo_children():
+                widget.destroy()
+            view = view_class(parent_frame, *args)
+            self._views[key] = view
+        return view
+    
+    def display_cartesian_product(self, parent_frame, cartesian_product, key_a, key_b, join_type, normalizer=None,
+                                  preview_sample=None):
+        """
+        핵심: 일치하는 행에 대한 강조 표시와 함께 카티션 곱을 그리드에 표시합니다.
+        
+        화면에 보이는 조합만 그리는 가상 그리드를 사용하므로 곱의 크기와 관계없이 즉시 열립니다.
+        
+        매개변수:
+            parent_frame: 표시할 프레임
+            cartesian_product: 카티션 곱 데이터 (미리보기 모드에서는 표본 조합)
+            key_a: 테이블 A의 조인 키
+            key_b: 테이블 B의 조인 키
+            join_type: JOIN의 유형
+            normalizer: 조인 키 정규화 규칙 (기본값: 정규화 없음)
+            preview_sample: 미리보기 모드이면 표본 정보(preview.PreviewSample), 아니면 None
+        """
+        view = self._view(CartesianProductView, parent_frame)
+        view.show(cartesian_product, key_a, key_b, join_type, normalizer, preview_sample)
+    
+    def display_join_result(self, parent_frame, join_result):
+        """
+        핵심: JOIN 결과를 테이블에 표시합니다.
+        
+        결과 행을 모두 insert하지 않고 화면에 보이는 행만 항목으로 유지하므로
+        결과가 수백만 행이어도 즉시 열리고 스크롤할 수 있습니다.
+        
+        매개변수:
+            parent_frame: 표시할 프레임
+            join_result: JOIN 결과 데이터
+        """
+        self._view(JoinResultView, parent_frame).show(join_result)
+    
+    def display_join_explanation(self, parent_frame, cartesian_product, key_a, key_b, join_type, normalizer=None,
+                                 explanation_model=None):
         """
         핵심: JOIN 결과에 행이 포함되거나 제외되는 이유에 대한 자세한 설명을 표시합니다.
         
+        설명은 페이지 단위로 표시되며, 현재 페이지의 항목에 대해서만 텍스트를 생성합니다.
+        큰 입력은 A 행별로 일치/불일치한 B 행 수를 보여주는 요약 보기로 전환할 수 있습니다.
+        
         매개변수:
             parent_frame: 표시할 프레임
             cartesian_product: 카티션 곱 데이터
             key_a: 테이블 A의 조인 키
             key_b: 테이블 B의 조인 키
             join_type: JOIN의 유형
+            normalizer: 조인 키 정규화 규칙 (기본값: 정규화 없음)
+            explanation_model: 미리 계산된 explanation.JoinExplanation (없으면 새로 생성)
+        """
+        if explanation_model is None:
+            explanation_model = explanation.JoinExplanation(cartesian_product, key_a, key_b, join_type, normalizer)
+        self._view(JoinExplanationView, parent_frame).show(explanation_model)
+    
+    def display_heatmap(self, parent_frame, explanation_model, on_pair_selected=None):
         """
-        # 이전 내용 지우기
-        for widget in parent_frame.winfo_children():
-            widget.destroy()
+        핵심: A 행 × B 행 일치 행렬을 히트맵 이미지 한 장으로 표시합니다.
         
-        # 설명을 위한 스크롤 텍스트 위젯 생성
-        explanation_text = widgets.ExplanationText(parent_frame, wrap=tk.WORD)
-        explanation_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # 제목 추가
-        explanation_text.add_title(f"{join_type}에 대한 자세한 설명\n\n")
-        
-        # 사전 계산: 일치하는 행 식별
-        matched_a_ids = set()
-        matched_b_ids = set()
-        unmatched_a_ids = set()
-        unmatched_b_ids = set()
-        
-        # 각 테이블에서 고유한 행 추적
-        unique_rows_a = []
-        unique_rows_b = []
-        seen_a_ids = set()
-        seen_b_ids = set()
-        
-        for row_a, row_b in cartesian_product:
-            # 고유 행 추적
-            if id(row_a) not in seen_a_ids:
-                seen_a_ids.add(id(row_a))
-                unique_rows_a.append(row_a)
-                
-            if id(row_b) not in seen_b_ids:
-                seen_b_ids.add(id(row_b))
-                unique_rows_b.append(row_b)
-                
-            # 일치하는 행 식별
-            if join_type != "CROSS JOIN" and key_a in row_a and key_b in row_b and row_a[key_a] == row_b[key_b]:
-                matched_a_ids.add(id(row_a))
-                matched_b_ids.add(id(row_b))
-        
-        # 일치하지 않는 행 식별
-        for row_a in unique_rows_a:
-            if id(row_a) not in matched_a_ids:
-                unmatched_a_ids.add(id(row_a))
-                
-        for row_b in unique_rows_b:
-            if id(row_b) not in matched_b_ids:
-                unmatched_b_ids.add(id(row_b))
-        
-        # 행 수 및 설명된 조합 추적
-        included_count = 0
-        explained_rows = set()  # 이미 설명된 고유한 행 조합 추적
-        processed_unmatched_a = set()  # 이미 처리된 일치하지 않는 A 행 추적
-        processed_unmatched_b = set()  # 이미 처리된 일치하지 않는 B 행 추적
-        
-        # 첫 번째 단계: 모든 직접 일치 설명
-        for i, (row_a, row_b) in enumerate(cartesian_product):
-            # 행 데이터 형식화
-            row_a_str = ", ".join([f"{k}: {v}" for k, v in row_a.items()])
-            row_b_str = ", ".join([f"{k}: {v}" for k, v in row_b.items()])
-            
-            # 이 조합이 이미 설명되었는지 확인
-            pair_key = (id(row_a), id(row_b))
-            if pair_key in explained_rows:
-                continue
-                
-            # CROSS JOIN 또는 일치하는 키 처리
-            if join_type == "CROSS JOIN" or (key_a in row_a and key_b in row_b and row_a[key_a] == row_b[key_b]):
-                # 행 헤더 추가
-                explanation_text.add_row_header(f"행 {i+1}: 비교 중\n")
-                explanation_text.add_explanation(f"   테이블 A: {{{row_a_str}}}\n")
-                explanation_text.add_explanation(f"   테이블 B: {{{row_b_str}}}\n")
-                
-                if join_type == "CROSS JOIN":
-                    explanation = "모든 조합이 CROSS JOIN에 포함됩니다."
-                else:
-                    a_value = row_a[key_a]
-                    b_value = row_b[key_b]
-                    explanation = f"{key_a}={a_value}와 {key_b}={b_value} 비교: 일치합니다! 키가 일치하므로 {join_type}에 이 행이 포함됩니다."
-                
-                explanation_text.add_included(f"   결과: {explanation}\n")
-                explanation_text.add_included(f"   → 결과에 행 포함\n\n")
-                explained_rows.add(pair_key)
-                included_count += 1
-                continue
-                
-            # 키가 일치하지 않음, INNER JOIN의 일부 아님
-            if join_type == "INNER JOIN":
-                # 행 헤더 추가
-                explanation_text.add_row_header(f"행 {i+1}: 비교 중\n")
-                explanation_text.add_explanation(f"   테이블 A: {{{row_a_str}}}\n")
-                explanation_text.add_explanation(f"   테이블 B: {{{row_b_str}}}\n")
-                
-                explanation = ""
-                if key_a not in row_a:
-                    explanation = f"행 A에 키 {key_a}가 없습니다. "
-                elif key_b not in row_b:
-                    explanation = f"행 B에 키 {key_b}가 없습니다. "
-                else:
-                    a_value = row_a[key_a]
-                    b_value = row_b[key_b]
-                    explanation = f"{key_a}={a_value}와 {key_b}={b_value} 비교: 일치하지 않습니다. 키가 일치하지 않으므로 이 행은 INNER JOIN에서 제외됩니다."
-                
-                explanation_text.add_excluded(f"   결과: {explanation}\n")
-                explanation_text.add_excluded(f"   → 결과에서 행 제외\n\n")
-                explained_rows.add(pair_key)
-        
-        # 두 번째 단계: OUTER JOIN에 대한 일치하지 않는 행 처리
-        # LEFT OUTER JOIN 일치하지 않는 A 행
-        if join_type in ["LEFT OUTER JOIN", "FULL OUTER JOIN"]:
-            for row_a in unique_rows_a:
-                if id(row_a) in unmatched_a_ids and id(row_a) not in processed_unmatched_a:
-                    row_a_str = ", ".join([f"{k}: {v}" for k, v in row_a.items()])
-                    
-                    explanation_text.add_row_header(f"LEFT JOIN 추가 행: 일치하지 않는 A 행\n")
-                    explanation_text.add_explanation(f"   테이블 A: {{{row_a_str}}}\n")
-                    explanation_text.add_explanation(f"   테이블 B: NULL 값\n")
-                    
-                    explanation = f"테이블 A의 행이 테이블 B의 어떤 행과도 일치하지 않아 NULL 값으로 채워진 B 열과 함께 결과에 포함됩니다."
-                    
-                    explanation_text.add_included(f"   결과: {explanation}\n")
-                    explanation_text.add_included(f"   → 결과에 행 포함 (NULL 채움)\n\n")
-                    
-                    processed_unmatched_a.add(id(row_a))
-                    included_count += 1
-        
-        # RIGHT OUTER JOIN 일치하지 않는 B 행
-        if join_type in ["RIGHT OUTER JOIN", "FULL OUTER JOIN"]:
-            for row_b in unique_rows_b:
-                if id(row_b) in unmatched_b_ids and id(row_b) not in processed_unmatched_b:
-                    row_b_str = ", ".join([f"{k}: {v}" for k, v in row_b.items()])
-                    
-                    explanation_text.add_row_header(f"RIGHT JOIN 추가 행: 일치하지 않는 B 행\n")
-                    explanation_text.add_explanation(f"   테이블 A: NULL 값\n")
-                    explanation_text.add_explanation(f"   테이블 B: {{{row_b_str}}}\n")
-                    
-                    explanation = f"테이블 B의 행이 테이블 A의 어떤 행과도 일치하지 않아 NULL 값으로 채워진 A 열과 함께 결과에 포함됩니다."
-                    
-                    explanation_text.add_included(f"   결과: {explanation}\n")
-                    explanation_text.add_included(f"   → 결과에 행 포함 (NULL 채움)\n\n")
-                    
-                    processed_unmatched_b.add(id(row_b))
-                    included_count += 1
-        
-        # 마지막에 요약 추가
-        explanation_text.add_row_header(f"\n요약: {included_count}개의 고유한 행이 {join_type} 결과에 포함되었습니다.\n")
-        
-        # 읽기 전용으로 설정
-        explanation_text.set_read_only(True)
+        매개변수:
+            parent_frame: 표시할 프레임
+            explanation_model: 계산된 explanation.JoinExplanation
+            on_pair_selected: 클릭한 조합의 카티션 곱 인덱스를 받는 콜백 (선택)
+        """
+        self._view(HeatmapTabView, parent_frame).show(explanation_model, on_pair_selected)
     
-    @staticmethod
-    def display_tables(root, table_a, table_b):
+    def display_tables(self, root, table_a, table_b, populator=None):
         """
-        핵심: 참조를 위해 새 창에서 입력 테이블을 표시합니다.
+        핵심: 참조를 위해 입력 테이블 창에 입력 테이블을 표시합니다.
+        
+        창은 처음 한 번만 만들고, 이후 실행에서는 같은 창의 내용만 바꿉니다.
 
         매개변수:
             root: 루트 창
             table_a: 테이블 A 데이터
             table_b: 테이블 B 데이터
+            populator: 행을 나눠서 삽입할 widgets.IncrementalPopulator (없으면 한 번에 삽입)
         """
-        tables_window = tk.Toplevel(root)
-        tables_window.title("입력 테이블")
-        tables_window.geometry("800x400")
+        if self._tables_window is None or not self._tables_window.exists():
+            self._tables_window = InputTablesWindow(root)
+        self._tables_window.show(table_a, table_b, populator)
+    
+    def refresh_tables(self, table_a, table_b, populator=None):
+        """
+        핵심: 입력 테이블 창이 표시되어 있을 때만 내용을 새 입력으로 바꿉니다.
         
-        # 테이블 A 표시
-        frame_a = ttk.LabelFrame(tables_window, text="테이블 A")
-        frame_a.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        실시간 갱신에서 사용하며, 창을 새로 열거나 앞으로 가져오지 않습니다.
+        
+        매개변수:
+            table_a: 테이블 A 데이터
+            table_b: 테이블 B 데이터
+            populator: 행을 나눠서 삽입할 widgets.IncrementalPopulator (없으면 한 번에 삽입)
+        """
+        if self._tables_window is not None and self._tables_window.is_shown():
+            self._tables_window.show(table_a, table_b, populator, raise_window=False)
+    
+    @staticmethod
+    def _populate_table_view(table_view, numbered_rows, populator=None):
+        """
+        핵심: (행 번호, 행) 목록을 테이블 위젯에 추가합니다.
         
-        # 테이블 A에 대한 TableView 생성
-        table_view_a = widgets.TableView(frame_a, columns=list(table_a[0].keys()) if table_a else [])
-        table_view_a.pack(fill=tk.BOTH, expand=True)
+        도우미가 주어지면 첫 묶음만 바로 추가하고 나머지는 유휴 시간에 나눠서 추가합니다.
         
-        # 테이블 A에 데이터 추가
-        for i, row in enumerate(table_a):
-            values = [row.get(col, "") for col in table_view_a.columns]
-            table_view_a.add_row(values, i)
+        매개변수:
+            table_view: 행을 추가할 테이블 위젯 (widgets.create_table_view)
+            numbered_rows: (행 번호, 행 딕셔너리) 이터러블
+            populator: widgets.IncrementalPopulator (선택)
+        """
+        def add_row(item):
+            row_num, row = item
+            table_view.add_row([row.get(col, "") for col in table_view.columns], row_num)
+        
+        if populator is not None:
+            populator.populate(table_view.frame, numbered_rows, add_row)
+        else:
+            for item in numbered_rows:
+                add_row(item)
+    
+    def display_aggregate_result(self, parent_frame, aggregate_result, populator=None):
+        """
+        핵심: GROUP BY 집계 결과를 테이블에 표시합니다.
         
-        # 테이블 B 표시
-        frame_b = ttk.LabelFrame(tables_window, text="테이블 B")
-        frame_b.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        매개변수:
+            parent_frame: 표시할 프레임
+            aggregate_result: models.AggregateResult 집계 결과
+            populator: 행을 나눠서 삽입할 widgets.IncrementalPopulator (선택)
+        """
+        view = self._view(TableResultView, parent_frame)
+        if not aggregate_result.rows:
+            view.show_empty("집계할 JOIN 결과가 없습니다")
+            return
         
-        # 테이블 B에 대한 TableView 생성
-        table_view_b = widgets.TableView(frame_b, columns=list(table_b[0].keys()) if table_b else [])
-        table_view_b.pack(fill=tk.BOTH, expand=True)
+        summary_text = f"JOIN 결과 {aggregate_result.input_row_count}개 행을 " + \
+                      f"{aggregate_result.group_count}개 그룹으로 집계했습니다 (JOIN 결과 행을 생성하는 대로 해시 집계)"
+        table_view = view.reset(aggregate_result.columns, summary_text)
+        
+        ResultDisplayManager._populate_table_view(
+            table_view, enumerate(aggregate_result.rows, start=1), populator
+        )
+    
+    def display_algorithm_race(self, parent_frame, race_results, row_count_a, row_count_b):
+        """
+        핵심: JOIN 알고리즘 비교 결과를 테이블에 표시합니다.
         
-        # 테이블 B에 데이터 추가
-        for i, row in enumerate(table_b):
-            values = [row.get(col, "") for col in table_view_b.columns]
-            table_view_b.add_row(values, i)
\ No newline at end of file
+        매개변수:
+            parent_frame: 표시할 프레임
+            race_results: models.AlgorithmRunResult 목록
+            row_count_a: 테이블 A의 행 수
+            row_count_b: 테이블 B의 행 수
+        """
+        executed = [result for result in race_results if not result.skipped]
+        reference_name = executed[0].name if executed else "중첩 루프"
+        all_verified = all(result.verified for result in executed)
+        verification_text = f"모든 알고리즘의 결과가 {reference_name} 결과와 동일합니다." if all_verified else \
+            f"일부 알고리즘의 결과가 {reference_name} 결과와 다릅니다!"
+        if len(executed) < len(race_results):
+            verification_text += " (입력이 미리보기 기준보다 커서 중첩 루프는 건너뛰었습니다)"
+        summary_text = (
+            f"{verification_text}\n"
+            f"중첩 루프는 카티션 곱의 {row_count_a} × {row_count_b} = {row_count_a * row_count_b:,}개 조합을 모두 비교하므로 "
+            f"입력이 커지면 비교 횟수가 곱으로 늘어납니다. 해시 JOIN은 각 행을 한 번씩만 해시하고(O(n + m)), "
+            f"정렬-병합 JOIN과 인덱스 중첩 루프는 정렬된 키를 이용해 O(n log m) 수준으로 비교합니다.\n"
+            f"정렬-병합 JOIN의 키 비교 수는 병합 단계만 센 값입니다."
+        )
+        
+        columns = ["알고리즘", "실행 시간 (ms)", "키 비교", "해시 조회", "최대 메모리 (KB)", "결과 행 수", "결과 검증"]
+        view = self._view(TableResultView, parent_frame, False)
+        table_view = view.reset(columns, summary_text)
+        
+        for result in race_results:
+            if result.skipped:
+                table_view.add_row([result.name, "-", "-", "-", "-", "-", "건너뜀"])
+                continue
+            values = [
+                result.name,
+                f"{result.seconds * 1000:.2f}",
+                f"{result.stats.comparisons:,}",
+                f"{result.stats.hash_probes:,}",
+                f"{result.peak_memory_bytes / 1024:,.1f}",
+                f"{result.row_count:,}",
+                "일치" if result.verified else "불일치",
+            ]
+            table_view.add_row(values, tags=("matched",) if result.verified else ("unmatched",))
@@ -0,0 +1,419 @@
+from bisect import bisect_left
+from typing import Callable, List, Tuple
+import tkinter as tk
+from tkinter import ttk
+
+from key_normalization import MISSING
+
+
+# 일치 비율별 색상 (0번은 일치하는 조합이 없는 칸, 마지막은 모든 조합이 일치하는 칸)
+HEATMAP_PALETTE = [
+    (0xf4, 0xf4, 0xf4),
+    (0xe3, 0xf6, 0xe3), (0xd2, 0xf0, 0xd2), (0xc0, 0xea, 0xc0), (0xae, 0xe3, 0xae),
+    (0x9b, 0xdb, 0x9b), (0x88, 0xd3, 0x88), (0x75, 0xca, 0x75), (0x62, 0xc0, 0x62),
+    (0x50, 0xb5, 0x50), (0x40, 0xa8, 0x40), (0x33, 0x9a, 0x33), (0x28, 0x8b, 0x28),
+    (0x1f, 0x7b, 0x1f), (0x17, 0x6a, 0x17), (0x10, 0x58, 0x10),
+]
+
+# 한 번에 그리는 히트맵 이미지의 최대 픽셀 수 (이보다 세밀한 확대 단계는 제공하지 않음)
+MAX_HEATMAP_PIXELS = 4_000_000
+
+# 작은 행렬을 확대해서 그릴 때 한 칸의 최대 픽셀 크기
+MAX_CELL_PIXELS = 24
+
+# 히트맵을 처음 표시할 때 맞추는 화면 크기 (픽셀)
+DEFAULT_VIEW_SIZE = 640
+
+_SELECTION_COLOR = "#d00000"
+
+
+def _channel_table(channel: int) -> bytes:
+    """
+    핵심: 팔레트 인덱스 바이트를 색상 채널 값으로 바꾸는 bytes.translate 표를 만듭니다.
+    """
+    values = [color[channel] for color in HEATMAP_PALETTE]
+    return bytes(values + [0] * (256 - len(values)))
+
+
+_RED_TABLE = _channel_table(0)
+_GREEN_TABLE = _channel_table(1)
+_BLUE_TABLE = _channel_table(2)
+
+
+class MatchMatrix:
+    """
+    핵심: 테이블 A 행 × 테이블 B 행의 키 일치 여부를 블록 단위로 집계하는 행렬 모델입니다.
+
+    n×m개의 칸을 모두 평가하지 않고, 설명 모델이 이미 계산한 A 행별 키 코드와
+    키 코드별 B 행 위치만으로 각 블록의 일치 개수를 구합니다. 같은 키 구성을 가진
+    블록 행은 한 번만 계산하여 재사용하므로, 키 종류가 적거나 모두 다른 경우 모두
+    이미지 크기에 비례하는 시간에 렌더링됩니다.
+    """
+    def __init__(self, explanation_model):
+        """
+        핵심: JOIN 설명 모델로 일치 행렬을 만듭니다.
+
+        매개변수:
+            explanation_model: explanation.JoinExplanation 객체
+        """
+        self.rows_a = explanation_model.rows_a
+        self.rows_b = explanation_model.rows_b
+        self.texts_a = explanation_model.texts_a
+        self.texts_b = explanation_model.texts_b
+        self.row_count = len(self.rows_a)
+        self.column_count = len(self.rows_b)
+        self.cross = explanation_model.join_type == "CROSS JOIN"
+        self.codes_a = explanation_model.codes_a
+        self.b_positions_by_code = explanation_model.b_positions_by_code
+
+    def shape(self, block: int) -> Tuple[int, int]:
+        """
+        핵심: 블록 크기에 따른 이미지의 (너비, 높이)를 반환합니다.
+        """
+        return -(-self.column_count // block), -(-self.row_count // block)
+
+    def block_sizes(self) -> List[int]:
+        """
+        핵심: 선택할 수 있는 확대 단계의 블록 크기 목록을 세밀한 순서로 반환합니다.
+
+        블록 크기는 1, 2, 4, ...이며 MAX_HEATMAP_PIXELS를 넘는 단계는 제외됩니다.
+        """
+        sizes = []
+        block = 1
+        while True:
+            width, height = self.shape(block)
+            if width * height <= MAX_HEATMAP_PIXELS:
+                sizes.append(block)
+            if width <= 1 and height <= 1:
+                return sizes
+            block *= 2
+
+    def fit_block_size(self, width: int, height: int) -> int:
+        """
+        핵심: 주어진 화면 크기 안에 들어가는 가장 세밀한 블록 크기를 반환합니다.
+        """
+        sizes = self.block_sizes()
+        for block in sizes:
+            image_width, image_height = self.shape(block)
+            if image_width <= width and image_height <= height:
+                return block
+        return sizes[-1]
+
+    def _b_block_counts(self, block: int) -> dict:
+        """
+        핵심: 키 코드별로 B 행이 어느 열 블록에 몇 개 있는지 계산합니다.
+        """
+        counts = {}
+        for code, positions in self.b_positions_by_code.items():
+            per_block = {}
+            for position in positions:
+                column = position // block
+                per_block[column] = per_block.get(column, 0) + 1
+            counts[code] = list(per_block.items())
+        return counts
+
+    def level_bytes(self, block: int) -> bytes:
+        """
+        핵심: 블록마다 일치 비율을 팔레트 인덱스 한 바이트로 나타낸 행 우선 바이트열을 만듭니다.
+
+        매개변수:
+            block: 블록 크기 (한 픽셀이 나타내는 A 행 수와 B 행 수)
+
+        반환값:
+            너비×높이 바이트의 팔레트 인덱스
+        """
+        width, height = self.shape(block)
+        top = len(HEATMAP_PALETTE) - 1
+        if self.cross:
+            return bytes([top]) * (width * height)
+
+        b_counts = self._b_block_counts(block)
+        last_width = self.column_count - (width - 1) * block
+        row_cache = {}
+        rows = []
+        for block_row in range(height):
+            start = block_row * block
+            end = min(start + block, self.row_count)
+
+            # 블록 행에 속한 A 행들의 키 구성 (같은 구성이면 같은 색 줄이 됩니다)
+            composition = {}
+            for code in self.codes_a[start:end]:
+                if code is not MISSING and code in b_counts:
+                    composition[code] = composition.get(code, 0) + 1
+            cache_key = (end - start, frozenset(composition.items()))
+
+            row = row_cache.get(cache_key)
+            if row is None:
+                matched = {}
+                for code, count_a in composition.items():
+                    for column, count_b in b_counts[code]:
+                        matched[column] = matched.get(column, 0) + count_a * count_b
+                levels = bytearray(width)
+                for column, count in matched.items():
+                    area = (end - start) * (block if column < width - 1 else last_width)
+                    levels[column] = min(1 + (count * top - 1) // area, top)
+                row = bytes(levels)
+                row_cache[cache_key] = row
+            rows.append(row)
+        return b"".join(rows)
+
+    def render_ppm(self, block: int) -> bytes:
+        """
+        핵심: 블록 크기로 집계한 일치 행렬을 PPM(P6) 이미지 바이트로 만듭니다.
+
+        픽셀마다 파이썬 반복을 돌지 않고 팔레트 인덱스 바이트열을 채널별로
+        bytes.translate한 뒤 슬라이스 대입으로 RGB를 끼워 넣습니다.
+
+        매개변수:
+            block: 블록 크기
+
+        반환값:
+            tk.PhotoImage의 data로 쓸 수 있는 PPM 바이트
+        """
+        width, height = self.shape(block)
+        levels = self.level_bytes(block)
+        pixels = bytearray(len(levels) * 3)
+        pixels[0::3] = levels.translate(_RED_TABLE)
+        pixels[1::3] = levels.translate(_GREEN_TABLE)
+        pixels[2::3] = levels.translate(_BLUE_TABLE)
+        return b"P6\n%d %d\n255\n" % (width, height) + bytes(pixels)
+
+    def block_bounds(self, block_row: int, block_column: int, block: int) -> Tuple[int, int, int, int]:
+        """
+        핵심: 블록이 나타내는 A 행 범위와 B 행 범위를 (a 시작, a 끝, b 시작, b 끝)으로 반환합니다.
+        """
+        return (
+            block_row * block, min((block_row + 1) * block, self.row_count),
+            block_column * block, min((block_column + 1) * block, self.column_count),
+        )
+
+    def block_match_count(self, block_row: int, block_column: int, block: int) -> Tuple[int, int]:
+        """
+        핵심: 블록 안에서 키가 일치하는 조합 수와 전체 조합 수를 반환합니다.
+        """
+        start_a, end_a, start_b, end_b = self.block_bounds(block_row, block_column, block)
+        total = max(end_a - start_a, 0) * max(end_b - start_b, 0)
+        if self.cross:
+            return total, total
+
+        matched = 0
+        for code in self.codes_a[start_a:end_a]:
+            positions = self.b_positions_by_code.get(code)
+            if positions:
+                matched += bisect_left(positions, end_b) - bisect_left(positions, start_b)
+        return matched, total
+
+    def pair_index(self, index_a: int, index_b: int) -> int:
+        """
+        핵심: (A 행 위치, B 행 위치)에 해당하는 카티션 곱의 조합 인덱스를 반환합니다.
+        """
+        return index_a * self.column_count + index_b
+
+
+class HeatmapView:
+    """
+    핵심: 일치 행렬을 PhotoImage 한 장으로 그려 보여주는 캔버스 뷰입니다.
+
+    칸마다 사각형 항목을 만들지 않고 확대 단계마다 이미지 하나만 만듭니다.
+    블록 단위 단계에서 픽셀을 클릭하면 가장 세밀한 단계로 확대되고,
+    조합 단위 단계에서 클릭하면 해당 조합을 on_pair_selected로 알립니다.
+    """
+    def __init__(self, parent, matrix: MatchMatrix, on_pair_selected: Callable[[int], None] = None):
+        """
+        핵심: 히트맵 뷰를 생성하고 화면에 맞는 확대 단계로 그립니다.
+
+        매개변수:
+            parent: 부모 위젯
+            matrix: 표시할 일치 행렬
+            on_pair_selected: 선택한 조합의 카티션 곱 인덱스를 받는 콜백 (선택)
+        """
+        self.matrix = matrix
+        self.on_pair_selected = on_pair_selected
+        self.block_sizes = matrix.block_sizes()
+        self.block = matrix.fit_block_size(DEFAULT_VIEW_SIZE, DEFAULT_VIEW_SIZE)
+        self.scale = 1
+        self.image = None
+        self.selected = None  # 선택한 (A 행 위치, B 행 위치)
+
+        self.frame = ttk.Frame(parent)
+
+        controls = ttk.Frame(self.frame)
+        controls.pack(side=tk.TOP, fill=tk.X, pady=(0, 5))
+        ttk.Button(controls, text="－ 축소", width=8, command=self.zoom_out).pack(side=tk.LEFT, padx=2)
+        ttk.Button(controls, text="＋ 확대", width=8, command=self.zoom_in).pack(side=tk.LEFT, padx=2)
+        self.level_label = ttk.Label(controls)
+        self.level_label.pack(side=tk.LEFT, padx=10)
+        self.info_label = ttk.Label(controls, anchor=tk.W)
+        self.info_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=10)
+
+        canvas_frame = ttk.Frame(self.frame)
+        canvas_frame.pack(fill=tk.BOTH, expand=True)
+        h_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL)
+        h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        v_scrollbar = ttk.Scrollbar(canvas_frame)
+        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas = tk.Canvas(canvas_frame, background="white", highlightthickness=0,
+                                xscrollcommand=h_scrollbar.set, yscrollcommand=v_scrollbar.set)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        h_scrollbar.config(command=self.canvas.xview)
+        v_scrollbar.config(command=self.canvas.yview)
+
+        self._image_item = self.canvas.create_image(0, 0, anchor=tk.NW)
+        self._selection_item = self.canvas.create_rectangle(0, 0, 0, 0, outline=_SELECTION_COLOR,
+                                                            width=2, state=tk.HIDDEN)
+
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<Motion>", self._on_motion)
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda event: self._scroll(-3))
+        self.canvas.bind("<Button-5>", lambda event: self._scroll(3))
+
+        self.render()
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    def set_matrix(self, matrix: MatchMatrix):
+        """
+        핵심: 같은 뷰에 새 일치 행렬을 연결하고 화면에 맞는 확대 단계로 다시 그립니다.
+
+        매개변수:
+            matrix: 새 일치 행렬
+        """
+        self.matrix = matrix
+        self.block_sizes = matrix.block_sizes()
+        self.block = matrix.fit_block_size(DEFAULT_VIEW_SIZE, DEFAULT_VIEW_SIZE)
+        self.selected = None
+        self.info_label.config(text="")
+        self.render()
+        self.canvas.xview_moveto(0)
+        self.canvas.yview_moveto(0)
+
+    def render(self):
+        """
+        핵심: 현재 블록 크기로 히트맵 이미지를 만들어 캔버스에 표시합니다.
+        """
+        width, height = self.matrix.shape(self.block)
+        self.scale = max(1, min(MAX_CELL_PIXELS, DEFAULT_VIEW_SIZE // max(width, height, 1)))
+
+        image = tk.PhotoImage(master=self.canvas, data=self.matrix.render_ppm(self.block), format="PPM")
+        if self.scale > 1:
+            image = image.zoom(self.scale)
+        self.image = image  # 참조를 유지해야 이미지가 사라지지 않습니다
+        self.canvas.itemconfig(self._image_item, image=image)
+        self.canvas.config(scrollregion=(0, 0, width * self.scale, height * self.scale))
+
+        if self.block == 1:
+            unit = "조합 단위"
+        else:
+            unit = f"{self.block:,}×{self.block:,} 블록"
+        self.level_label.config(text=f"{width:,}×{height:,} 픽셀 ({unit})")
+        self._draw_selection()
+
+    def _set_block(self, block, focus_a, focus_b):
+        """
+        핵심: 블록 크기를 바꿔 다시 그리고, 지정한 A/B 행 위치가 화면 가운데 오도록 스크롤합니다.
+        """
+        self.block = block
+        self.render()
+        width, height = self.matrix.shape(block)
+        x = (focus_b // block + 0.5) * self.scale
+        y = (focus_a // block + 0.5) * self.scale
+        view_width = self.canvas.winfo_width()
+        view_height = self.canvas.winfo_height()
+        self.canvas.xview_moveto(max(x - view_width / 2, 0) / max(width * self.scale, 1))
+        self.canvas.yview_moveto(max(y - view_height / 2, 0) / max(height * self.scale, 1))
+
+    def _view_center(self):
+        """
+        핵심: 현재 화면 가운데에 보이는 (A 행 위치, B 행 위치)를 반환합니다.
+        """
+        x = self.canvas.canvasx(self.canvas.winfo_width() / 2)
+        y = self.canvas.canvasy(self.canvas.winfo_height() / 2)
+        return int(y // self.scale) * self.block, int(x // self.scale) * self.block
+
+    def zoom_in(self):
+        """
+        핵심: 한 단계 더 세밀한 블록 크기로 확대합니다.
+        """
+        position = self.block_sizes.index(self.block)
+        if position > 0:
+            self._set_block(self.block_sizes[position - 1], *self._view_center())
+
+    def zoom_out(self):
+        """
+        핵심: 한 단계 더 큰 블록 크기로 축소합니다.
+        """
+        position = self.block_sizes.index(self.block)
+        if position < len(self.block_sizes) - 1:
+            self._set_block(self.block_sizes[position + 1], *self._view_center())
+
+    def _block_at(self, event):
+        """
+        핵심: 마우스 위치의 (블록 행, 블록 열)을 반환합니다. 이미지 밖이면 None을 반환합니다.
+        """
+        width, height = self.matrix.shape(self.block)
+        block_column = int(self.canvas.canvasx(event.x) // self.scale)
+        block_row = int(self.canvas.canvasy(event.y) // self.scale)
+        if 0 <= block_row < height and 0 <= block_column < width:
+            return block_row, block_column
+        return None
+
+    def _on_motion(self, event):
+        position = self._block_at(event)
+        if position is None:
+            self.info_label.config(text="")
+            return
+        block_row, block_column = position
+        start_a, end_a, start_b, end_b = self.matrix.block_bounds(block_row, block_column, self.block)
+        matched, total = self.matrix.block_match_count(block_row, block_column, self.block)
+        if self.block == 1:
+            where = f"A 행 {start_a + 1:,} × B 행 {start_b + 1:,}"
+        else:
+            where = f"A 행 {start_a + 1:,}~{end_a:,} × B 행 {start_b + 1:,}~{end_b:,}"
+        self.info_label.config(text=f"{where}: 일치 {matched:,}/{total:,}")
+
+    def _on_click(self, event):
+        position = self._block_at(event)
+        if position is None:
+            return
+        block_row, block_column = position
+        start_a, _, start_b, _ = self.matrix.block_bounds(block_row, block_column, self.block)
+
+        if self.block != self.block_sizes[0]:
+            # 블록 단위 단계에서는 클릭한 위치로 가장 세밀한 단계까지 확대합니다
+            self._set_block(self.block_sizes[0], start_a + self.block // 2, start_b + self.block // 2)
+            return
+
+        if self.block != 1:
+            return  # 조합 단위로 그릴 수 없는 큰 행렬에서는 조합을 고를 수 없습니다
+        self.selected = (start_a, start_b)
+        self._draw_selection()
+        self.info_label.config(
+            text=f"선택: A {{{self.matrix.texts_a[start_a]}}} × B {{{self.matrix.texts_b[start_b]}}}"
+        )
+        if self.on_pair_selected:
+            self.on_pair_selected(self.matrix.pair_index(start_a, start_b))
+
+    def _draw_selection(self):
+        """
+        핵심: 선택한 조합을 현재 확대 단계에 맞춰 테두리로 표시합니다.
+        """
+        if self.selected is None:
+            self.canvas.itemconfig(self._selection_item, state=tk.HIDDEN)
+            return
+        index_a, index_b = self.selected
+        size = self.scale
+        x = (index_b // self.block) * size
+        y = (index_a // self.block) * size
+        self.canvas.coords(self._selection_item, x, y, x + size, y + size)
+        self.canvas.itemconfig(self._selection_item, state=tk.NORMAL)
+        self.canvas.tag_raise(self._selection_item)
+
+    def _scroll(self, units):
+        self.canvas.yview_scroll(units, "units")
+        return "break"
+
+    def _on_mousewheel(self, event):
+        # 애니메이션 탭의 전역 휠 바인딩까지 전달되지 않도록 이벤트를 여기서 끝냅니다
+        return self._scroll(int(-1 * (event.delta / 120)))
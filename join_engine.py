@@ -1,5 +1,20 @@
-from typing import List, Dict, Any, Tuple, Set
+from typing import List, Dict, Any, Tuple, Set, Iterable, Iterator
 import utils
+from key_normalization import KeyNormalizer, MISSING
+from join_index import INDEX_CACHE
+from models import JoinStats
+
+
+# UI에 표시되는 JOIN 알고리즘 이름 -> 내부 전략 이름
+JOIN_STRATEGIES = {
+    "중첩 루프 (카티션 곱 필터링)": "nested_loop",
+    "인덱스 중첩 루프": "index_nested_loop",
+    "해시 JOIN": "hash",
+    "정렬-병합 JOIN": "sort_merge",
+}
+
+# JOIN 루프에서 취소 여부를 확인하는 간격 (외부 루프의 행 또는 탐색 수)
+CANCEL_CHECK_INTERVAL = 1000
 
 
 class JoinEngine:
@@ -14,7 +29,9 @@ class JoinEngine:
     """
     @staticmethod
     def filter_join_result(cartesian_product: List[Tuple[Dict, Dict]], 
-                         key_a: str, key_b: str, join_type: str) -> List[Tuple[Dict, bool]]:
+                         key_a: str, key_b: str, join_type: str,
+                         normalizer: KeyNormalizer = None,
+                         stats: JoinStats = None, check_cancelled=None) -> List[Tuple[Dict, bool]]:
         """
         핵심 : 지정된 JOIN 유형과 키에 따라 카르테시안 곱을 필터링합니다.
         
@@ -23,72 +40,496 @@ class JoinEngine:
             key_a: 테이블 A의 JOIN 키
             key_b: 테이블 B의 JOIN 키
             join_type: JOIN 유형 (INNER, LEFT OUTER, RIGHT OUTER, FULL OUTER, CROSS)
+            normalizer: JOIN 키 정규화 규칙 (기본값: 정규화 없음)
+            stats: 키 비교 횟수를 기록할 카운터 (선택)
+            check_cancelled: 조합 CANCEL_CHECK_INTERVAL개마다 호출하여 취소되었으면 예외를 발생시키는 함수 (선택)
             
         반환값:
             (병합된_행, 일치_여부) 튜플의 리스트, 일치_여부는 키가 직접 일치하는지를 나타냅니다.
         """
-        result = []
+        return list(JoinEngine.iter_join_rows(cartesian_product, key_a, key_b, join_type, normalizer, stats,
+                                              check_cancelled))
+    @staticmethod
+    def iter_join_rows(cartesian_product: Iterable[Tuple[Dict, Dict]], 
+                       key_a: str, key_b: str, join_type: str,
+                       normalizer: KeyNormalizer = None,
+                       stats: JoinStats = None, check_cancelled=None) -> Iterator[Tuple[Dict, bool]]:
+        """
+        핵심 : filter_join_result와 같은 결과를 한 행씩 생성하는 스트리밍 버전입니다.
+        
+        결과 리스트를 만들지 않으므로 집계처럼 JOIN 결과가 중간 산출물일 뿐인
+        경우에 사용합니다. 카르테시안 곱도 한 번만 순회하면 되므로 제너레이터를 넘겨도 됩니다.
+        
+        매개변수:
+            cartesian_product: (행_A, 행_B) 튜플의 이터러블
+            key_a: 테이블 A의 JOIN 키
+            key_b: 테이블 B의 JOIN 키
+            join_type: JOIN 유형 (INNER, LEFT OUTER, RIGHT OUTER, FULL OUTER, CROSS)
+            normalizer: JOIN 키 정규화 규칙 (기본값: 정규화 없음)
+            stats: 키 비교 횟수를 기록할 카운터 (선택)
+            check_cancelled: 조합 CANCEL_CHECK_INTERVAL개마다 호출하여 취소되었으면 예외를 발생시키는 함수 (선택)
+            
+        반환값:
+            (병합된_행, 일치_여부) 튜플을 생성하는 이터레이터
+        """
+        normalizer = JoinEngine.resolve_normalizer(normalizer)
         
         # 각 테이블에서 일치하는 행 추적
         table_a_matched = set()
         table_b_matched = set()
         
+        # OUTER JOIN 처리를 위해 등장 순서대로 고유한 행 추적
+        unique_rows_a = []
+        unique_rows_b = []
+        seen_a = set()
+        seen_b = set()
+        # 지연 카르테시안 곱은 원본 테이블을 알고 있으므로 한쪽 테이블이 비어 곱에 조합이 없어도
+        # 다른 쪽 테이블의 일치하지 않는 행을 OUTER JOIN 결과에 포함할 수 있습니다
+        track_unique = not isinstance(cartesian_product, utils.CartesianProduct)
+        if not track_unique:
+            unique_rows_a = cartesian_product.table_a
+            unique_rows_b = cartesian_product.table_b
+        
         # 첫 번째 패스: 일치하는 행 식별 및 결합된 행 생성
-        for row_a, row_b in cartesian_product:
-            # 조인 키가 존재하고 일치하는지 확인
-            a_key_exists = key_a in row_a
-            b_key_exists = key_b in row_b
+        for pair_index, (row_a, row_b) in enumerate(cartesian_product):
+            if check_cancelled is not None and pair_index % CANCEL_CHECK_INTERVAL == 0:
+                check_cancelled()
+            if track_unique:
+                if id(row_a) not in seen_a:
+                    seen_a.add(id(row_a))
+                    unique_rows_a.append(row_a)
+                if id(row_b) not in seen_b:
+                    seen_b.add(id(row_b))
+                    unique_rows_b.append(row_b)
             
             # CROSS JOIN은 키에 관계없이 모든 조합을 포함합니다
             if join_type == "CROSS JOIN":
                 merged_row = {**row_a, **{f"B_{k}": v for k, v in row_b.items()}}
-                result.append((merged_row, True))  # All rows are considered "matched" in CROSS JOIN
+                yield (merged_row, True)  # All rows are considered "matched" in CROSS JOIN
                 table_a_matched.add(id(row_a))
                 table_b_matched.add(id(row_b))
                 continue
                 
-            if not a_key_exists or not b_key_exists:
-                continue
-                
-            keys_match = row_a[key_a] == row_b[key_b]
+            # 조인 키가 존재하고 정규화된 값이 일치하는지 확인
+            keys_match = normalizer.keys_match(row_a, key_a, row_b, key_b)
+            if stats is not None:
+                stats.comparisons += 1
             
             # CROSS를 제외한 모든 JOIN에 대해 키가 일치하는지 확인
             if keys_match:
                 merged_row = {**row_a, **{f"B_{k}": v for k, v in row_b.items()}}
-                result.append((merged_row, True))  # Matched row
+                yield (merged_row, True)  # Matched row
                 table_a_matched.add(id(row_a))
                 table_b_matched.add(id(row_b))
         
         # 두 번째 패스: OUTER JOIN의 일치하지 않는 행 처리
         if join_type in ["LEFT OUTER JOIN", "FULL OUTER JOIN"]:
-            # 테이블 A에서 고유한 행 가져오기
-            unique_rows_a, _ = utils.get_unique_rows(cartesian_product)
+            # B에 대해 NULL 값으로 채울 열은 첫 번째 B 행을 기준으로 합니다
+            sample_row_b = unique_rows_b[0] if unique_rows_b else {}
+            null_b = {f"B_{k}": None for k in sample_row_b}
             
             for row_a in unique_rows_a:
                 if id(row_a) not in table_a_matched:
                     # B에 대해 NULL 값으로 일치하지 않는 A의 행 추가
-                    sample_row_b = cartesian_product[0][1] if cartesian_product else {}
-                    null_b = {f"B_{k}": None for k, v in sample_row_b.items()}
                     merged_row = {**row_a, **null_b}
-                    result.append((merged_row, False))  # Unmatched row
+                    yield (merged_row, False)  # Unmatched row
         
         if join_type in ["RIGHT OUTER JOIN", "FULL OUTER JOIN"]:
-            # 테이블 B에서 고유한 행 가져오기
-            _, unique_rows_b = utils.get_unique_rows(cartesian_product)
+            # A에 대해 NULL 값으로 채울 열은 첫 번째 A 행을 기준으로 합니다
+            sample_row_a = unique_rows_a[0] if unique_rows_a else {}
+            null_a = {k: None for k in sample_row_a}
                     
             for row_b in unique_rows_b:
                 if id(row_b) not in table_b_matched:
                     # A에 대해 NULL 값으로 일치하지 않는 B의 행 추가
-                    sample_row_a = cartesian_product[0][0] if cartesian_product else {}
-                    null_a = {k: None for k, v in sample_row_a.items()}
                     b_data = {f"B_{k}": v for k, v in row_b.items()}
                     merged_row = {**null_a, **b_data}
-                    result.append((merged_row, False))  # Unmatched row
+                    yield (merged_row, False)  # Unmatched row
+    @staticmethod
+    def iter_index_nested_loop_join(table_a: List[Dict], table_b: List[Dict],
+                                    key_a: str, key_b: str, join_type: str,
+                                    normalizer: KeyNormalizer = None,
+                                    stats: JoinStats = None, check_cancelled=None) -> Iterator[Tuple[Dict, bool]]:
+        """
+        핵심 : 한쪽 테이블의 정렬 인덱스를 bisect로 탐색하는 인덱스 중첩 루프 JOIN을 한 행씩 생성합니다.
+        
+        인덱스는 join_index.INDEX_CACHE에 테이블별로 보관되므로, 큰 테이블이 바뀌지 않는 한
+        반복 실행 시 인덱스를 다시 만들지 않고 O(n log m)으로 JOIN합니다. 이미 캐시된 인덱스가 있으면
+        그 테이블을, 없으면 더 큰 테이블을 인덱스로 사용합니다.
+        일치한 행의 위치 쌍만 모은 뒤 병합된 행은 하나씩 만들며, 결과 순서는 filter_join_result와 같습니다.
+        
+        매개변수:
+            table_a: 테이블 A의 행 목록
+            table_b: 테이블 B의 행 목록
+            key_a: 테이블 A의 JOIN 키
+            key_b: 테이블 B의 JOIN 키
+            join_type: JOIN 유형 (INNER, LEFT OUTER, RIGHT OUTER, FULL OUTER, CROSS)
+            normalizer: JOIN 키 정규화 규칙 (기본값: 정규화 없음)
+            stats: bisect 탐색의 키 비교 횟수를 기록할 카운터 (선택)
+            check_cancelled: 탐색 CANCEL_CHECK_INTERVAL번마다 호출하여 취소되었으면 예외를 발생시키는 함수 (선택)
+            
+        반환값:
+            (병합된_행, 일치_여부) 튜플을 생성하는 이터레이터
+        """
+        normalizer = JoinEngine.resolve_normalizer(normalizer)
+        
+        if join_type == "CROSS JOIN":
+            yield from JoinEngine.iter_cross_join(table_a, table_b, check_cancelled)
+            return
+        
+        if INDEX_CACHE.has(table_b, key_b, normalizer):
+            index_b = True
+        elif INDEX_CACHE.has(table_a, key_a, normalizer):
+            index_b = False
+        else:
+            index_b = len(table_b) >= len(table_a)
+        
+        # 인덱스 쪽이 B이면 A의 각 행으로 B 인덱스를 탐색하고, 아니면 반대로 탐색합니다
+        if index_b:
+            index = INDEX_CACHE.get(table_b, key_b, normalizer)
+            probe_table, probe_key_name = table_a, key_a
+        else:
+            index = INDEX_CACHE.get(table_a, key_a, normalizer)
+            probe_table, probe_key_name = table_b, key_b
+        # bisect는 길이 m의 배열에서 약 log2(m)번 비교하며, 양쪽 경계를 찾기 위해 두 번 탐색합니다
+        probe_cost = 2 * max(1, len(index).bit_length())
+        
+        pairs = []
+        for probe_pos, row in enumerate(probe_table):
+            if check_cancelled is not None and probe_pos % CANCEL_CHECK_INTERVAL == 0:
+                check_cancelled()
+            if probe_key_name not in row:
+                continue
+            probe_value = normalizer.normalize(row[probe_key_name])
+            if utils.is_nan(probe_value):
+                continue
+            if stats is not None:
+                stats.comparisons += probe_cost
+            positions = index.probe(utils.sort_key(probe_value))
+            if index_b:
+                pairs.extend((probe_pos, pos_b) for pos_b in positions)
+            else:
+                pairs.extend((pos_a, probe_pos) for pos_a in positions)
+        if not index_b:
+            # 결과를 A 행 순서 -> B 행 순서로 정렬하여 중첩 루프와 같은 순서로 맞춤
+            pairs.sort()
+        
+        yield from JoinEngine.iter_merge_pairs(table_a, table_b, pairs, check_cancelled)
+        matched_a = {pos_a for pos_a, _ in pairs}
+        matched_b = {pos_b for _, pos_b in pairs}
+        yield from JoinEngine.null_extended_rows(table_a, table_b, matched_a, matched_b, join_type)
+    @staticmethod
+    def iter_hash_join(table_a: Iterable[Dict], table_b: List[Dict],
+                       key_a: str, key_b: str, join_type: str,
+                       normalizer: KeyNormalizer = None,
+                       stats: JoinStats = None, check_cancelled=None) -> Iterator[Tuple[Dict, bool]]:
+        """
+        핵심 : 테이블 B로 해시 테이블을 만들고 테이블 A의 각 행으로 탐색하는 해시 JOIN을 한 행씩 생성합니다.
+        
+        B의 해시 테이블만 메모리에 두고 A의 각 행을 탐색하면서 일치한 행을 바로 내보냅니다.
+        키는 정규화된 정수 코드로 해시되므로 같은 버킷의 행은 모두 일치하며,
+        행 쌍마다 키를 비교하지 않고 O(n + m)에 JOIN합니다. 결과 순서는 filter_join_result와 같습니다.
+        
+        매개변수:
+            table_a: 테이블 A의 행 (탐색 쪽이므로 한 번만 순회하는 이터러블도 가능)
+            table_b: 테이블 B의 행 목록 (해시 테이블을 만드는 쪽)
+            key_a: 테이블 A의 JOIN 키
+            key_b: 테이블 B의 JOIN 키
+            join_type: JOIN 유형 (INNER, LEFT OUTER, RIGHT OUTER, FULL OUTER, CROSS)
+            normalizer: JOIN 키 정규화 규칙 (기본값: 정규화 없음)
+            stats: 해시 테이블 삽입 및 조회 횟수를 기록할 카운터 (선택)
+            check_cancelled: 빌드/탐색 행 CANCEL_CHECK_INTERVAL개마다 호출하여 취소되었으면 예외를 발생시키는 함수 (선택)
+            
+        반환값:
+            (병합된_행, 일치_여부) 튜플을 생성하는 이터레이터
+        """
+        normalizer = JoinEngine.resolve_normalizer(normalizer)
+        
+        if join_type == "CROSS JOIN":
+            yield from JoinEngine.iter_cross_join(table_a, table_b, check_cancelled)
+            return
+        
+        # 빌드 단계: B의 키 코드 -> B 행 위치 목록
+        buckets = {}
+        for pos_b, row_b in enumerate(table_b):
+            if check_cancelled is not None and pos_b % CANCEL_CHECK_INTERVAL == 0:
+                check_cancelled()
+            code = normalizer.key_of(row_b, key_b)
+            if code is MISSING:
+                continue
+            buckets.setdefault(code, []).append(pos_b)
+            if stats is not None:
+                stats.hash_probes += 1
+        
+        # 탐색 단계: A의 각 행을 등장 순서대로 한 번씩 탐색
+        rows_a = []
+        matched_a = set()
+        matched_b = set()
+        for pos_a, row_a in enumerate(table_a):
+            if check_cancelled is not None and pos_a % CANCEL_CHECK_INTERVAL == 0:
+                check_cancelled()
+            rows_a.append(row_a)
+            code = normalizer.key_of(row_a, key_a)
+            if code is MISSING:
+                continue
+            if stats is not None:
+                stats.hash_probes += 1
+            bucket = buckets.get(code)
+            if not bucket:
+                continue
+            matched_a.add(pos_a)
+            for pos_b in bucket:
+                yield (JoinEngine.merge_rows(row_a, table_b[pos_b]), True)
+                matched_b.add(pos_b)
+        
+        yield from JoinEngine.null_extended_rows(rows_a, table_b, matched_a, matched_b, join_type)
+    @staticmethod
+    def iter_sort_merge_join(table_a: List[Dict], table_b: List[Dict],
+                             key_a: str, key_b: str, join_type: str,
+                             normalizer: KeyNormalizer = None,
+                             stats: JoinStats = None, check_cancelled=None) -> Iterator[Tuple[Dict, bool]]:
+        """
+        핵심 : 두 테이블을 키로 정렬한 뒤 두 포인터로 병합하는 정렬-병합 JOIN을 한 행씩 생성합니다.
+        
+        정렬에 O(n log n + m log m), 병합에 O(n + m)이 걸립니다. 일치한 행의 위치 쌍만 모은 뒤
+        병합된 행은 하나씩 만들며, 위치 쌍을 A 행 순서 -> B 행 순서로 다시 정렬하여
+        filter_join_result와 같은 순서로 반환합니다.
+        
+        매개변수:
+            table_a: 테이블 A의 행 목록
+            table_b: 테이블 B의 행 목록
+            key_a: 테이블 A의 JOIN 키
+            key_b: 테이블 B의 JOIN 키
+            join_type: JOIN 유형 (INNER, LEFT OUTER, RIGHT OUTER, FULL OUTER, CROSS)
+            normalizer: JOIN 키 정규화 규칙 (기본값: 정규화 없음)
+            stats: 병합 단계의 키 비교 횟수를 기록할 카운터 (정렬 단계의 비교는 포함하지 않음)
+            check_cancelled: 정렬 뒤와 병합 단계 CANCEL_CHECK_INTERVAL번마다 호출하여 취소되었으면 예외를 발생시키는 함수 (선택)
+            
+        반환값:
+            (병합된_행, 일치_여부) 튜플을 생성하는 이터레이터
+        """
+        normalizer = JoinEngine.resolve_normalizer(normalizer)
+        
+        if join_type == "CROSS JOIN":
+            yield from JoinEngine.iter_cross_join(table_a, table_b, check_cancelled)
+            return
+        
+        sorted_a = JoinEngine._sorted_keys(table_a, key_a, normalizer)
+        sorted_b = JoinEngine._sorted_keys(table_b, key_b, normalizer)
+        
+        # 병합 단계: 같은 키를 가진 구간끼리 모든 조합을 생성
+        pairs = []
+        i, j = 0, 0
+        comparisons = 0
+        steps = 0
+        while i < len(sorted_a) and j < len(sorted_b):
+            if check_cancelled is not None and steps % CANCEL_CHECK_INTERVAL == 0:
+                check_cancelled()
+            steps += 1
+            key_value_a = sorted_a[i][0]
+            key_value_b = sorted_b[j][0]
+            comparisons += 1
+            if key_value_a < key_value_b:
+                i += 1
+            elif key_value_a > key_value_b:
+                j += 1
+            else:
+                i_end = i + 1
+                while i_end < len(sorted_a) and sorted_a[i_end][0] == key_value_a:
+                    i_end += 1
+                    comparisons += 1
+                j_end = j + 1
+                while j_end < len(sorted_b) and sorted_b[j_end][0] == key_value_b:
+                    j_end += 1
+                    comparisons += 1
+                for _, pos_a in sorted_a[i:i_end]:
+                    for _, pos_b in sorted_b[j:j_end]:
+                        pairs.append((pos_a, pos_b))
+                i, j = i_end, j_end
+        
+        if stats is not None:
+            stats.comparisons += comparisons
+        
+        pairs.sort()
+        yield from JoinEngine.iter_merge_pairs(table_a, table_b, pairs, check_cancelled)
+        matched_a = {pos_a for pos_a, _ in pairs}
+        matched_b = {pos_b for _, pos_b in pairs}
+        yield from JoinEngine.null_extended_rows(table_a, table_b, matched_a, matched_b, join_type)
+    @staticmethod
+    def _sorted_keys(table: List[Dict], key: str, normalizer: KeyNormalizer) -> List[Tuple[Tuple, int]]:
+        """
+        핵심 : 정렬-병합 JOIN의 한쪽 입력인 (정렬 키, 행 위치) 목록을 정렬하여 반환합니다.
+        
+        키가 없거나 NaN인 행은 어떤 행과도 일치하지 않으므로 제외합니다. NaN은 순서가 없어
+        그대로 두면 병합 단계에서 이웃한 키와 같은 것으로 취급되어 병합이 어긋납니다.
+        """
+        values = ((pos, normalizer.normalize(row[key])) for pos, row in enumerate(table) if key in row)
+        return sorted((utils.sort_key(value), pos) for pos, value in values if not utils.is_nan(value))
+    @staticmethod
+    def join_with_strategy(strategy: str, table_a: List[Dict], table_b: List[Dict],
+                           key_a: str, key_b: str, join_type: str,
+                           normalizer: KeyNormalizer = None,
+                           cartesian_product: List[Tuple[Dict, Dict]] = None,
+                           stats: JoinStats = None, check_cancelled=None) -> List[Tuple[Dict, bool]]:
+        """
+        핵심 : 지정한 JOIN 알고리즘으로 JOIN 결과를 계산합니다.
+        
+        매개변수:
+            strategy: JOIN_STRATEGIES의 내부 전략 이름
+            table_a: 테이블 A의 행 목록
+            table_b: 테이블 B의 행 목록
+            key_a: 테이블 A의 JOIN 키
+            key_b: 테이블 B의 JOIN 키
+            join_type: JOIN 유형
+            normalizer: JOIN 키 정규화 규칙 (기본값: 정규화 없음)
+            cartesian_product: 중첩 루프 전략에서 재사용할 카르테시안 곱 (없으면 새로 계산)
+            stats: 작업량을 기록할 카운터 (선택)
+            check_cancelled: JOIN 루프에서 주기적으로 호출하여 취소되었으면 예외를 발생시키는 함수 (선택)
+            
+        반환값:
+            (병합된_행, 일치_여부) 튜플의 리스트
+        """
+        return list(JoinEngine.iter_join_with_strategy(strategy, table_a, table_b, key_a, key_b, join_type, normalizer,
+                                                       cartesian_product, stats, check_cancelled))
+    @staticmethod
+    def iter_join_with_strategy(strategy: str, table_a: List[Dict], table_b: List[Dict],
+                                key_a: str, key_b: str, join_type: str,
+                                normalizer: KeyNormalizer = None,
+                                cartesian_product: List[Tuple[Dict, Dict]] = None,
+                                stats: JoinStats = None, check_cancelled=None) -> Iterator[Tuple[Dict, bool]]:
+        """
+        핵심 : join_with_strategy와 같은 결과를 한 행씩 생성하는 스트리밍 버전입니다.
+        
+        집계처럼 JOIN 결과를 한 번만 순회하면 되는 경우 전체 결과 리스트를 만들지 않습니다.
+        매개변수는 join_with_strategy와 같습니다.
+        
+        예외:
+            ValueError: 알 수 없는 전략 이름인 경우 (첫 행을 요청하기 전에 발생)
+        """
+        if strategy == "index_nested_loop":
+            return JoinEngine.iter_index_nested_loop_join(table_a, table_b, key_a, key_b, join_type, normalizer,
+                                                          stats=stats, check_cancelled=check_cancelled)
+        if strategy == "hash":
+            return JoinEngine.iter_hash_join(table_a, table_b, key_a, key_b, join_type, normalizer, stats,
+                                             check_cancelled)
+        if strategy == "sort_merge":
+            return JoinEngine.iter_sort_merge_join(table_a, table_b, key_a, key_b, join_type, normalizer, stats,
+                                                   check_cancelled)
+        if strategy == "nested_loop":
+            if cartesian_product is None:
+                cartesian_product = utils.compute_cartesian_product(table_a, table_b)
+            return JoinEngine.iter_join_rows(cartesian_product, key_a, key_b, join_type, normalizer, stats,
+                                             check_cancelled)
+        raise ValueError(f"알 수 없는 JOIN 알고리즘입니다: {strategy}")
+    @staticmethod
+    def iter_cross_join(table_a: Iterable[Dict], table_b: List[Dict],
+                        check_cancelled=None) -> Iterator[Tuple[Dict, bool]]:
+        """
+        핵심 : CROSS JOIN 결과(모든 조합)를 A 행 순서 -> B 행 순서로 한 행씩 생성합니다.
+        
+        매개변수:
+            table_a: 테이블 A의 행
+            table_b: 테이블 B의 행 목록
+            check_cancelled: A 행마다 호출하여 취소되었으면 예외를 발생시키는 함수 (선택)
+            
+        반환값:
+            (병합된_행, True) 튜플을 생성하는 이터레이터
+        """
+        for row_a in table_a:
+            if check_cancelled is not None:
+                check_cancelled()
+            for row_b in table_b:
+                yield (JoinEngine.merge_rows(row_a, row_b), True)
+    @staticmethod
+    def iter_merge_pairs(table_a: List[Dict], table_b: List[Dict], pairs: List[Tuple[int, int]],
+                         check_cancelled=None) -> Iterator[Tuple[Dict, bool]]:
+        """
+        핵심 : (A 행 위치, B 행 위치) 쌍 목록을 일치한 결과 행으로 하나씩 병합합니다.
         
+        매개변수:
+            table_a: 테이블 A의 행 목록
+            table_b: 테이블 B의 행 목록
+            pairs: 일치한 행 위치 쌍 목록
+            check_cancelled: 쌍 CANCEL_CHECK_INTERVAL개마다 호출하여 취소되었으면 예외를 발생시키는 함수 (선택)
+            
+        반환값:
+            (병합된_행, True) 튜플을 생성하는 이터레이터
+        """
+        for position, (pos_a, pos_b) in enumerate(pairs):
+            if check_cancelled is not None and position % CANCEL_CHECK_INTERVAL == 0:
+                check_cancelled()
+            yield (JoinEngine.merge_rows(table_a[pos_a], table_b[pos_b]), True)
+    @staticmethod
+    def merge_rows(row_a: Dict[str, Any], row_b: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        핵심 : A 행과 B 행을 하나의 결과 행으로 병합합니다. B의 열 이름에는 "B_" 접두사가 붙습니다.
+        """
+        return {**row_a, **{f"B_{k}": v for k, v in row_b.items()}}
+    @staticmethod
+    def null_extended_rows(table_a: List[Dict], table_b: List[Dict],
+                           matched_a: Set[int], matched_b: Set[int], join_type: str) -> List[Tuple[Dict, bool]]:
+        """
+        핵심 : OUTER JOIN에서 일치하지 않은 행을 NULL 값으로 채운 결과 행을 생성합니다.
+        
+        매개변수:
+            table_a: 테이블 A의 행 목록
+            table_b: 테이블 B의 행 목록
+            matched_a: 일치한 A 행의 위치 세트
+            matched_b: 일치한 B 행의 위치 세트
+            join_type: JOIN 유형
+            
+        반환값:
+            (NULL로 채운 행, False) 튜플의 리스트
+        """
+        result = []
+        if join_type in ["LEFT OUTER JOIN", "FULL OUTER JOIN"]:
+            null_b = {f"B_{k}": None for k in (table_b[0] if table_b else {})}
+            for pos_a, row_a in enumerate(table_a):
+                if pos_a not in matched_a:
+                    result.append(({**row_a, **null_b}, False))
+        
+        if join_type in ["RIGHT OUTER JOIN", "FULL OUTER JOIN"]:
+            null_a = {k: None for k in (table_a[0] if table_a else {})}
+            for pos_b, row_b in enumerate(table_b):
+                if pos_b not in matched_b:
+                    result.append(({**null_a, **{f"B_{k}": v for k, v in row_b.items()}}, False))
         return result
     @staticmethod
+    def resolve_normalizer(normalizer: KeyNormalizer = None) -> KeyNormalizer:
+        """
+        핵심 : 정규화 규칙이 지정되지 않은 경우 원본 값을 그대로 비교하는 기본 규칙을 반환합니다.
+        
+        매개변수:
+            normalizer: JOIN 키 정규화 규칙 또는 None
+            
+        반환값:
+            사용할 KeyNormalizer
+        """
+        return normalizer if normalizer is not None else KeyNormalizer()
+    @staticmethod
+    def keys_match(row_a: Dict[str, Any], row_b: Dict[str, Any], key_a: str, key_b: str,
+                   normalizer: KeyNormalizer = None) -> bool:
+        """
+        핵심 : 두 행의 JOIN 키가 존재하고 정규화된 값이 일치하는지 확인합니다.
+        
+        모든 엔진과 뷰는 직접 값을 비교하지 않고 이 메서드를 사용하여
+        같은 정규화 규칙과 캐시를 공유합니다.
+        
+        매개변수:
+            row_a: 테이블 A의 행
+            row_b: 테이블 B의 행
+            key_a: 테이블 A의 JOIN 키
+            key_b: 테이블 B의 JOIN 키
+            normalizer: JOIN 키 정규화 규칙 (기본값: 정규화 없음)
+            
+        반환값:
+            키가 일치하면 True
+        """
+        return JoinEngine.resolve_normalizer(normalizer).keys_match(row_a, key_a, row_b, key_b)
+    @staticmethod
     def identify_matched_rows(cartesian_product: List[Tuple[Dict, Dict]], 
-                            key_a: str, key_b: str) -> Tuple[Set[int], Set[int]]:
+                            key_a: str, key_b: str,
+                            normalizer: KeyNormalizer = None) -> Tuple[Set[int], Set[int]]:
         """
         핵심 : 테이블 A와 B에서 키가 일치하는 행을 식별합니다.
         
@@ -96,22 +537,25 @@ class JoinEngine:
             cartesian_product: 카르테시안 곱에서 생성된 튜플 리스트
             key_a: 테이블 A의 JOIN 키
             key_b: 테이블 B의 JOIN 키
+            normalizer: JOIN 키 정규화 규칙 (기본값: 정규화 없음)
             
         반환값:
             (일치하는_A_행_ID, 일치하는_B_행_ID) 세트 튜플
         """
+        normalizer = JoinEngine.resolve_normalizer(normalizer)
         matched_a_ids = set()
         matched_b_ids = set()
         
         for row_a, row_b in cartesian_product:
-            if key_a in row_a and key_b in row_b and row_a[key_a] == row_b[key_b]:
+            if normalizer.keys_match(row_a, key_a, row_b, key_b):
                 matched_a_ids.add(id(row_a))
                 matched_b_ids.add(id(row_b))
                 
         return matched_a_ids, matched_b_ids
     @staticmethod
     def get_match_explanation(row_a: Dict[str, Any], row_b: Dict[str, Any], 
-                           key_a: str, key_b: str, join_type: str) -> str:
+                           key_a: str, key_b: str, join_type: str,
+                           normalizer: KeyNormalizer = None) -> str:
         """
         핵심 : 특정 행 쌍이 일치하는지 여부에 대한 설명을 생성합니다.
         
@@ -121,6 +565,7 @@ class JoinEngine:
             key_a: 테이블 A의 JOIN 키
             key_b: 테이블 B의 JOIN 키
             join_type: JOIN 유형
+            normalizer: JOIN 키 정규화 규칙 (기본값: 정규화 없음)
             
         반환값:
             일치 상태에 대한 설명 문자열
@@ -141,7 +586,9 @@ class JoinEngine:
             return explanation
         
         # 키가 일치하는지 확인
-        if row_a[key_a] == row_b[key_b]:
-            return f"키가 일치합니다: {key_a}={row_a[key_a]}는 {key_b}={row_b[key_b]}와 같습니다."
+        normalizer = JoinEngine.resolve_normalizer(normalizer)
+        rule_note = "" if normalizer.is_identity else f" (정규화 규칙: {normalizer.describe()})"
+        if normalizer.keys_match(row_a, key_a, row_b, key_b):
+            return f"키가 일치합니다: {key_a}={row_a[key_a]}는 {key_b}={row_b[key_b]}와 같습니다.{rule_note}"
         else:
-            return f"키가 일치하지 않습니다: {key_a}={row_a[key_a]}는 {key_b}={row_b[key_b]}와 같지 않습니다."
\ No newline at end of file
+            return f"키가 일치하지 않습니다: {key_a}={row_a[key_a]}는 {key_b}={row_b[key_b]}와 같지 않습니다.{rule_note}"
\ No newline at end of file
@@ -0,0 +1,183 @@
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import List, Dict, Any, Tuple
+
+import utils
+from key_normalization import KeyNormalizer
+
+
+class SortedIndex:
+    """
+    핵심: 한 테이블의 JOIN 키에 대한 B-트리와 유사한 정렬 인덱스입니다.
+
+    정렬된 키 배열과 같은 순서의 행 위치 배열로 구성되며, bisect로 탐색하므로
+    O(log m)에 키가 같은 행 위치를 찾을 수 있습니다.
+    키가 없거나 NaN인 행은 어떤 키와도 일치하지 않으므로 인덱스에 넣지 않습니다.
+    """
+    def __init__(self, table: List[Dict[str, Any]], key: str, normalizer: KeyNormalizer):
+        """
+        핵심: 테이블의 키 값을 정렬하여 인덱스를 생성합니다.
+
+        매개변수:
+            table: 인덱스를 만들 테이블
+            key: 인덱스 키 이름
+            normalizer: 키 값에 적용할 정규화 규칙
+        """
+        self.key = key
+        self.row_count = len(table)
+
+        # (정렬 키, 행 위치) 순으로 정렬하여 같은 키 안에서는 원래 행 순서를 유지합니다.
+        # NaN은 순서가 없어 정렬과 bisect를 망가뜨리므로 제외합니다
+        entries = sorted(
+            (utils.sort_key(value), position)
+            for position, value in (
+                (position, normalizer.normalize(row[key])) for position, row in enumerate(table) if key in row
+            )
+            if not utils.is_nan(value)
+        )
+        self.keys = [entry[0] for entry in entries]
+        self.positions = [entry[1] for entry in entries]
+
+    @classmethod
+    def from_arrays(cls, key: str, row_count: int, keys: List[Tuple], positions: List[int]) -> "SortedIndex":
+        """
+        핵심: 이미 정렬된 키 배열과 행 위치 배열로 인덱스를 복원합니다. 다시 정렬하지 않습니다.
+
+        매개변수:
+            key: 인덱스 키 이름
+            row_count: 인덱스를 만든 테이블의 행 수
+            keys: utils.sort_key로 만든 정렬된 키 배열
+            positions: keys와 같은 순서의 행 위치 배열
+
+        반환값:
+            복원된 SortedIndex
+        """
+        index = cls.__new__(cls)
+        index.key = key
+        index.row_count = row_count
+        index.keys = keys
+        index.positions = positions
+        return index
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def probe(self, probe_key: Tuple) -> List[int]:
+        """
+        핵심: 키가 탐색 키와 같은 인덱스 행 위치를 찾습니다.
+
+        매개변수:
+            probe_key: utils.sort_key로 만든 탐색 키
+
+        반환값:
+            키가 같은 행 위치 목록 (행 순서대로 정렬됨)
+        """
+        low = bisect_left(self.keys, probe_key)
+        high = bisect_right(self.keys, probe_key)
+        return self.positions[low:high]
+
+
+class IndexCache:
+    """
+    핵심: 테이블별로 생성한 SortedIndex를 재사용하기 위한 LRU 캐시입니다.
+
+    작은 테이블만 바뀌고 큰 테이블은 그대로인 반복 JOIN에서 큰 테이블의 인덱스를
+    매번 다시 정렬하지 않도록 합니다. 캐시 항목은 테이블 참조를 함께 보관하므로
+    id 재사용으로 다른 테이블의 인덱스를 잘못 돌려주는 일이 없습니다.
+    JOIN 계산이 작업 스레드에서 실행되므로 캐시 조작은 잠금으로 보호됩니다.
+    """
+    def __init__(self, max_entries: int = 8):
+        """
+        핵심: 인덱스 캐시를 초기화합니다.
+
+        매개변수:
+            max_entries: 보관할 최대 인덱스 수
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # 캐시 키 -> (테이블, SortedIndex)
+        self._lock = threading.RLock()
+
+    def get(self, table: List[Dict[str, Any]], key: str, normalizer: KeyNormalizer) -> SortedIndex:
+        """
+        핵심: 테이블과 키에 대한 인덱스를 반환합니다. 캐시에 없으면 새로 생성합니다.
+
+        매개변수:
+            table: 인덱스를 만들 테이블
+            key: 인덱스 키 이름
+            normalizer: 키 값에 적용할 정규화 규칙
+
+        반환값:
+            테이블의 SortedIndex
+        """
+        cache_key = (id(table), len(table), key, normalizer.rules)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[0] is table:
+                self._entries.move_to_end(cache_key)
+                return entry[1]
+
+        # 정렬은 잠금 밖에서 수행하여 다른 스레드의 캐시 조회를 막지 않습니다
+        index = SortedIndex(table, key, normalizer)
+        self.put(table, key, normalizer, index)
+        return index
+
+    def put(self, table: List[Dict[str, Any]], key: str, normalizer: KeyNormalizer, index: SortedIndex):
+        """
+        핵심: 이미 만들어진 인덱스를 캐시에 등록합니다.
+
+        매개변수:
+            table: 인덱스 대상 테이블
+            key: 인덱스 키 이름
+            normalizer: 인덱스 생성에 사용한 정규화 규칙
+            index: 등록할 SortedIndex
+        """
+        cache_key = (id(table), len(table), key, normalizer.rules)
+        with self._lock:
+            self._entries[cache_key] = (table, index)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def has(self, table: List[Dict[str, Any]], key: str, normalizer: KeyNormalizer) -> bool:
+        """
+        핵심: 테이블과 키에 대한 인덱스가 캐시에 있는지 확인합니다.
+        """
+        with self._lock:
+            entry = self._entries.get((id(table), len(table), key, normalizer.rules))
+        return entry is not None and entry[0] is table
+
+    def discard(self, table: List[Dict[str, Any]], key: str, normalizer: KeyNormalizer):
+        """
+        핵심: 테이블과 키에 대한 인덱스를 캐시에서 제거합니다. 없으면 아무 일도 하지 않습니다.
+        """
+        with self._lock:
+            self._entries.pop((id(table), len(table), key, normalizer.rules), None)
+
+    def indexes_for(self, table: List[Dict[str, Any]]) -> List[Tuple[tuple, SortedIndex]]:
+        """
+        핵심: 테이블에 대해 캐시된 모든 인덱스를 반환합니다.
+
+        매개변수:
+            table: 인덱스 대상 테이블
+
+        반환값:
+            (정규화 규칙 튜플, SortedIndex) 목록
+        """
+        with self._lock:
+            return [
+                (cache_key[3], index)
+                for cache_key, (cached_table, index) in self._entries.items()
+                if cached_table is table
+            ]
+
+    def clear(self):
+        """
+        핵심: 캐시된 모든 인덱스를 제거합니다.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+# 애플리케이션 전체에서 공유하는 인덱스 캐시
+INDEX_CACHE = IndexCache()
@@ -0,0 +1,147 @@
+import re
+from typing import List, Dict, Any
+
+from encoding import DictionaryEncoder
+
+
+# 행에 JOIN 키가 없음을 나타내는 표식 (None은 JSON의 null 값이므로 구분이 필요합니다)
+MISSING = object()
+
+_INT_PATTERN = re.compile(r"^[+-]?\d+$")
+_FLOAT_PATTERN = re.compile(r"^[+-]?(\d+\.\d*|\.\d+|\d+)([eE][+-]?\d+)?$")
+
+
+class KeyNormalizer:
+    """
+    핵심: JOIN 키 값을 비교 가능한 형태로 정규화하고 행별로 캐시하는 클래스입니다.
+
+    혼합된 JSON 소스에서 1, "1", 1.0 처럼 표현만 다른 키가 서로 일치하도록
+    설정 가능한 변환 규칙을 적용합니다. 각 행의 키는 처음 조회될 때 한 번만 정규화되어
+    두 테이블이 공유하는 키 딕셔너리의 정수 코드로 캐시되고,
+    이후 모든 엔진과 뷰는 이 정수 코드를 비교합니다.
+    """
+    def __init__(self, coerce_numeric: bool = False, casefold: bool = False, strip_whitespace: bool = False):
+        """
+        핵심: 정규화 규칙을 설정합니다.
+
+        매개변수:
+            coerce_numeric: 숫자 형태의 문자열을 숫자로 변환할지 여부
+            casefold: 문자열의 대소문자를 무시할지 여부
+            strip_whitespace: 문자열 앞뒤 공백을 제거할지 여부
+        """
+        self.coerce_numeric = coerce_numeric
+        self.casefold = casefold
+        self.strip_whitespace = strip_whitespace
+        self.key_dictionary = DictionaryEncoder()  # 정규화된 키 값 -> 두 테이블 공통 코드
+        self._cache = {}  # (id(행), 키) -> (행, 키 코드)
+
+    @property
+    def rules(self) -> tuple:
+        """
+        핵심: 정규화 규칙 설정을 캐시 키로 사용할 수 있는 튜플로 반환합니다.
+        """
+        return (self.coerce_numeric, self.casefold, self.strip_whitespace)
+
+    @property
+    def is_identity(self) -> bool:
+        """
+        핵심: 적용할 변환 규칙이 하나도 없는지 여부를 반환합니다.
+        """
+        return not (self.coerce_numeric or self.casefold or self.strip_whitespace)
+
+    def normalize(self, value: Any) -> Any:
+        """
+        핵심: 단일 키 값에 정규화 규칙을 적용합니다.
+
+        매개변수:
+            value: 원본 키 값
+
+        반환값:
+            정규화된 키 값
+        """
+        if not isinstance(value, str):
+            return value
+
+        if self.strip_whitespace:
+            value = value.strip()
+        if self.casefold:
+            value = value.casefold()
+        if self.coerce_numeric:
+            text = value.strip()
+            if _INT_PATTERN.match(text):
+                return int(text)
+            if _FLOAT_PATTERN.match(text):
+                return float(text)
+        return value
+
+    def key_of(self, row: Dict[str, Any], key: str) -> Any:
+        """
+        핵심: 행의 정규화된 JOIN 키 코드를 반환합니다. 결과는 행별로 캐시됩니다.
+
+        매개변수:
+            row: 테이블의 행
+            key: JOIN 키 이름
+
+        반환값:
+            정규화된 키 값의 정수 코드, 행에 키가 없으면 MISSING
+        """
+        cache_key = (id(row), key)
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] is row:
+            return cached[1]
+
+        if key not in row:
+            code = MISSING
+        else:
+            code = self.key_dictionary.encode(self.normalize(row[key]))
+
+        # 행 참조를 함께 저장하여 id 재사용으로 인한 잘못된 캐시 적중을 막습니다
+        self._cache[cache_key] = (row, code)
+        return code
+
+    def codes_for(self, table: List[Dict[str, Any]], key: str) -> List[Any]:
+        """
+        핵심: 테이블의 모든 행에 대한 키 코드를 행 순서대로 반환합니다.
+
+        매개변수:
+            table: 테이블 행 목록
+            key: JOIN 키 이름
+
+        반환값:
+            행별 키 코드 목록 (키가 없는 행은 MISSING)
+        """
+        return [self.key_of(row, key) for row in table]
+
+    def keys_match(self, row_a: Dict[str, Any], key_a: str, row_b: Dict[str, Any], key_b: str) -> bool:
+        """
+        핵심: 두 행의 정규화된 JOIN 키가 일치하는지 확인합니다.
+
+        매개변수:
+            row_a: 테이블 A의 행
+            key_a: 테이블 A의 JOIN 키
+            row_b: 테이블 B의 행
+            key_b: 테이블 B의 JOIN 키
+
+        반환값:
+            두 키가 모두 존재하고 정규화된 값이 같으면 True
+        """
+        value_a = self.key_of(row_a, key_a)
+        if value_a is MISSING:
+            return False
+        value_b = self.key_of(row_b, key_b)
+        if value_b is MISSING:
+            return False
+        return value_a == value_b
+
+    def describe(self) -> str:
+        """
+        핵심: 적용 중인 정규화 규칙을 사람이 읽을 수 있는 문자열로 반환합니다.
+        """
+        rules = []
+        if self.coerce_numeric:
+            rules.append("숫자 문자열→숫자")
+        if self.casefold:
+            rules.append("대소문자 무시")
+        if self.strip_whitespace:
+            rules.append("공백 제거")
+        return ", ".join(rules) if rules else "정규화 없음"
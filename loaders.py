@@ -0,0 +1,275 @@
+import codecs
+import csv
+import json
+import mmap
+import os
+import re
+from typing import List, Dict, Any, Iterator, Callable, Optional
+
+import utils
+
+
+# 열 타입 추론에 사용할 표본 행 수
+TYPE_SAMPLE_SIZE = 200
+
+# 로드 진행 상황을 보고하는 행 간격
+LOAD_PROGRESS_INTERVAL = 5000
+
+# 확장자 -> 파일 형식
+FILE_FORMATS = {
+    ".csv": "csv",
+    ".tsv": "tsv",
+    ".tab": "tsv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".json": "json",
+}
+
+_BOOL_VALUES = {"true": True, "false": False}
+
+# 숫자로 추론하는 값의 형식. 앞자리 0("007")이나 밑줄("1_000")이 있는 값은 ID나 우편번호처럼
+# 문자열 그대로 비교해야 하는 값일 수 있고, "nan"/"inf"는 JOIN 키로 쓸 수 없으므로 숫자로 보지 않습니다
+_INT_PATTERN = re.compile(r"^[+-]?(0|[1-9]\d*)$")
+_FLOAT_PATTERN = re.compile(r"^[+-]?((0|[1-9]\d*)(\.\d*)?|\.\d+)([eE][+-]?\d+)?$")
+
+
+def _iter_mmap_lines(mapped: mmap.mmap, encoding: str = "utf-8") -> Iterator[str]:
+    """
+    핵심: 메모리 매핑된 파일에서 줄을 하나씩 디코딩하여 반환합니다.
+
+    매개변수:
+        mapped: 읽기 전용으로 매핑된 파일
+        encoding: 파일 인코딩
+
+    반환값:
+        줄바꿈 문자를 포함한 문자열 줄 이터레이터
+    """
+    first = True
+    for raw_line in iter(mapped.readline, b""):
+        line = raw_line.decode(encoding)
+        if first:
+            line = line.lstrip("\ufeff")  # UTF-8 BOM 제거
+            first = False
+        yield line
+
+
+def _infer_converter(samples: List[str]) -> Callable[[str], Any]:
+    """
+    핵심: 표본 값을 보고 열의 타입 변환 함수를 추론합니다.
+
+    표본의 모든 비어 있지 않은 값이 정수면 int, 실수면 float, true/false면 bool,
+    그 외에는 문자열로 판단합니다. 빈 값은 항상 None(NULL)으로 변환됩니다.
+    숫자는 _INT_PATTERN/_FLOAT_PATTERN 형식만 인정하므로 "007" 같은 값이 있는 열은 문자열로 남습니다.
+
+    매개변수:
+        samples: 열의 표본 문자열 값 목록
+
+    반환값:
+        문자열 하나를 받아 변환된 값을 반환하는 함수
+    """
+    values = [value.strip() for value in samples if value.strip()]
+
+    def all_parse(parse):
+        try:
+            for value in values:
+                parse(value)
+            return True
+        except ValueError:
+            return False
+
+    def parse_int(value):
+        if not _INT_PATTERN.match(value):
+            raise ValueError(value)
+        return int(value)
+
+    def parse_float(value):
+        if not _FLOAT_PATTERN.match(value):
+            raise ValueError(value)
+        return float(value)
+
+    def parse_bool(value):
+        lowered = value.lower()
+        if lowered not in _BOOL_VALUES:
+            raise ValueError(value)
+        return _BOOL_VALUES[lowered]
+
+    if values and all_parse(parse_int):
+        parse = parse_int
+    elif values and all_parse(parse_float):
+        parse = parse_float
+    elif values and all_parse(parse_bool):
+        parse = parse_bool
+    else:
+        return lambda value: value if value != "" else None
+
+    def convert(value):
+        stripped = value.strip()
+        if not stripped:
+            return None
+        try:
+            return parse(stripped)
+        except ValueError:
+            return value  # 표본 이후에 다른 타입이 나오면 원본 문자열을 유지합니다
+
+    return convert
+
+
+def iter_delimited_rows(lines: Iterator[str], delimiter: str,
+                        sample_size: int = TYPE_SAMPLE_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    핵심: 구분자로 나뉜 텍스트(CSV/TSV)를 행 딕셔너리로 변환합니다.
+
+    첫 줄을 열 이름으로 사용하고, 처음 sample_size개 행으로 열 타입을 추론한 뒤
+    나머지 행은 읽는 즉시 변환하여 반환합니다.
+
+    매개변수:
+        lines: 텍스트 줄 이터레이터
+        delimiter: 열 구분자
+        sample_size: 타입 추론에 사용할 표본 행 수
+
+    반환값:
+        행 딕셔너리 이터레이터
+    """
+    reader = csv.reader(lines, delimiter=delimiter)
+    header = next(reader, None)
+    if not header:
+        return
+    header = [name.strip() for name in header]
+
+    sample = []
+    for record in reader:
+        if record:
+            sample.append(record)
+        if len(sample) >= sample_size:
+            break
+
+    converters = [
+        _infer_converter([record[i] for record in sample if i < len(record)])
+        for i in range(len(header))
+    ]
+
+    def to_row(record):
+        return {
+            name: converters[i](record[i]) if i < len(record) else None
+            for i, name in enumerate(header)
+        }
+
+    for record in sample:
+        yield to_row(record)
+    for record in reader:
+        if record:
+            yield to_row(record)
+
+
+def iter_json_lines_rows(lines: Iterator[str]) -> Iterator[Dict[str, Any]]:
+    """
+    핵심: JSON Lines 텍스트의 각 줄을 행 딕셔너리로 파싱합니다.
+
+    매개변수:
+        lines: 텍스트 줄 이터레이터
+
+    반환값:
+        행 딕셔너리 이터레이터
+
+    예외:
+        ValueError: 줄이 JSON 객체가 아닌 경우
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{line_number}번째 줄 파싱 오류: {e.msg}")
+        if not isinstance(row, dict):
+            raise ValueError(f"{line_number}번째 줄이 JSON 객체가 아닙니다.")
+        yield row
+
+
+def detect_format(path: str) -> str:
+    """
+    핵심: 파일 확장자로 테이블 파일 형식을 판단합니다.
+
+    매개변수:
+        path: 파일 경로
+
+    반환값:
+        "csv", "tsv", "jsonl", "json" 중 하나
+
+    예외:
+        ValueError: 지원하지 않는 확장자인 경우
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FILE_FORMATS:
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {extension or '(확장자 없음)'}")
+    return FILE_FORMATS[extension]
+
+
+def load_table_file(path: str, table_encoder=None,
+                    progress_callback: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
+    """
+    핵심: CSV, TSV, JSON Lines 또는 JSON 배열 파일을 메모리 매핑으로 읽어 테이블로 변환합니다.
+
+    파일 전체를 문자열로 읽지 않고 mmap 위에서 줄 단위로 토큰화하므로
+    큰 파일도 텍스트 위젯을 거치지 않고 JOIN 엔진이 사용하는 행 목록으로 바로 로드됩니다.
+
+    매개변수:
+        path: 파일 경로
+        table_encoder: 문자열 값을 열별 딕셔너리로 인코딩할 encoding.TableEncoder (선택)
+        progress_callback: (로드된 행 수, 읽은 바이트 수)를 받는 진행 상황 콜백 (선택)
+
+    반환값:
+        행 딕셔너리 목록
+
+    예외:
+        ValueError: 지원하지 않는 형식이거나 내용을 파싱할 수 없는 경우
+    """
+    file_format = detect_format(path)
+
+    if os.path.getsize(path) == 0:
+        return []  # 빈 파일은 매핑할 수 없습니다
+
+    rows = []
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        lines = _iter_mmap_lines(mapped)
+        if file_format == "csv":
+            row_iter = iter_delimited_rows(lines, ",")
+        elif file_format == "tsv":
+            row_iter = iter_delimited_rows(lines, "\t")
+        elif file_format == "jsonl":
+            row_iter = iter_json_lines_rows(lines)
+        else:
+            row_iter = utils.iter_table_rows(_MmapTextReader(mapped))
+
+        for row in row_iter:
+            if table_encoder is not None:
+                table_encoder.encode_row(row)
+            rows.append(row)
+            if progress_callback is not None and len(rows) % LOAD_PROGRESS_INTERVAL == 0:
+                progress_callback(len(rows), mapped.tell())
+
+        if progress_callback is not None:
+            progress_callback(len(rows), mapped.tell())
+    return rows
+
+
+class _MmapTextReader:
+    """
+    핵심: 메모리 매핑된 파일을 utils.iter_table_rows가 읽을 수 있는 텍스트 스트림으로 감쌉니다.
+    """
+    def __init__(self, mapped: mmap.mmap, encoding: str = "utf-8"):
+        self.mapped = mapped
+        self.decoder = codecs.getincrementaldecoder(encoding)()
+        self.first = True
+
+    def read(self, size: int) -> str:
+        # 조각이 멀티바이트 문자 중간에서 끝나 빈 문자열이 되면 파일 끝으로 오인하지 않도록 더 읽습니다
+        while True:
+            data = self.mapped.read(size)
+            text = self.decoder.decode(data, final=not data)
+            if text or not data:
+                break
+        if self.first and text:
+            text = text.lstrip("\ufeff")
+            self.first = False
+        return text
@@ -78,6 +78,71 @@ class JoinResult:
         return len(self.joined_rows) - self.matched_count
 
 
+class JoinStats:
+    """
+    핵심: JOIN 알고리즘이 수행한 작업량을 세는 카운터입니다.
+    """
+    def __init__(self):
+        self.comparisons = 0  # 키 비교 횟수
+        self.hash_probes = 0  # 해시 테이블 삽입 및 조회 횟수
+
+
+class AlgorithmRunResult:
+    """
+    핵심: 알고리즘 비교 모드에서 한 JOIN 알고리즘의 실행 결과를 저장하는 클래스입니다.
+    """
+    def __init__(self,
+                 name: str,
+                 seconds: float,
+                 stats: JoinStats,
+                 peak_memory_bytes: int,
+                 row_count: int,
+                 verified: bool,
+                 skipped: bool = False):
+        self.name = name
+        self.seconds = seconds  # 실행 시간 (초)
+        self.stats = stats
+        self.peak_memory_bytes = peak_memory_bytes
+        self.row_count = row_count  # JOIN 결과 행 수
+        self.verified = verified  # 기준(중첩 루프, 건너뛰었으면 첫 번째로 실행한 알고리즘) 결과와 같은지 여부
+        self.skipped = skipped  # 입력이 커서 실행하지 않았는지 여부 (이때 나머지 값은 의미 없음)
+
+
+class AggregateResult:
+    """
+    핵심: JOIN 결과에 대한 GROUP BY 집계 결과를 저장하는 클래스입니다.
+    """
+    def __init__(self,
+                 rows: List[Dict[str, Any]],
+                 group_by: List[str],
+                 aggregate_labels: List[str],
+                 input_row_count: int,
+                 join_type: str,
+                 key_a: str,
+                 key_b: str):
+        self.rows = rows  # 그룹별 결과 행
+        self.group_by = group_by
+        self.aggregate_labels = aggregate_labels
+        self.input_row_count = input_row_count  # 집계에 사용된 JOIN 결과 행 수
+        self.join_type = join_type
+        self.key_a = key_a
+        self.key_b = key_b
+
+    @property
+    def columns(self) -> List[str]:
+        """
+        핵심: 결과 테이블의 열 이름 목록을 반환합니다.
+        """
+        return list(self.group_by) + list(self.aggregate_labels)
+
+    @property
+    def group_count(self) -> int:
+        """
+        핵심: 그룹의 수를 반환합니다.
+        """
+        return len(self.rows)
+
+
 class ExampleData:
     """
     핵심: 테스트 및 시연을 위한 예제 데이터를 제공합니다.
@@ -0,0 +1,180 @@
+import math
+import random
+from itertools import islice
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+import utils
+
+
+# 미리보기 모드로 전환하는 카르테시안 곱 조합 수 기준 (표시 이름 -> 조합 수, None이면 전환하지 않음)
+PREVIEW_THRESHOLD_CHOICES = {
+    "10만 조합": 100_000,
+    "100만 조합": 1_000_000,
+    "1,000만 조합": 10_000_000,
+    "사용 안 함": None,
+}
+DEFAULT_PREVIEW_THRESHOLD = "100만 조합"
+
+# 행마다 항목을 만드는 위젯(입력 테이블 창, 애니메이션의 테이블)의 예상 항목 수 기준
+PREVIEW_WIDGET_THRESHOLD = 50_000
+
+# 미리보기에서 테이블마다 표본으로 뽑는 최대 행 수 (표본 곱은 최대 이 값의 제곱)
+PREVIEW_SAMPLE_ROWS = 300
+
+# 같은 입력이면 실행할 때마다 같은 표본이 나오도록 고정한 난수 시드
+PREVIEW_SEED = 0
+
+# reservoir_sample에서 순회가 끝났음을 나타내는 표식
+_END = object()
+
+
+def estimate_display_size(row_count_a: int, row_count_b: int) -> Tuple[int, int]:
+    """
+    핵심: 카르테시안 곱을 만들기 전에 곱의 크기와 화면에 만들어질 위젯 항목 수를 추정합니다.
+
+    카티션 곱, 결과, 설명 탭은 보이는 부분만 그리므로 항목 수는 테이블 행마다 항목을 만드는
+    입력 테이블 창과 애니메이션의 두 테이블만 셉니다.
+
+    매개변수:
+        row_count_a: 테이블 A의 행 수
+        row_count_b: 테이블 B의 행 수
+
+    반환값:
+        (조합 수, 예상 위젯 항목 수) 튜플
+    """
+    return row_count_a * row_count_b, 2 * (row_count_a + row_count_b)
+
+
+def needs_preview(row_count_a: int, row_count_b: int, pair_threshold: Optional[int]) -> bool:
+    """
+    핵심: 입력 크기가 기준을 넘어 미리보기 모드로 표시해야 하는지 여부를 반환합니다.
+
+    매개변수:
+        row_count_a: 테이블 A의 행 수
+        row_count_b: 테이블 B의 행 수
+        pair_threshold: 조합 수 기준, None이면 미리보기를 사용하지 않음
+
+    반환값:
+        조합 수나 예상 위젯 항목 수가 기준을 넘으면 True
+    """
+    if pair_threshold is None:
+        return False
+    pair_count, widget_count = estimate_display_size(row_count_a, row_count_b)
+    return pair_count > pair_threshold or widget_count > PREVIEW_WIDGET_THRESHOLD
+
+
+def _open_uniform(rng: random.Random) -> float:
+    """
+    핵심: (0, 1) 구간의 균등 난수를 반환합니다. 로그를 취할 수 있도록 0을 제외합니다.
+    """
+    value = rng.random()
+    while value == 0.0:
+        value = rng.random()
+    return value
+
+
+def reservoir_sample(items: Iterable[Any], k: int, rng: Optional[random.Random] = None) -> List[Any]:
+    """
+    핵심: 이터러블을 한 번만 순회하며 k개의 균등 표본을 뽑습니다 (Algorithm L).
+
+    저수지가 찬 뒤에는 다음으로 교체할 항목까지 건너뛸 개수를 기하 분포로 바로 뽑으므로
+    난수 생성 횟수가 전체 항목 수 N이 아니라 O(k log(N/k))입니다.
+
+    매개변수:
+        items: 표본을 뽑을 이터러블
+        k: 표본 크기
+        rng: 사용할 난수 생성기 (기본값: 새 random.Random)
+
+    반환값:
+        표본 항목 목록 (항목이 k개 이하이면 전체, 순서는 보장하지 않음)
+    """
+    if k <= 0:
+        return []
+    rng = rng or random.Random()
+    iterator = iter(items)
+    reservoir = list(islice(iterator, k))
+    if len(reservoir) < k:
+        return reservoir
+
+    weight = math.exp(math.log(_open_uniform(rng)) / k)
+    while True:
+        # weight가 부동소수점으로 1이 되면 건너뛸 개수를 계산할 수 없으므로 바로 다음 항목을 봅니다
+        skip = math.floor(math.log(_open_uniform(rng)) / math.log(1.0 - weight)) if weight < 1.0 else 0
+        next_item = next(islice(iterator, skip, None), _END)
+        if next_item is _END:
+            return reservoir
+        reservoir[rng.randrange(k)] = next_item
+        weight *= math.exp(math.log(_open_uniform(rng)) / k)
+
+
+def sample_rows(table: List[Dict], k: int, rng: Optional[random.Random] = None) -> List[Dict]:
+    """
+    핵심: 테이블에서 k개 행을 균등하게 뽑아 원래 순서대로 반환합니다.
+
+    매개변수:
+        table: 테이블 행 목록
+        k: 표본 행 수
+        rng: 사용할 난수 생성기 (선택)
+
+    반환값:
+        표본 행 목록 (행이 k개 이하이면 원래 테이블)
+    """
+    if len(table) <= k:
+        return table
+    return [table[index] for index in sorted(reservoir_sample(range(len(table)), k, rng))]
+
+
+class PreviewSample:
+    """
+    핵심: 미리보기 모드에서 화면 표시에 사용할 표본 테이블과 원래 입력 크기를 담습니다.
+
+    두 테이블에서 각각 행을 표본으로 뽑고 그 곱을 표본 조합으로 사용하므로, 카티션 곱,
+    설명, 히트맵, 애니메이션 탭이 같은 표본 조합을 일관되게 보여줍니다.
+    JOIN 결과는 원래 테이블 전체로 계산합니다.
+    """
+    def __init__(self, table_a: List[Dict], table_b: List[Dict], rows_per_table: int = PREVIEW_SAMPLE_ROWS,
+                 seed: int = PREVIEW_SEED):
+        """
+        핵심: 두 테이블에서 표본 행을 뽑습니다.
+
+        매개변수:
+            table_a: 테이블 A 전체 행 목록
+            table_b: 테이블 B 전체 행 목록
+            rows_per_table: 테이블마다 뽑을 최대 행 수
+            seed: 난수 시드
+        """
+        rng = random.Random(seed)
+        self.row_count_a = len(table_a)
+        self.row_count_b = len(table_b)
+        self.table_a = sample_rows(table_a, rows_per_table, rng)
+        self.table_b = sample_rows(table_b, rows_per_table, rng)
+        self.cartesian_product = utils.compute_cartesian_product(self.table_a, self.table_b)
+
+    @property
+    def pair_count(self) -> int:
+        """
+        핵심: 원래 입력의 전체 조합 수를 반환합니다.
+        """
+        return self.row_count_a * self.row_count_b
+
+    @property
+    def sample_pair_count(self) -> int:
+        """
+        핵심: 표본 조합 수를 반환합니다.
+        """
+        return len(self.cartesian_product)
+
+    @property
+    def sampling_ratio(self) -> float:
+        """
+        핵심: 전체 조합 중 표본 조합의 비율을 반환합니다.
+        """
+        return self.sample_pair_count / self.pair_count if self.pair_count else 1.0
+
+    def describe(self) -> str:
+        """
+        핵심: 표본 비율과 정확한 전체 크기를 한 줄로 설명합니다.
+        """
+        return (f"미리보기: 전체 {self.pair_count:,}개 조합 중 {self.sample_pair_count:,}개 표본 "
+                f"({self.sampling_ratio:.2%}) - 테이블 A {len(self.table_a):,}/{self.row_count_a:,}행, "
+                f"테이블 B {len(self.table_b):,}/{self.row_count_b:,}행")
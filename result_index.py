@@ -0,0 +1,207 @@
+from typing import List, Dict, Any, Tuple, Optional
+
+import utils
+
+
+# 검색어 입력 후 검색을 실행하기까지 기다리는 시간 (밀리초)
+SEARCH_DEBOUNCE_MS = 250
+
+
+def _search_text(value: Any) -> str:
+    """
+    핵심: 검색 비교에 사용할 값의 텍스트를 반환합니다. NULL은 빈 문자열입니다.
+    """
+    return "" if value is None else str(value).casefold()
+
+
+class ResultSearchIndex:
+    """
+    핵심: JOIN 결과의 열별 역색인으로 값 일치와 부분 문자열 검색을 수행합니다.
+
+    열마다 한 번만 결과 행을 훑어 "값 텍스트 -> 행 인덱스 목록"을 만들어 두므로,
+    값 일치 검색은 사전 조회 한 번이고 부분 문자열 검색도 전체 행이 아니라
+    서로 다른 값들만 확인합니다. 색인은 처음 검색하는 열에 대해서만 만들어집니다.
+    """
+    def __init__(self, join_result: List[Tuple[Dict[str, Any], bool]], columns: List[str]):
+        """
+        핵심: JOIN 결과에 대한 검색 색인을 준비합니다.
+
+        매개변수:
+            join_result: (행, 일치 여부) 튜플 목록
+            columns: 검색할 수 있는 열 이름 목록
+        """
+        self.join_result = join_result
+        self.columns = list(columns)
+        self._postings = {}  # 열 이름 -> {값 텍스트: 오름차순 행 인덱스 목록}
+
+    def is_indexed(self, column: Optional[str] = None) -> bool:
+        """
+        핵심: 열(None이면 모든 열)의 색인이 이미 만들어졌는지 여부를 반환합니다.
+        """
+        columns = self.columns if column is None else [column]
+        return all(name in self._postings for name in columns)
+
+    def build(self, check_cancelled=None):
+        """
+        핵심: 모든 열의 색인을 미리 만듭니다. 작업 스레드에서 호출할 수 있습니다.
+
+        매개변수:
+            check_cancelled: 열마다 호출하여 취소되었으면 예외를 발생시키는 함수 (선택)
+        """
+        for column in self.columns:
+            if check_cancelled is not None:
+                check_cancelled()
+            self._column_postings(column)
+
+    def _column_postings(self, column: str) -> Dict[str, List[int]]:
+        """
+        핵심: 열의 역색인을 반환하고, 없으면 결과 행을 한 번 훑어 만듭니다.
+        """
+        postings = self._postings.get(column)
+        if postings is None:
+            postings = {}
+            for index, (row, _) in enumerate(self.join_result):
+                text = _search_text(row.get(column))
+                bucket = postings.get(text)
+                if bucket is None:
+                    postings[text] = [index]
+                else:
+                    bucket.append(index)
+            self._postings[column] = postings
+        return postings
+
+    def search(self, query: str, column: Optional[str] = None, exact: bool = False) -> Optional[List[int]]:
+        """
+        핵심: 검색어와 일치하는 결과 행의 인덱스를 오름차순으로 반환합니다.
+
+        대소문자는 구분하지 않습니다.
+
+        매개변수:
+            query: 검색어
+            column: 검색할 열 이름, None이면 모든 열
+            exact: True면 값 전체가 같은 행, False면 값에 검색어가 포함된 행
+
+        반환값:
+            행 인덱스 목록, 검색어가 비어 있으면 None (필터 없음)
+        """
+        needle = query.strip().casefold()
+        if not needle:
+            return None
+
+        buckets = []
+        for name in (self.columns if column is None else [column]):
+            postings = self._column_postings(name)
+            if exact:
+                bucket = postings.get(needle)
+                if bucket:
+                    buckets.append(bucket)
+            else:
+                buckets.extend(bucket for text, bucket in postings.items() if needle in text)
+
+        if not buckets:
+            return []
+        if len(buckets) == 1:
+            return list(buckets[0])
+        if column is not None:
+            # 한 열의 값별 목록은 서로 겹치지 않으므로 이어 붙여 정렬만 합니다
+            return sorted(index for bucket in buckets for index in bucket)
+        return sorted(set().union(*buckets))
+
+
+class ResultSortOrder:
+    """
+    핵심: JOIN 결과의 열별 정렬 순열을 한 번만 계산해 캐시합니다.
+
+    열마다 utils.sort_key로 타입을 고려해 정렬하며, NULL은 오름차순과 내림차순 모두에서
+    마지막에 둡니다. 두 방향의 순열과 각 행의 순위를 함께 저장하므로 방향을 바꾸거나
+    다시 정렬하는 것은 캐시 조회이고, 검색으로 걸러진 행도 순위만으로 정렬할 수 있습니다.
+    """
+    def __init__(self, join_result: List[Tuple[Dict[str, Any], bool]]):
+        """
+        핵심: JOIN 결과에 대한 정렬 캐시를 준비합니다.
+
+        매개변수:
+            join_result: (행, 일치 여부) 튜플 목록
+        """
+        self.join_result = join_result
+        self._orders = {}  # (열 이름, 내림차순 여부) -> (순열, 행별 순위)
+
+    def is_cached(self, column: str) -> bool:
+        """
+        핵심: 열의 정렬 순열이 이미 계산되었는지 여부를 반환합니다.
+        """
+        return (column, False) in self._orders
+
+    def compute(self, column: str, check_cancelled=None):
+        """
+        핵심: 열의 오름차순/내림차순 순열과 행별 순위를 계산해 캐시합니다.
+
+        작업 스레드에서 호출할 수 있습니다. 이미 계산된 열이면 아무것도 하지 않습니다.
+
+        매개변수:
+            column: 정렬할 열 이름
+            check_cancelled: 취소되었으면 예외를 발생시키는 함수 (선택)
+        """
+        if self.is_cached(column):
+            return
+
+        values = [row.get(column) for row, _ in self.join_result]
+        keys = [utils.sort_key(value) for value in values]
+        nulls = [index for index, value in enumerate(values) if value is None]
+        present = [index for index, value in enumerate(values) if value is not None]
+        if check_cancelled is not None:
+            check_cancelled()
+
+        orders = {}
+        for descending in (False, True):
+            # sorted는 reverse=True에서도 안정 정렬이므로 같은 값은 원래 순서를 유지합니다
+            permutation = sorted(present, key=keys.__getitem__, reverse=descending) + nulls
+            ranks = [0] * len(permutation)
+            for position, index in enumerate(permutation):
+                ranks[index] = position
+            orders[(column, descending)] = (permutation, ranks)
+            if check_cancelled is not None:
+                check_cancelled()
+        self._orders.update(orders)
+
+    def permutation(self, column: str, descending: bool = False) -> List[int]:
+        """
+        핵심: 정렬된 순서의 결과 행 인덱스 목록을 반환합니다.
+
+        매개변수:
+            column: 정렬할 열 이름
+            descending: 내림차순 여부
+
+        반환값:
+            결과 행 인덱스 순열
+        """
+        self.compute(column)
+        return self._orders[(column, descending)][0]
+
+    def ranks(self, column: str, descending: bool = False) -> List[int]:
+        """
+        핵심: 결과 행 인덱스별로 정렬된 순서에서의 위치(순위)를 반환합니다.
+
+        매개변수:
+            column: 정렬할 열 이름
+            descending: 내림차순 여부
+
+        반환값:
+            ranks[행 인덱스] = permutation에서의 위치인 목록
+        """
+        self.compute(column)
+        return self._orders[(column, descending)][1]
+
+    def order_rows(self, row_indices: List[int], column: str, descending: bool = False) -> List[int]:
+        """
+        핵심: 일부 결과 행 인덱스를 열 기준 정렬 순서로 나열합니다.
+
+        매개변수:
+            row_indices: 정렬할 결과 행 인덱스 목록 (예: 검색 결과)
+            column: 정렬할 열 이름
+            descending: 내림차순 여부
+
+        반환값:
+            정렬된 결과 행 인덱스 목록
+        """
+        return sorted(row_indices, key=self.ranks(column, descending).__getitem__)
@@ -0,0 +1,271 @@
+import gc
+import hashlib
+import marshal
+import os
+import tempfile
+from typing import List, Dict, Any, Optional
+
+from join_index import INDEX_CACHE, SortedIndex
+from key_normalization import KeyNormalizer
+
+
+# 캐시 파일 형식 표식과 버전 (형식이 바뀌면 버전을 올려 이전 파일을 무효화합니다)
+CACHE_MAGIC = b"JVTC"
+CACHE_FORMAT_VERSION = 2
+
+# 기본 캐시 디렉터리와 최대 크기
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "JoinVisualizer")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# 이보다 짧은 입력 텍스트는 파싱이 충분히 빠르므로 캐시하지 않습니다
+MIN_CACHED_TEXT_LENGTH = 64 * 1024
+
+_TABLE_SUFFIX = ".table"
+_INDEX_SUFFIX = ".index"
+
+
+def text_digest(input_text: str) -> str:
+    """
+    핵심: 테이블 입력 텍스트의 내용 해시를 캐시 키로 반환합니다.
+
+    매개변수:
+        input_text: 테이블 입력 텍스트
+
+    반환값:
+        16진수 SHA-256 해시 문자열
+    """
+    hasher = hashlib.sha256(b"text\0")
+    hasher.update(input_text.encode("utf-8", "surrogatepass"))
+    return hasher.hexdigest()
+
+
+def file_digest(path: str) -> str:
+    """
+    핵심: 파일의 절대 경로, 수정 시각, 크기로 캐시 키를 만듭니다. 파일 내용은 읽지 않습니다.
+
+    매개변수:
+        path: 테이블 파일 경로
+
+    반환값:
+        16진수 SHA-256 해시 문자열
+    """
+    stat = os.stat(path)
+    identity = f"file\0{os.path.abspath(path)}\0{stat.st_mtime_ns}\0{stat.st_size}"
+    return hashlib.sha256(identity.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _pack_rows(table: List[Dict[str, Any]]) -> tuple:
+    """
+    핵심: 행 목록을 열 이름 스키마와 값 튜플로 나눠 압축된 형태로 변환합니다.
+
+    같은 열 구성을 가진 행들은 열 이름 튜플 하나를 공유하고 값만 저장합니다.
+    """
+    schema_ids = {}
+    schemas = []
+    packed = []
+    for row in table:
+        columns = tuple(row)
+        schema_id = schema_ids.get(columns)
+        if schema_id is None:
+            schema_id = len(schemas)
+            schema_ids[columns] = schema_id
+            schemas.append(columns)
+        packed.append((schema_id, tuple(row.values())))
+    return schemas, packed
+
+
+def _unpack_rows(schemas: list, packed: list) -> List[Dict[str, Any]]:
+    """
+    핵심: _pack_rows로 압축한 행을 딕셔너리 목록으로 되돌립니다.
+    """
+    return [dict(zip(schemas[schema_id], values)) for schema_id, values in packed]
+
+
+class TableCache:
+    """
+    핵심: 파싱된 테이블과 정렬 인덱스를 디스크에 바이너리로 저장하는 내용 기반 캐시입니다.
+
+    캐시 키는 입력 텍스트의 해시(또는 파일의 경로, 수정 시각, 크기)이므로 입력이 바뀌지 않으면
+    앱을 다시 시작해도 파싱 없이 marshal 파일을 읽어 테이블을 복원합니다.
+    디렉터리 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 파일부터 삭제합니다.
+    """
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        핵심: 캐시 디렉터리와 최대 크기를 설정합니다.
+
+        매개변수:
+            cache_dir: 캐시 파일을 저장할 디렉터리
+            max_bytes: 캐시 파일 전체의 최대 바이트 수
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.cache_dir, name)
+
+    def _write(self, name: str, payload: Any):
+        """
+        핵심: 페이로드를 형식 헤더와 함께 임시 파일에 쓴 뒤 원자적으로 교체합니다.
+
+        임시 파일은 쓰기마다 고유한 이름으로 만들어지므로 여러 작업 스레드가 같은 항목을
+        동시에 써도 서로의 내용을 덮어쓰지 않고, 마지막으로 교체한 파일이 남습니다.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(name)
+        fd, temp_path = tempfile.mkstemp(prefix=f"{name}.", suffix=".tmp", dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(CACHE_MAGIC)
+                file.write(bytes([CACHE_FORMAT_VERSION]))
+                file.write(marshal.dumps(payload))
+            os.replace(temp_path, path)
+        except BaseException:
+            self._remove(temp_path)
+            raise
+
+    def _read(self, name: str) -> Optional[Any]:
+        """
+        핵심: 캐시 파일을 읽어 페이로드를 반환합니다. 없거나 손상된 파일이면 None을 반환합니다.
+        """
+        path = self._path(name)
+        try:
+            with open(path, "rb") as file:
+                header = file.read(len(CACHE_MAGIC) + 1)
+                if header != CACHE_MAGIC + bytes([CACHE_FORMAT_VERSION]):
+                    raise ValueError("캐시 형식이 다릅니다.")
+                payload = marshal.loads(file.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, TypeError):
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)  # 최근 사용 시각 갱신 (LRU 삭제 기준)
+        except OSError:
+            pass
+        return payload
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def load_table(self, digest: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        핵심: 캐시 키에 해당하는 테이블을 불러오고, 함께 저장된 인덱스를 인덱스 캐시에 등록합니다.
+
+        매개변수:
+            digest: text_digest 또는 file_digest가 반환한 캐시 키
+
+        반환값:
+            복원된 테이블 행 목록, 캐시에 없으면 None
+        """
+        # 수많은 작은 컨테이너를 한꺼번에 만들 때 순환 GC가 반복 실행되지 않도록 잠시 끕니다
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            payload = self._read(digest + _TABLE_SUFFIX)
+            if payload is None:
+                return None
+            table = _unpack_rows(*payload)
+            self._load_indexes(digest, table)
+            return table
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def store_table(self, digest: str, table: List[Dict[str, Any]]):
+        """
+        핵심: 파싱된 테이블을 캐시에 저장합니다.
+
+        매개변수:
+            digest: 캐시 키
+            table: 저장할 테이블 행 목록
+        """
+        try:
+            self._write(digest + _TABLE_SUFFIX, _pack_rows(table))
+            self.evict()
+        except (OSError, ValueError):
+            pass  # marshal로 저장할 수 없는 값이 있거나 디스크 오류면 캐시 없이 진행합니다
+
+    def store_indexes(self, digest: str, table: List[Dict[str, Any]]):
+        """
+        핵심: 테이블에 대해 인덱스 캐시에 있는 정렬 인덱스를 디스크에 저장합니다.
+
+        이미 저장된 인덱스는 다시 쓰지 않습니다.
+
+        매개변수:
+            digest: 테이블의 캐시 키
+            table: 인덱스 대상 테이블
+        """
+        try:
+            for rules, index in INDEX_CACHE.indexes_for(table):
+                name = self._index_name(digest, index.key, rules)
+                if os.path.exists(self._path(name)):
+                    continue
+                self._write(name, (index.key, rules, index.row_count, index.keys, index.positions))
+            self.evict()
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def _index_name(digest: str, key: str, rules: tuple) -> str:
+        index_id = hashlib.sha256(repr((key, rules)).encode("utf-8", "surrogatepass")).hexdigest()[:16]
+        return f"{digest}.{index_id}{_INDEX_SUFFIX}"
+
+    def _load_indexes(self, digest: str, table: List[Dict[str, Any]]):
+        """
+        핵심: 테이블의 캐시 키로 저장된 인덱스를 읽어 인덱스 캐시에 등록합니다.
+        """
+        try:
+            names = [
+                name for name in os.listdir(self.cache_dir)
+                if name.startswith(digest + ".") and name.endswith(_INDEX_SUFFIX)
+            ]
+        except OSError:
+            return
+        for name in names:
+            payload = self._read(name)
+            if payload is None:
+                continue
+            key, rules, row_count, keys, positions = payload
+            if row_count != len(table):
+                continue
+            index = SortedIndex.from_arrays(key, row_count, keys, positions)
+            INDEX_CACHE.put(table, key, KeyNormalizer(*rules), index)
+
+    def evict(self):
+        """
+        핵심: 캐시 디렉터리 크기가 최대 크기 이하가 될 때까지 가장 오래 사용하지 않은 파일을 삭제합니다.
+        """
+        try:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if not (name.endswith(_TABLE_SUFFIX) or name.endswith(_INDEX_SUFFIX)):
+                    continue
+                stat = os.stat(self._path(name))
+                entries.append((stat.st_mtime, stat.st_size, name))
+        except OSError:
+            return
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(self._path(name))
+            total -= size
+
+    def clear(self):
+        """
+        핵심: 캐시 디렉터리의 모든 캐시 파일을 삭제합니다.
+        """
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith(_TABLE_SUFFIX) or name.endswith(_INDEX_SUFFIX):
+                self._remove(self._path(name))
@@ -0,0 +1,28 @@
+import pytest
+
+import aggregation
+
+
+def _aggregate(rows, group_by, spec):
+    aggregator = aggregation.HashAggregator(group_by, aggregation.parse_aggregate_spec(spec))
+    return aggregator.consume((row, True) for row in rows).result()
+
+
+def test_global_aggregate_over_no_rows_returns_one_row():
+    result = _aggregate([], [], "COUNT(*), SUM(x), AVG(x), MIN(x), MAX(x)")
+    assert result.rows == [{"COUNT(*)": 0, "SUM(x)": None, "AVG(x)": None, "MIN(x)": None, "MAX(x)": None}]
+
+
+def test_grouped_aggregate_over_no_rows_returns_no_groups():
+    assert _aggregate([], ["g"], "COUNT(*)").rows == []
+
+
+def test_column_missing_from_first_row_is_accepted():
+    rows = [{"g": "a"}, {"g": "a", "x": 2}, {"g": "b", "x": 5}]
+    result = _aggregate(rows, ["g"], "COUNT(*), SUM(x)")
+    assert result.rows == [{"g": "a", "COUNT(*)": 2, "SUM(x)": 2}, {"g": "b", "COUNT(*)": 1, "SUM(x)": 5}]
+
+
+def test_column_missing_from_every_row_is_rejected():
+    with pytest.raises(ValueError, match="y"):
+        _aggregate([{"g": "a", "x": 1}], ["g"], "SUM(y)")
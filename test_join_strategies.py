@@ -0,0 +1,54 @@
+import pytest
+
+from join_engine import JoinEngine, JOIN_STRATEGIES
+from join_index import INDEX_CACHE
+from key_normalization import KeyNormalizer
+
+
+JOIN_TYPES = ["INNER JOIN", "LEFT OUTER JOIN", "RIGHT OUTER JOIN", "FULL OUTER JOIN"]
+
+NAN = float("nan")
+
+# (테이블 A, 테이블 B) - 모든 JOIN 알고리즘이 같은 결과를 내야 하는 키 조합
+KEY_CASES = {
+    "nan": (
+        [{"id": 1, "score": 1.5}, {"id": 2, "score": NAN}, {"id": 3, "score": 2.5}],
+        [{"score": 1.5, "label": "x"}, {"score": 2.5, "label": "y"}, {"score": NAN, "label": "z"}],
+    ),
+    "bool_int_float": (
+        [{"id": 1, "score": True}, {"id": 2, "score": 1}, {"id": 3, "score": 0.0}, {"id": 4, "score": 2}],
+        [{"score": 1.0, "label": "x"}, {"score": False, "label": "y"}, {"score": "1", "label": "z"}],
+    ),
+    "list": (
+        [{"id": 1, "score": [1, 2]}, {"id": 2, "score": [1.0, 2.0]}, {"id": 3, "score": [2, 1]}],
+        [{"score": [1, 2], "label": "x"}, {"score": [True], "label": "y"}, {"score": [2, 1], "label": "z"}],
+    ),
+}
+
+
+def _join_keys(result):
+    return [(row.get("id"), row.get("B_label"), matched) for row, matched in result]
+
+
+@pytest.mark.parametrize("case", sorted(KEY_CASES))
+@pytest.mark.parametrize("join_type", JOIN_TYPES)
+def test_all_strategies_agree_with_nested_loop(case, join_type):
+    table_a, table_b = KEY_CASES[case]
+    INDEX_CACHE.clear()
+    results = {
+        name: _join_keys(JoinEngine.join_with_strategy(strategy, table_a, table_b, "score", "score", join_type,
+                                                       KeyNormalizer()))
+        for name, strategy in JOIN_STRATEGIES.items()
+    }
+    reference = results.pop(next(iter(JOIN_STRATEGIES)))
+    for name, result in results.items():
+        assert result == reference, name
+
+
+def test_nan_keys_never_match():
+    table_a, table_b = KEY_CASES["nan"]
+    for strategy in JOIN_STRATEGIES.values():
+        INDEX_CACHE.clear()
+        result = JoinEngine.join_with_strategy(strategy, table_a, table_b, "score", "score", "INNER JOIN",
+                                               KeyNormalizer())
+        assert _join_keys(result) == [(1, "x", True), (3, "y", True)], strategy
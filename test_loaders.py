@@ -0,0 +1,23 @@
+import loaders
+
+
+def _rows(text):
+    return list(loaders.iter_delimited_rows(iter(text.splitlines(keepends=True)), ","))
+
+
+def test_numbers_are_inferred_from_plain_literals():
+    rows = _rows("id,score\n1,1.5\n-2,.25\n30,1e3\n")
+    assert [row["id"] for row in rows] == [1, -2, 30]
+    assert [row["score"] for row in rows] == [1.5, 0.25, 1000.0]
+
+
+def test_columns_that_would_lose_their_text_stay_strings():
+    rows = _rows("zip,amount,score\n00501,1_000,1.5\n10001,2000,nan\n")
+    assert [row["zip"] for row in rows] == ["00501", "10001"]
+    assert [row["amount"] for row in rows] == ["1_000", "2000"]
+    assert [row["score"] for row in rows] == ["1.5", "nan"]
+
+
+def test_value_after_the_sample_keeps_its_text():
+    rows = list(loaders.iter_delimited_rows(iter(["id\n", "1\n", "2\n", "007\n"]), ",", sample_size=2))
+    assert [row["id"] for row in rows] == [1, 2, "007"]
@@ -1,52 +1,271 @@
 import json
 import re
-from typing import List, Dict, Any, Tuple
+from collections.abc import Sequence
+from typing import List, Dict, Any, Tuple, Iterator, Callable
 import tkinter as tk
 
 
-def parse_table_input(input_text: str) -> List[Dict[str, Any]]:
+# 스트리밍 파서가 한 번에 읽는 문자 수
+PARSE_CHUNK_SIZE = 64 * 1024
+
+# 파싱 진행 상황을 보고하는 행 간격
+PARSE_PROGRESS_INTERVAL = 1000
+
+# 화면에 표시하는 행 문자열의 최대 길이 (넘는 부분은 잘라서 말줄임표로 표시)
+ROW_DISPLAY_MAX_CHARS = 200
+
+# 배열 원소 사이의 공백과 쉼표 (원소 뒤의 여분 쉼표도 Python 리터럴처럼 허용)
+_SEPARATOR_PATTERN = re.compile(r"[ \t\n\r,]*")
+
+
+def _iter_text_chunks(source, chunk_size: int) -> Iterator[str]:
+    """
+    문자열 또는 텍스트 파일 스트림을 일정 크기의 조각으로 나눠 반환합니다.
+    
+    인자:
+        source: 입력 문자열 또는 read() 메서드가 있는 텍스트 스트림
+        chunk_size: 조각 하나의 최대 문자 수
+        
+    반환:
+        문자열 조각 이터레이터
+    """
+    if isinstance(source, str):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+        return
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_table_rows(source, chunk_size: int = PARSE_CHUNK_SIZE,
+                    progress_callback: Callable[[int, int], None] = None) -> Iterator[Dict[str, Any]]:
+    """
+    JSON 배열 형식의 테이블 입력에서 행을 하나씩 파싱하여 반환합니다.
+    
+    입력 전체를 한 번에 json.loads 하지 않고 조각 단위로 읽으면서
+    json.JSONDecoder.raw_decode로 배열 원소를 하나씩 디코딩하므로, 큰 입력도 한 번만 파싱하고
+    파싱된 행을 바로 JOIN 엔진이나 집계기에 넘길 수 있습니다.
+    처음 나오는 따옴표가 작은따옴표이면 Python dict 리터럴로 보고 읽는 조각마다 큰따옴표로 바꿉니다.
+    
+    인자:
+        source: 입력 문자열 또는 read() 메서드가 있는 텍스트 스트림
+        chunk_size: 한 번에 읽을 문자 수
+        progress_callback: (파싱된 행 수, 읽은 문자 수)를 받는 진행 상황 콜백 (선택)
+        
+    반환:
+        행 딕셔너리 이터레이터
+        
+    예외:
+        ValueError: 입력이 딕셔너리 배열 형식이 아닌 경우
+    """
+    decoder = json.JSONDecoder()
+    chunks = _iter_text_chunks(source, chunk_size)
+    buffer = ""
+    pos = 0
+    consumed = 0  # 버퍼 앞에서 이미 잘라낸 문자 수
+    exhausted = False
+    swap_quotes = None
+    row_count = 0
+    
+    def read_more():
+        nonlocal buffer, pos, consumed, exhausted, swap_quotes
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            return False
+        if swap_quotes is None:
+            double_index = chunk.find('"')
+            single_index = chunk.find("'")
+            if single_index != -1 and (double_index == -1 or single_index < double_index):
+                swap_quotes = True
+            elif double_index != -1:
+                swap_quotes = False
+        if swap_quotes:
+            chunk = chunk.replace("'", '"')
+        # 이미 처리한 앞부분은 버려서 버퍼가 입력 전체로 커지지 않게 합니다
+        consumed += pos
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return True
+    
+    read_more()
+    while True:
+        pos = len(buffer) - len(buffer.lstrip())
+        if pos < len(buffer) or not read_more():
+            break
+    if pos >= len(buffer) or buffer[pos] != "[":
+        raise ValueError("테이블 입력은 딕셔너리 리스트([...]) 형식이어야 합니다.")
+    pos += 1
+    
+    while True:
+        pos = _SEPARATOR_PATTERN.match(buffer, pos).end()
+        if pos >= len(buffer):
+            if read_more():
+                continue
+            raise ValueError("테이블 입력이 ']'로 끝나지 않았습니다.")
+        if buffer[pos] == "]":
+            break
+        
+        while True:
+            try:
+                row, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                # 조각 경계에서 잘린 값이면 더 읽고 다시 시도합니다
+                if read_more():
+                    continue
+                raise ValueError(f"{consumed + e.pos}번째 문자 근처에서 파싱 오류: {e.msg}")
+            if end == len(buffer) and not exhausted and read_more():
+                continue  # 숫자처럼 끝이 모호한 값은 다음 조각을 확인한 뒤 다시 디코딩
+            break
+        pos = end
+        
+        if not isinstance(row, dict):
+            raise ValueError(f"{row_count + 1}번째 원소가 딕셔너리가 아닙니다: {row!r}")
+        row_count += 1
+        if progress_callback is not None and row_count % PARSE_PROGRESS_INTERVAL == 0:
+            progress_callback(row_count, consumed + pos)
+        yield row
+    
+    if progress_callback is not None:
+        progress_callback(row_count, consumed + pos)
+
+
+def parse_table_input(input_text, table_encoder=None,
+                      progress_callback: Callable[[int, int], None] = None) -> List[Dict[str, Any]]:
     """
     입력 텍스트를 딕셔너리 목록으로 파싱합니다.
     JSON 형식 및 Python dict 리터럴 형식 모두 처리합니다.
 
     인수:
-    input_text: JSON 또는 Python과 유사한 dict 표현을 포함하는 문자열
+    input_text: JSON 또는 Python과 유사한 dict 표현을 포함하는 문자열 또는 텍스트 스트림
+    table_encoder: 문자열 값을 열별 딕셔너리로 인코딩할 encoding.TableEncoder (선택)
+    progress_callback: (파싱된 행 수, 읽은 문자 수)를 받는 진행 상황 콜백 (선택)
 
     반환값:
     테이블 데이터를 나타내는 딕셔너리 목록
+
+    예외:
+    ValueError: 입력 형식이 잘못된 경우 (오류 위치를 포함한 메시지)
     """
-    try:
-        # 먼저 JSON으로 파싱 시도
-        return json.loads(input_text)
-    except json.JSONDecodeError:
-        try:
-            # JSON 파싱이 실패하면 Python 리터럴로 평가 시도
-            # JSON 파싱을 위해 작은따옴표를 큰따옴표로 대체
-            input_text = re.sub(r"'", '"', input_text)
-            return json.loads(input_text)
-        except Exception as e:
-            # 실패 시 빈 목록 반환
-            print(f"Error parsing table input: {str(e)}")
-            return []
+    rows = []
+    for row in iter_table_rows(input_text, progress_callback=progress_callback):
+        # 파싱 직후 반복되는 문자열 값을 공유 객체로 교체
+        if table_encoder is not None:
+            table_encoder.encode_row(row)
+        rows.append(row)
+    return rows
 
 
-def compute_cartesian_product(table_a: List[Dict], table_b: List[Dict]) -> List[Tuple[Dict, Dict]]:
+class RowDisplayCache(Sequence):
+    """
+    테이블 행마다 화면 표시용 문자열을 한 번만 만들어 여러 화면이 함께 사용하는 캐시입니다.
+    
+    카티션 곱의 각 조합을 그릴 때마다 행을 다시 형식화하면 A 행은 m번, B 행은 n번 형식화되지만,
+    이 캐시는 행 위치별로 처음 요청될 때 한 번만 형식화하므로 전체 형식화 횟수가 n+m을 넘지 않습니다.
+    너무 긴 행은 max_chars에서 잘라 표시하고, 잘리지 않은 전체 문자열은 full_text로 얻습니다.
+    """
+    def __init__(self, rows: List[Dict], max_chars: int = ROW_DISPLAY_MAX_CHARS):
+        self.rows = rows
+        self.max_chars = max_chars
+        self._texts = None  # 행 위치 -> 표시 문자열 (처음 요청될 때 만들어짐)
+        self._truncated = set()  # 표시 문자열이 잘린 행 위치
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        texts = self._texts
+        if texts is None:
+            texts = self._texts = [None] * len(self.rows)
+        text = texts[position]
+        if text is None:
+            full_text = format_row_as_string(self.rows[position])
+            text = texts[position] = _truncate(full_text, self.max_chars)
+            if text is not full_text:
+                self._truncated.add(position % len(self.rows))
+        return text
+    
+    def is_truncated(self, position: int) -> bool:
+        """
+        행의 표시 문자열이 잘렸는지 여부를 반환합니다.
+        """
+        self[position]
+        return position % len(self.rows) in self._truncated
+    
+    def full_text(self, position: int) -> str:
+        """
+        잘리지 않은 행 전체 문자열을 반환합니다. 툴팁처럼 한 행만 필요할 때 사용합니다.
+        """
+        return format_row_as_string(self.rows[position])
+
+
+class CartesianProduct(Sequence):
+    """
+    두 테이블의 카르테시안 곱을 튜플 목록을 만들지 않고 표현하는 지연 시퀀스입니다.
+    
+    i번째 조합은 divmod(i, len(table_b))로 바로 계산되므로 n×m개의 튜플을 미리 만들지 않고도
+    길이 조회, 인덱스 접근, 순회가 모두 가능합니다. 화면에는 보이는 조합만 꺼내어 그립니다.
+    """
+    def __init__(self, table_a: List[Dict], table_b: List[Dict]):
+        self.table_a = table_a
+        self.table_b = table_b
+        # 카티션 곱, 설명, 히트맵, 애니메이션이 함께 사용하는 행별 표시 문자열
+        self.texts_a = RowDisplayCache(table_a)
+        self.texts_b = RowDisplayCache(table_b)
+    
+    def __len__(self) -> int:
+        return len(self.table_a) * len(self.table_b)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("카르테시안 곱 인덱스가 범위를 벗어났습니다.")
+        index_a, index_b = divmod(index, len(self.table_b))
+        return (self.table_a[index_a], self.table_b[index_b])
+    
+    def __iter__(self) -> Iterator[Tuple[Dict, Dict]]:
+        table_b = self.table_b
+        for row_a in self.table_a:
+            for row_b in table_b:
+                yield (row_a, row_b)
+    
+    def pair_positions(self, index: int) -> Tuple[int, int]:
+        """
+        조합 인덱스를 (테이블 A 행 위치, 테이블 B 행 위치)로 변환합니다.
+        """
+        return divmod(index, len(self.table_b))
+    
+    def pair_texts(self, index: int) -> Tuple[str, str]:
+        """
+        조합 인덱스의 (테이블 A 행 표시 문자열, 테이블 B 행 표시 문자열)을 캐시에서 반환합니다.
+        """
+        index_a, index_b = divmod(index, len(self.table_b))
+        return self.texts_a[index_a], self.texts_b[index_b]
+
+
+def compute_cartesian_product(table_a: List[Dict], table_b: List[Dict]) -> CartesianProduct:
     """
     두 테이블의 카르테시안 곱을 계산합니다.
-    테이블 A의 각 행과 테이블 B의 각 행을 포함하는 튜플 목록을 반환합니다.
+    테이블 A의 각 행과 테이블 B의 각 행을 포함하는 튜플 시퀀스를 반환합니다.
+    조합은 실제로 접근할 때 만들어지므로 곱의 크기와 관계없이 즉시 반환됩니다.
 
     인자:
     table_a: 테이블 A를 나타내는 딕셔너리 목록
     table_b: 테이블 B를 나타내는 딕셔너리 목록
 
     반환:
-    테이블 A의 각 행과 테이블 B의 각 행을 포함하는 튜플 목록
+    테이블 A의 각 행과 테이블 B의 각 행을 포함하는 튜플 시퀀스 (CartesianProduct)
     """
-    cartesian_product = []
-    for row_a in table_a:
-        for row_b in table_b:
-            cartesian_product.append((row_a, row_b))
-    return cartesian_product
+    return CartesianProduct(table_a, table_b)
 
 
 def get_unique_rows(cartesian_product: List[Tuple[Dict, Dict]]) -> Tuple[List[Dict], List[Dict]]:
@@ -59,6 +278,13 @@ def get_unique_rows(cartesian_product: List[Tuple[Dict, Dict]]) -> Tuple[List[Di
     반환:
         (unique_rows_a, unique_rows_b) 형태의 튜플
     """
+    if isinstance(cartesian_product, CartesianProduct):
+        # 지연 카르테시안 곱은 n×m개 조합을 순회하지 않고 원본 테이블에서 바로 추출합니다
+        if not len(cartesian_product):
+            return [], []
+        return (_unique_by_identity(cartesian_product.table_a),
+                _unique_by_identity(cartesian_product.table_b))
+    
     # 테이블 A에서 고유한 행 추출
     unique_rows_a = []
     seen_a = set()
@@ -78,17 +304,117 @@ def get_unique_rows(cartesian_product: List[Tuple[Dict, Dict]]) -> Tuple[List[Di
     return unique_rows_a, unique_rows_b
 
 
-def format_row_as_string(row: Dict[str, Any]) -> str:
+def _unique_by_identity(rows: List[Dict]) -> List[Dict]:
+    """
+    행 목록에서 같은 객체가 반복되면 처음 나온 것만 남깁니다.
+    """
+    unique_rows = []
+    seen = set()
+    for row in rows:
+        if id(row) not in seen:
+            seen.add(id(row))
+            unique_rows.append(row)
+    return unique_rows
+
+
+def make_hashable(value: Any) -> Any:
+    """
+    리스트나 딕셔너리 값을 딕셔너리 키로 사용할 수 있도록 해시 가능한 형태로 변환합니다.
+    
+    인자:
+        value: 변환할 값
+        
+    반환:
+        해시 가능한 값 (리스트는 튜플로, 딕셔너리는 정렬된 항목 튜플로 변환)
+    """
+    if isinstance(value, list):
+        return tuple(make_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, make_hashable(v)) for k, v in value.items()))
+    return value
+
+
+def is_nan(value: Any) -> bool:
+    """
+    값이 NaN인지 확인합니다. NaN은 자기 자신과도 같지 않고 순서도 없으므로
+    JOIN 키로는 어떤 값과도 일치하지 않는 것으로 취급합니다.
+    
+    인자:
+        value: 확인할 값
+        
+    반환:
+        float NaN이면 True
+    """
+    return isinstance(value, float) and value != value
+
+
+def sort_key(value: Any) -> Tuple:
+    """
+    서로 다른 타입의 값을 함께 정렬할 수 있도록 타입을 고려한 정렬 키를 생성합니다.
+    숫자, 문자열, 기타 값 순으로 정렬되며 NULL(None)은 항상 마지막에 옵니다.
+    리스트와 딕셔너리는 원소의 정렬 키로 비교하므로 [1]과 [1.0]처럼 ==로 같은 값은 같은 키를 받습니다.
+    
+    인자:
+        value: 정렬할 값
+        
+    반환:
+        (타입 순위, 비교 값) 튜플
+    """
+    if value is None:
+        return (3, 0)
+    if isinstance(value, (int, float)):
+        return (0, value)
+    if isinstance(value, str):
+        return (1, value)
+    if isinstance(value, (list, tuple)):
+        return (2, 0, tuple(sort_key(item) for item in value))
+    if isinstance(value, dict):
+        return (2, 1, tuple(sorted((str(k), sort_key(v)) for k, v in value.items())))
+    return (2, 2, repr(value))
+
+
+def format_row_as_string(row: Dict[str, Any], max_chars: int = None) -> str:
     """
     행 딕셔너리를 가독성 있는 문자열로 형식화합니다.
     
     인자:
         row: 행을 나타내는 딕셔너리
+        max_chars: 최대 길이. 넘으면 잘라서 끝에 "…"를 붙입니다 (기본값: 자르지 않음)
         
     반환:
         행의 문자열 표현
     """
-    return ", ".join([f"{k}: {v}" for k, v in row.items()])
+    text = ", ".join([f"{k}: {v}" for k, v in row.items()])
+    return text if max_chars is None else _truncate(text, max_chars)
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    """
+    문자열이 max_chars보다 길면 잘라서 끝에 "…"를 붙이고, 아니면 그대로 반환합니다.
+    """
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars - 1] + "…"
+
+
+def pair_display_texts(cartesian_product, index: int) -> Tuple[str, str]:
+    """
+    카르테시안 곱의 index번째 조합에 대한 두 행의 표시 문자열을 반환합니다.
+    
+    지연 카르테시안 곱이면 행별 표시 문자열 캐시를 사용하고, 튜플 목록이면 그때 형식화합니다.
+    
+    인자:
+        cartesian_product: compute_cartesian_product에서 반환된 곱 또는 (행_A, 행_B) 튜플 목록
+        index: 조합 인덱스
+        
+    반환:
+        (테이블 A 행 문자열, 테이블 B 행 문자열) 튜플
+    """
+    if isinstance(cartesian_product, CartesianProduct):
+        return cartesian_product.pair_texts(index)
+    row_a, row_b = cartesian_product[index]
+    return (format_row_as_string(row_a, ROW_DISPLAY_MAX_CHARS),
+            format_row_as_string(row_b, ROW_DISPLAY_MAX_CHARS))
 
 
 def create_help_text() -> str:
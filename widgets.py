@@ -1,119 +1,811 @@
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, scrolledtext
-from typing import List, Dict, Any, Callable
+from typing import List, Dict, Any, Callable, Iterable, Optional
 
 
-class TooltipManager:
+# 점진적 채우기에서 한 번에 삽입하는 항목 수
+POPULATE_CHUNK_SIZE = 300
+
+# 테이블 표시 위젯으로 Canvas 기반 CanvasTableView를 사용할지 여부 (False면 Treeview 기반 TableView)
+USE_CANVAS_TABLES = True
+
+# 행 태그별 배경색 (Treeview 기반 TableView의 태그 스타일과 같은 색)
+ROW_TAG_COLORS = {
+    "matched": "#e6ffe6",  # 일치하는 행은 연한 녹색
+    "unmatched": "#fff0f0",  # 일치하지 않는 행은 연한 빨강색
+}
+
+
+class SharedTooltip:
     """
-    핵심: 위젯에 대한 툴팁을 생성하고 관리하는 클래스.
+    핵심: 한 뷰 안의 모든 셀이 함께 쓰는 재사용 툴팁 창.
+    
+    툴팁 창은 처음 표시할 때 한 번만 만들고 이후에는 숨기고 다시 보이기만 합니다.
+    표시할 텍스트는 문자열 대신 텍스트를 만드는 함수로 받아, 실제로 마우스를 올린
+    셀에 대해서만 설명을 생성합니다.
     """
     
-    @staticmethod
-    def create_tooltip(widget, text):
+    def __init__(self, parent, delay_ms=250, wraplength=250):
         """
-        핵심: 주어진 위젯에 대한 툴팁을 생성합니다.
+        핵심: 공유 툴팁을 생성합니다. 창은 처음 표시할 때 만들어집니다.
         
         매개변수:
-            widget: 툴팁을 추가할 위젯
-            text: 툴팁에 표시할 텍스트
-        """
-        tooltip = None
-        
-        def enter(event):
-            """
-            핵심: 위젯에 마우스가 들어갈 때 툴팁을 표시합니다.
-            """
-            nonlocal tooltip
-            x, y, _, _ = widget.bbox("insert")
-            x += widget.winfo_rootx() + 25
-            y += widget.winfo_rooty() + 20
-            
-            # 툴팁 창 생성
-            tooltip = tk.Toplevel(widget)
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{x}+{y}")
-            
-            label = ttk.Label(tooltip, text=text, justify=tk.LEFT,
-                             background="#ffffe0", relief="solid", borderwidth=1,
-                             wraplength=250)
-            label.pack(padx=3, pady=3)
+            parent: 툴팁을 소유하는 위젯
+            delay_ms: 마우스를 올린 뒤 툴팁을 표시하기까지의 지연 시간 (밀리초)
+            wraplength: 툴팁 텍스트의 줄바꿈 너비 (픽셀)
+        """
+        self.parent = parent
+        self.delay_ms = delay_ms
+        self.wraplength = wraplength
+        self.current_key = None  # 현재 표시 중이거나 표시 예정인 대상
+        self._window = None
+        self._label = None
+        self._pending = None  # 예약된 after id
+    
+    def show_for(self, key, text_provider: Callable[[], str], x_root, y_root):
+        """
+        핵심: 대상에 대한 툴팁 표시를 예약합니다. 같은 대상이면 아무것도 하지 않습니다.
+        
+        매개변수:
+            key: 툴팁 대상을 구분하는 값 (예: 행 인덱스)
+            text_provider: 툴팁 텍스트를 만드는 함수 (표시 직전에 한 번만 호출)
+            x_root: 마우스의 화면 x 좌표
+            y_root: 마우스의 화면 y 좌표
+        """
+        if key == self.current_key:
+            return
+        self.hide()
+        self.current_key = key
+        self._pending = self.parent.after(
+            self.delay_ms, lambda: self._show(text_provider(), x_root + 25, y_root + 20)
+        )
+    
+    def _show(self, text, x, y):
+        """
+        핵심: 툴팁 창을 (처음이면 만들고) 텍스트를 바꿔 지정 위치에 표시합니다.
+        """
+        self._pending = None
+        if self._window is None:
+            self._window = tk.Toplevel(self.parent)
+            self._window.wm_overrideredirect(True)
+            self._label = ttk.Label(self._window, justify=tk.LEFT,
+                                    background="#ffffe0", relief="solid", borderwidth=1,
+                                    wraplength=self.wraplength)
+            self._label.pack(padx=3, pady=3)
+        self._label.config(text=text)
+        self._window.wm_geometry(f"+{x}+{y}")
+        self._window.deiconify()
+        self._window.lift()
+    
+    def hide(self):
+        """
+        핵심: 예약된 표시를 취소하고 툴팁 창을 숨깁니다. 창은 재사용을 위해 남겨 둡니다.
+        """
+        if self._pending is not None:
+            self.parent.after_cancel(self._pending)
+            self._pending = None
+        if self._window is not None:
+            self._window.withdraw()
+        self.current_key = None
+
+
+class IncrementalPopulator:
+    """
+    핵심: 많은 항목을 위젯에 나눠서 삽입하여 UI가 멈추지 않게 하는 도우미.
+    
+    첫 묶음은 즉시 삽입하여 바로 보이게 하고, 나머지는 묶음마다 유휴 콜백을 예약해
+    그 사이에 입력 처리와 화면 갱신이 이루어지도록 합니다. 대상 위젯이 파괴되거나
+    같은 위젯에 새 작업이 시작되면 작업은 자동으로 멈추며, cancel_all()로 진행 중인
+    모든 작업을 취소할 수 있습니다.
+    """
+    
+    def __init__(self, root, chunk_size=POPULATE_CHUNK_SIZE):
+        """
+        핵심: 점진적 채우기 도우미를 생성합니다.
+        
+        매개변수:
+            root: 콜백 예약에 사용할 위젯 (보통 루트 창)
+            chunk_size: 한 번에 삽입하는 항목 수
+        """
+        self.root = root
+        self.chunk_size = chunk_size
+        self._jobs = {}  # 작업 id -> 예약된 after id (없으면 None)
+        self._job_targets = {}  # 작업 id -> 대상 위젯 경로
+        self._target_jobs = {}  # 대상 위젯 경로 -> 진행 중인 작업 id
+        self._next_job_id = 0
+    
+    def populate(self, target, items: Iterable, insert_item: Callable[[Any], None],
+                 on_done: Callable[[], None] = None):
+        """
+        핵심: 항목들을 묶음 단위로 나눠 삽입하는 작업을 시작합니다.
+        
+        같은 대상 위젯에 아직 삽입 중인 이전 작업이 있으면 먼저 취소하여
+        이전 항목이 새 항목 사이에 섞이지 않도록 합니다.
+        
+        매개변수:
+            target: 항목이 삽입되는 위젯 (파괴되면 작업을 멈춤)
+            items: 삽입할 항목 이터러블
+            insert_item: 항목 하나를 위젯에 삽입하는 함수
+            on_done: 모든 항목을 삽입한 뒤 호출할 콜백 (선택)
             
-        def leave(event):
-            """
-            핵심: 위젯에서 마우스가 나갈 때 툴팁을 숨깁니다.
-            """
-            nonlocal tooltip
-            if tooltip:
-                tooltip.destroy()
-                tooltip = None
-                
-        widget.bind("<Enter>", enter)
-        widget.bind("<Leave>", leave)
+        반환값:
+            cancel()에 사용할 작업 id
+        """
+        target_key = str(target)
+        previous_job_id = self._target_jobs.get(target_key)
+        if previous_job_id is not None:
+            self.cancel(previous_job_id)
+        
+        job_id = self._next_job_id
+        self._next_job_id += 1
+        self._jobs[job_id] = None
+        self._job_targets[job_id] = target_key
+        self._target_jobs[target_key] = job_id
+        self._run_chunk(job_id, target, iter(items), insert_item, on_done)
+        return job_id
+    
+    def _run_chunk(self, job_id, target, iterator, insert_item, on_done):
+        """
+        핵심: 한 묶음을 삽입하고, 남은 항목이 있으면 다음 묶음을 유휴 시간에 예약합니다.
+        """
+        if job_id not in self._jobs:
+            return
+        if not target.winfo_exists():
+            self._forget(job_id)
+            return
+        
+        for _ in range(self.chunk_size):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self._forget(job_id)
+                if on_done:
+                    on_done()
+                return
+            insert_item(item)
+        
+        self._jobs[job_id] = self.root.after_idle(
+            self._run_chunk, job_id, target, iterator, insert_item, on_done
+        )
+    
+    def cancel(self, job_id):
+        """
+        핵심: 작업 하나를 취소합니다. 이미 끝난 작업이면 아무것도 하지 않습니다.
+        
+        매개변수:
+            job_id: populate()가 반환한 작업 id
+        """
+        after_id = self._jobs.get(job_id)
+        self._forget(job_id)
+        if after_id is not None:
+            self.root.after_cancel(after_id)
+    
+    def _forget(self, job_id):
+        """
+        핵심: 끝났거나 취소된 작업의 기록을 지웁니다.
+        """
+        self._jobs.pop(job_id, None)
+        target_key = self._job_targets.pop(job_id, None)
+        if self._target_jobs.get(target_key) == job_id:
+            del self._target_jobs[target_key]
+    
+    def cancel_all(self):
+        """
+        핵심: 진행 중인 모든 작업을 취소합니다. 새 시뮬레이션을 시작할 때 호출합니다.
+        """
+        for job_id in list(self._jobs):
+            self.cancel(job_id)
 
 
-class ScrollableFrame:
+class VirtualGrid:
     """
-    핵심: 필요할 때 자동으로 스크롤바가 나타나는 사용자 정의 프레임.
+    핵심: 보이는 행만 Canvas에 그리는 가상 스크롤 그리드.
+    
+    행 수와 관계없이 화면에 보이는 만큼의 캔버스 항목만 만들어 두고, 스크롤할 때마다
+    row_provider(행 인덱스)로 해당 행의 텍스트와 배경색을 받아 항목을 재사용합니다.
+    따라서 수십만 행도 생성 비용이 일정하며 위젯을 행마다 만들지 않습니다.
     """
     
-    def __init__(self, parent, **kwargs):
+    def __init__(self, parent, columns, row_provider: Callable[[int], Any], row_count=0,
+                 row_height=24, header_height=28, font=None, header_font=None):
         """
-        핵심: 선택적 스크롤바가 있는 프레임을 생성합니다.
+        핵심: 가상 그리드를 생성합니다.
         
         매개변수:
             parent: 부모 위젯
-            **kwargs: 프레임에 대한 추가 인수
+            columns: (열 제목, 최소 너비, 늘어나는 비율) 튜플 목록
+            row_provider: 행 인덱스를 받아 (셀 텍스트 목록, 배경색)을 반환하는 함수
+            row_count: 전체 행 수
+            row_height: 행 하나의 높이 (픽셀)
+            header_height: 열 제목 영역의 높이 (픽셀)
+            font: 셀 글꼴
+            header_font: 열 제목 글꼴
         """
         self.parent = parent
+        self.columns = list(columns)
+        self.row_provider = row_provider
+        self.row_count = row_count
+        self.row_height = row_height
+        self.header_height = header_height
+        self.first_row = 0
+        self.column_widths = [min_width for _, min_width, _ in self.columns]
+        self.on_hover = None  # (행 인덱스, 열 인덱스, 이벤트)를 받는 콜백
+        self.on_leave = None
+        self.on_click = None  # (행 인덱스, 열 인덱스, 이벤트)를 받는 콜백
+        self._pool = []  # 재사용하는 행 항목: (배경 사각형 id, [셀 텍스트 id])
+        self._font = tkfont.Font(font=font or ("TkDefaultFont", 10))
+        self._header_font = tkfont.Font(font=header_font or ("TkDefaultFont", 10, "bold"))
+        self._fit_cache = {}  # (텍스트, 너비) -> 잘라낸 텍스트
         
-        # 캔버스와 스크롤바가 있는 프레임 생성
         self.frame = ttk.Frame(parent)
-        self.frame.pack(fill=tk.BOTH, expand=True, **kwargs)
         
-        # 수평 스크롤바 생성
         self.h_scrollbar = ttk.Scrollbar(self.frame, orient=tk.HORIZONTAL)
         self.h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
         
-        # 수직 스크롤바 생성
-        self.v_scrollbar = ttk.Scrollbar(self.frame)
+        # 세로 스크롤은 캔버스 좌표가 아니라 첫 번째 표시 행 인덱스로 관리합니다
+        self.v_scrollbar = ttk.Scrollbar(self.frame, command=self._on_scrollbar)
         self.v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # 캔버스 생성
-        self.canvas = tk.Canvas(self.frame, 
-                               xscrollcommand=self.h_scrollbar.set,
-                               yscrollcommand=self.v_scrollbar.set)
+        self.canvas = tk.Canvas(self.frame, background="white", highlightthickness=0,
+                                xscrollcommand=self.h_scrollbar.set)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        # 스크롤바 설정
         self.h_scrollbar.config(command=self.canvas.xview)
-        self.v_scrollbar.config(command=self.canvas.yview)
         
-        # 캔버스 내부에 프레임 생성
-        self.content_frame = ttk.Frame(self.canvas)
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.content_frame, anchor=tk.NW)
+        self._header_items = []
+        self._header_background = self.canvas.create_rectangle(0, 0, 0, header_height, fill="#f0f0f0", outline="")
+        self._create_header_items()
+        
+        self.canvas.bind("<Configure>", self._on_configure)
+        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind("<Button-4>", lambda event: self.scroll_rows(-3))
+        self.canvas.bind("<Button-5>", lambda event: self.scroll_rows(3))
+        self.canvas.bind("<Motion>", self._on_motion)
+        self.canvas.bind("<Leave>", self._on_canvas_leave)
+        self.canvas.bind("<Button-1>", self._on_button)
+    
+    @property
+    def visible_rows(self):
+        """
+        핵심: 현재 캔버스 높이에 완전히 보이는 행 수를 반환합니다.
+        """
+        height = max(self.canvas.winfo_height() - self.header_height, 0)
+        return max(height // self.row_height, 1)
+    
+    def set_row_count(self, row_count):
+        """
+        핵심: 전체 행 수를 변경하고 화면을 다시 그립니다.
+        
+        매개변수:
+            row_count: 새 전체 행 수
+        """
+        self.row_count = row_count
+        self.first_row = min(self.first_row, max(row_count - self.visible_rows, 0))
+        self.refresh()
+    
+    def set_data(self, row_provider: Callable[[int], Any], row_count):
+        """
+        핵심: 같은 그리드에 새 데이터를 연결하고 맨 위부터 다시 그립니다.
+        
+        매개변수:
+            row_provider: 새 행 제공 함수
+            row_count: 새 전체 행 수
+        """
+        if self.on_leave is not None:
+            self.on_leave()
+        self.row_provider = row_provider
+        self.row_count = row_count
+        self.first_row = 0
+        self.refresh()
+    
+    def set_columns(self, columns):
+        """
+        핵심: 열 구성을 바꿉니다. 머리글과 재사용 행 항목을 새 열 수에 맞게 다시 만듭니다.
+        
+        매개변수:
+            columns: (열 제목, 최소 너비, 늘어나는 비율) 튜플 목록
+        """
+        for background, cells in self._pool:
+            self.canvas.delete(background, *cells)
+        self._pool = []
+        for item in self._header_items:
+            self.canvas.delete(item)
+        self.columns = list(columns)
+        self._create_header_items()
+        self._fit_cache.clear()
+        self._layout_columns(self.canvas.winfo_width())
+        self.refresh()
+    
+    def set_column_width(self, column, width):
+        """
+        핵심: 열의 최소 너비를 바꾸고 열 배치를 다시 계산합니다. 열 너비를 끌어서 조절할 때 사용합니다.
+        
+        매개변수:
+            column: 열 인덱스
+            width: 새 최소 너비 (픽셀)
+        """
+        title, _, weight = self.columns[column]
+        self.columns[column] = (title, width, weight)
+        self._layout_columns(self.canvas.winfo_width())
+        self.refresh()
+    
+    def column_edge_at(self, x, tolerance=4):
+        """
+        핵심: 캔버스 x 좌표가 열의 오른쪽 경계 근처이면 그 열 인덱스를, 아니면 None을 반환합니다.
+        
+        매개변수:
+            x: 위젯 기준 x 좌표 (이벤트 좌표)
+            tolerance: 경계로 인정하는 거리 (픽셀)
+        """
+        x = self.canvas.canvasx(x)
+        x_positions = self._column_x_positions()
+        for column in range(len(self.columns)):
+            if abs(x - x_positions[column + 1]) <= tolerance:
+                return column
+        return None
+    
+    def scroll_to(self, index):
+        """
+        핵심: 지정한 행이 맨 위에 오도록 스크롤합니다.
+        
+        매개변수:
+            index: 맨 위에 표시할 행 인덱스
+        """
+        max_first = max(self.row_count - self.visible_rows, 0)
+        first_row = max(0, min(int(index), max_first))
+        if first_row != self.first_row and self.on_leave is not None:
+            self.on_leave()  # 마우스 아래의 행이 바뀌었으므로 툴팁 등을 닫습니다
+        self.first_row = first_row
+        self.refresh()
+    
+    def scroll_rows(self, delta):
+        """
+        핵심: 현재 위치에서 delta 행만큼 스크롤합니다.
+        """
+        self.scroll_to(self.first_row + delta)
+    
+    def refresh(self):
+        """
+        핵심: 보이는 행의 내용을 row_provider에서 다시 받아 그립니다.
+        """
+        self._ensure_pool()
+        x_positions = self._column_x_positions()
+        total_width = x_positions[-1]
+        
+        for slot, (background, cells) in enumerate(self._pool):
+            index = self.first_row + slot
+            if index >= self.row_count:
+                self.canvas.itemconfigure(background, state=tk.HIDDEN)
+                for cell in cells:
+                    self.canvas.itemconfigure(cell, state=tk.HIDDEN)
+                continue
+            
+            texts, color = self.row_provider(index)
+            top = self.header_height + slot * self.row_height
+            self.canvas.coords(background, 0, top, total_width, top + self.row_height - 1)
+            self.canvas.itemconfigure(background, fill=color or "white", state=tk.NORMAL)
+            for column, cell in enumerate(cells):
+                width = self.column_widths[column] - 10
+                text = texts[column] if column < len(texts) else ""
+                self.canvas.coords(cell, x_positions[column] + 5, top + self.row_height // 2)
+                self.canvas.itemconfigure(cell, text=self._fit(str(text), width), state=tk.NORMAL)
+        
+        self._update_scrollbar()
+    
+    def _create_header_items(self):
+        """
+        핵심: 열마다 머리글 텍스트 항목을 만듭니다. 위치는 _layout_columns에서 정합니다.
+        """
+        self._header_items = [
+            self.canvas.create_text(0, self.header_height // 2, text=title, anchor=tk.W, font=self._header_font)
+            for title, _, _ in self.columns
+        ]
+    
+    def _ensure_pool(self):
+        """
+        핵심: 보이는 행 수보다 재사용 항목이 적으면 필요한 만큼만 추가로 만듭니다.
+        """
+        needed = self.visible_rows + 1
+        while len(self._pool) < needed:
+            background = self.canvas.create_rectangle(0, 0, 0, 0, outline="", state=tk.HIDDEN)
+            cells = [
+                self.canvas.create_text(0, 0, anchor=tk.W, font=self._font, state=tk.HIDDEN)
+                for _ in self.columns
+            ]
+            self._pool.append((background, cells))
+        # 머리글이 항상 행 위에 그려지도록 합니다
+        self.canvas.tag_raise(self._header_background)
+        for item in self._header_items:
+            self.canvas.tag_raise(item)
+    
+    def _fit(self, text, width):
+        """
+        핵심: 텍스트가 열 너비를 넘으면 말줄임표로 자릅니다. 결과는 캐시됩니다.
+        """
+        cache_key = (text, width)
+        fitted = self._fit_cache.get(cache_key)
+        if fitted is not None:
+            return fitted
+        
+        fitted = text
+        if self._font.measure(text) > width:
+            # 평균 글자 너비로 대략 자른 뒤 넘치는 만큼만 한 글자씩 줄입니다
+            average = max(self._font.measure(text) / max(len(text), 1), 1)
+            fitted = text[:max(int(width / average) - 1, 0)]
+            while fitted and self._font.measure(fitted + "…") > width:
+                fitted = fitted[:-1]
+            fitted += "…"
+        
+        if len(self._fit_cache) > 10000:
+            self._fit_cache.clear()
+        self._fit_cache[cache_key] = fitted
+        return fitted
+    
+    def _column_x_positions(self):
+        """
+        핵심: 각 열의 시작 x 좌표와 마지막 열의 끝 좌표를 반환합니다.
+        """
+        positions = [0]
+        for width in self.column_widths:
+            positions.append(positions[-1] + width)
+        return positions
+    
+    def _layout_columns(self, canvas_width):
+        """
+        핵심: 캔버스 너비에 맞춰 남는 공간을 비율에 따라 열에 나눠 줍니다.
+        """
+        minimum = sum(min_width for _, min_width, _ in self.columns)
+        total_weight = sum(weight for _, _, weight in self.columns) or 1
+        extra = max(canvas_width - minimum, 0)
+        self.column_widths = [
+            min_width + extra * weight // total_weight for _, min_width, weight in self.columns
+        ]
+        
+        x_positions = self._column_x_positions()
+        self.canvas.coords(self._header_background, 0, 0, x_positions[-1], self.header_height)
+        for column, item in enumerate(self._header_items):
+            self.canvas.coords(item, x_positions[column] + 5, self.header_height // 2)
+        self.canvas.configure(scrollregion=(0, 0, x_positions[-1], self.canvas.winfo_height()))
+    
+    def _update_scrollbar(self):
+        if self.row_count <= 0:
+            self.v_scrollbar.set(0.0, 1.0)
+            return
+        first = self.first_row / self.row_count
+        last = min((self.first_row + self.visible_rows) / self.row_count, 1.0)
+        self.v_scrollbar.set(first, last)
+    
+    def _on_configure(self, event):
+        self._layout_columns(event.width)
+        self._fit_cache.clear()
+        self.scroll_to(self.first_row)
+    
+    def _on_scrollbar(self, action, amount, unit=None):
+        """
+        핵심: 스크롤바의 moveto/scroll 명령을 첫 번째 표시 행 변경으로 바꿉니다.
+        """
+        if action == "moveto":
+            self.scroll_to(float(amount) * self.row_count)
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.scroll_rows(int(float(amount)) * step)
+    
+    def _on_mousewheel(self, event):
+        self.scroll_rows(-3 if event.delta > 0 else 3)
+    
+    def _hit_test(self, event):
+        """
+        핵심: 마우스 위치를 (행 인덱스, 열 인덱스)로 변환합니다. 행 영역 밖이면 None을 반환합니다.
+        """
+        y = event.y - self.header_height
+        if y < 0:
+            return None
+        index = self.first_row + y // self.row_height
+        if index >= self.row_count:
+            return None
+        x = self.canvas.canvasx(event.x)
+        x_positions = self._column_x_positions()
+        for column in range(len(self.columns)):
+            if x_positions[column] <= x < x_positions[column + 1]:
+                return index, column
+        return None
+    
+    def _on_motion(self, event):
+        hit = self._hit_test(event)
+        if hit is None:
+            if self.on_leave is not None:
+                self.on_leave()
+        elif self.on_hover is not None:
+            self.on_hover(hit[0], hit[1], event)
+    
+    def _on_canvas_leave(self, event):
+        if self.on_leave is not None:
+            self.on_leave()
+    
+    def _on_button(self, event):
+        hit = self._hit_test(event)
+        if hit is not None and self.on_click is not None:
+            self.on_click(hit[0], hit[1], event)
+    
+    def pack(self, **kwargs):
+        """
+        핵심: 프레임을 패킹합니다.
+        """
+        self.frame.pack(**kwargs)
+    
+    def grid(self, **kwargs):
+        """
+        핵심: 프레임을 그리드 배치합니다.
+        """
+        self.frame.grid(**kwargs)
+
+
+class PagedTreeView:
+    """
+    핵심: 보이는 행 수만큼의 Treeview 항목만 유지하는 페이지 방식 결과 뷰.
+    
+    항목을 행마다 insert하지 않고, 화면에 보이는 개수만큼의 항목을 만들어 두었다가
+    스크롤할 때마다 row_provider(행 인덱스)로 받은 값으로 내용만 바꿉니다.
+    세로 스크롤바는 Treeview가 아니라 전체 행 수를 기준으로 동작하므로
+    특정 행으로 이동하는 것도 O(1)입니다.
+    """
+    
+    # Treeview 머리글 높이 추정값 (픽셀)
+    HEADING_HEIGHT = 25
+    
+    def __init__(self, parent, columns, row_provider: Callable[[int], Any], row_count=0,
+                 show_row_numbers=True, on_heading_click: Optional[Callable[[str], None]] = None):
+        """
+        핵심: 페이지 방식 트리뷰를 생성합니다.
+        
+        매개변수:
+            parent: 부모 위젯
+            columns: 열 이름 목록
+            row_provider: 행 인덱스를 받아 (행 번호 텍스트, 값 목록, 태그 튜플)을 반환하는 함수
+            row_count: 전체 행 수
+            show_row_numbers: 행 번호 표시 여부
+            on_heading_click: 열 머리글을 클릭하면 열 이름을 받는 콜백 (선택)
+        """
+        self.parent = parent
+        self.columns = list(columns)
+        self.row_provider = row_provider
+        self.on_heading_click = on_heading_click
+        self.row_count = row_count
+        self.first_row = 0
+        self.selected_row = None
+        self._items = []  # 재사용하는 Treeview 항목 id
+        self._rendering = False
+        
+        self.frame = ttk.Frame(parent)
+        
+        h_scrollbar = ttk.Scrollbar(self.frame, orient=tk.HORIZONTAL)
+        h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        # 세로 스크롤바는 전체 행 기준의 가상 위치를 표시합니다
+        self.v_scrollbar = ttk.Scrollbar(self.frame, command=self._on_scrollbar)
+        self.v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.tree = ttk.Treeview(self.frame, columns=self.columns, xscrollcommand=h_scrollbar.set,
+                                 selectmode="browse")
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        h_scrollbar.config(command=self.tree.xview)
+        
+        if show_row_numbers:
+            self.tree.column("#0", width=60, stretch=tk.NO)
+            self.tree.heading("#0", text="행")
+        else:
+            self.tree.column("#0", width=0, stretch=tk.NO)
+        for col in self.columns:
+            self.tree.column(col, anchor=tk.W, width=100)
+            self._configure_heading(col)
+        
+        # 태그 스타일은 생성 시 한 번만 설정합니다
+        self.tree.tag_configure("matched", background="#e6ffe6")  # 일치하는 행은 연한 녹색
+        self.tree.tag_configure("unmatched", background="#fff0f0")  # 일치하지 않는 행은 연한 빨강색
+        
+        style_row_height = ttk.Style(self.tree).lookup("Treeview", "rowheight")
+        self.row_height = int(style_row_height) if style_row_height else 20
+        
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda event: self._scroll_and_break(-3))
+        self.tree.bind("<Button-5>", lambda event: self._scroll_and_break(3))
+        self.tree.bind("<Up>", lambda event: self._move_selection(-1))
+        self.tree.bind("<Down>", lambda event: self._move_selection(1))
+        self.tree.bind("<Prior>", lambda event: self._move_selection(-self.page_size))
+        self.tree.bind("<Next>", lambda event: self._move_selection(self.page_size))
+        self.tree.bind("<Home>", lambda event: self._move_selection(-self.row_count))
+        self.tree.bind("<End>", lambda event: self._move_selection(self.row_count))
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+    
+    @property
+    def page_size(self):
+        """
+        핵심: 한 화면에 표시하는 행 수(재사용 항목 수)를 반환합니다.
+        """
+        return max(len(self._items), 1)
+    
+    def set_row_count(self, row_count):
+        """
+        핵심: 전체 행 수를 변경하고 화면을 다시 그립니다.
+        """
+        self.row_count = row_count
+        self.scroll_to(self.first_row)
+    
+    def set_data(self, columns, row_provider: Callable[[int], Any], row_count):
+        """
+        핵심: 같은 트리뷰에 새 열과 데이터를 연결하고 맨 위부터 다시 그립니다.
+        
+        재사용 항목과 스크롤바는 그대로 두고 열 구성과 내용만 바꿉니다.
+        
+        매개변수:
+            columns: 새 열 이름 목록
+            row_provider: 새 행 제공 함수
+            row_count: 새 전체 행 수
+        """
+        columns = list(columns)
+        if columns != self.columns:
+            self.columns = columns
+            self.tree.configure(columns=columns)
+            for col in columns:
+                self.tree.column(col, anchor=tk.W, width=100)
+                self._configure_heading(col)
+        self.row_provider = row_provider
+        self.row_count = row_count
+        self.selected_row = None
+        self.scroll_to(0)
+    
+    def set_sort_indicator(self, column=None, descending=False):
+        """
+        핵심: 정렬 기준 열의 머리글에 방향 화살표를 표시합니다.
+        
+        매개변수:
+            column: 정렬 기준 열 이름, None이면 모든 화살표를 지웁니다
+            descending: 내림차순 여부
+        """
+        for col in self.columns:
+            text = col
+            if col == column:
+                text += " ▼" if descending else " ▲"
+            self.tree.heading(col, text=text)
+    
+    def _configure_heading(self, col):
+        """
+        핵심: 열 머리글의 텍스트와 클릭 명령을 설정합니다.
+        """
+        if self.on_heading_click is None:
+            self.tree.heading(col, text=col)
+        else:
+            self.tree.heading(col, text=col, command=lambda c=col: self.on_heading_click(c))
+    
+    def scroll_to(self, index):
+        """
+        핵심: 지정한 행이 맨 위에 오도록 스크롤합니다.
+        
+        매개변수:
+            index: 맨 위에 표시할 행 인덱스
+        """
+        max_first = max(self.row_count - len(self._items), 0)
+        self.first_row = max(0, min(int(index), max_first))
+        self.refresh()
+    
+    def jump_to_row(self, index):
+        """
+        핵심: 지정한 행으로 이동하여 선택합니다. 행 값은 보이는 범위만 새로 읽으므로 O(1)입니다.
         
-        # 스크롤을 위한 이벤트 바인딩
-        self.content_frame.bind("<Configure>", self._on_frame_configure)
-        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        매개변수:
+            index: 이동할 행 인덱스 (0부터 시작)
+        """
+        if not 0 <= index < self.row_count:
+            return
+        self.selected_row = index
+        if not self.first_row <= index < self.first_row + len(self._items):
+            self.scroll_to(index)
+        else:
+            self.refresh()
+        self.tree.focus_set()
+    
+    def refresh(self):
+        """
+        핵심: 보이는 행의 내용을 row_provider에서 다시 받아 항목에 반영합니다.
+        """
+        self._rendering = True
+        try:
+            selected_item = None
+            for slot, item in enumerate(self._items):
+                index = self.first_row + slot
+                if index < self.row_count:
+                    text, values, tags = self.row_provider(index)
+                    self.tree.item(item, text=text, values=values, tags=tags)
+                    if index == self.selected_row:
+                        selected_item = item
+                else:
+                    self.tree.item(item, text="", values=(), tags=())
+            
+            if selected_item is not None:
+                self.tree.selection_set(selected_item)
+                self.tree.focus(selected_item)
+            else:
+                self.tree.selection_set(())
+            self.tree.yview_moveto(0)
+        finally:
+            self._rendering = False
+        self._update_scrollbar()
+    
+    def _resize_pool(self, size):
+        """
+        핵심: 재사용 항목 수를 화면에 보이는 행 수에 맞춥니다.
+        """
+        while len(self._items) < size:
+            self._items.append(self.tree.insert("", tk.END))
+        while len(self._items) > size:
+            self.tree.delete(self._items.pop())
+    
+    def _update_scrollbar(self):
+        if self.row_count <= 0:
+            self.v_scrollbar.set(0.0, 1.0)
+            return
+        first = self.first_row / self.row_count
+        last = min((self.first_row + len(self._items)) / self.row_count, 1.0)
+        self.v_scrollbar.set(first, last)
+    
+    def _on_configure(self, event):
+        visible = max((event.height - self.HEADING_HEIGHT) // self.row_height, 1)
+        self._resize_pool(visible)
+        self.scroll_to(self.first_row)
+    
+    def _on_scrollbar(self, action, amount, unit=None):
+        """
+        핵심: 스크롤바의 moveto/scroll 명령을 첫 번째 표시 행 변경으로 바꿉니다.
+        """
+        if action == "moveto":
+            self.scroll_to(float(amount) * self.row_count)
+        elif action == "scroll":
+            step = self.page_size if unit == "pages" else 1
+            self.scroll_to(self.first_row + int(float(amount)) * step)
+    
+    def _scroll_and_break(self, delta):
+        self.scroll_to(self.first_row + delta)
+        return "break"  # Treeview 기본 스크롤을 막습니다
+    
+    def _on_mousewheel(self, event):
+        return self._scroll_and_break(-3 if event.delta > 0 else 3)
     
-    def _on_frame_configure(self, event=None):
+    def _move_selection(self, delta):
         """
-        핵심: 내부 프레임의 크기가 변경될 때 스크롤 영역을 업데이트합니다.
+        핵심: 선택된 행을 delta만큼 옮기고 화면 밖으로 나가면 스크롤합니다.
         """
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        if self.row_count == 0:
+            return "break"
+        current = self.selected_row if self.selected_row is not None else self.first_row
+        target = max(0, min(current + delta, self.row_count - 1))
+        self.selected_row = target
+        if target < self.first_row:
+            self.scroll_to(target)
+        elif target >= self.first_row + len(self._items):
+            self.scroll_to(target - len(self._items) + 1)
+        else:
+            self.refresh()
+        return "break"
+    
+    def _on_select(self, event):
+        if self._rendering:
+            return
+        selection = self.tree.selection()
+        if selection and selection[0] in self._items:
+            self.selected_row = self.first_row + self._items.index(selection[0])
     
-    def _on_canvas_configure(self, event=None):
+    def pack(self, **kwargs):
         """
-        핵심: 캔버스 크기가 변경될 때 내부 프레임의 크기를 조정합니다.
+        핵심: 프레임을 패킹합니다.
         """
-        canvas_width = event.width
-        self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+        self.frame.pack(**kwargs)
     
-    def get_frame(self):
+    def grid(self, **kwargs):
         """
-        핵심: 위젯을 추가하기 위한 콘텐츠 프레임을 가져옵니다.
+        핵심: 프레임을 그리드 배치합니다.
         """
-        return self.content_frame
+        self.frame.grid(**kwargs)
 
 
 class TableView:
@@ -175,8 +867,26 @@ class TableView:
         """
         핵심: 테이블에서 모든 항목을 지웁니다.
         """
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+    
+    def set_columns(self, columns):
+        """
+        핵심: 모든 항목을 지우고 열 구성을 바꿉니다. 위젯은 다시 만들지 않습니다.
+        
+        매개변수:
+            columns: 새 열 이름 목록
+        """
+        self.clear()
+        columns = list(columns)
+        if columns == self.columns:
+            return
+        self.columns = columns
+        self.tree.configure(columns=columns)
+        for col in columns:
+            self.tree.column(col, anchor=tk.W, width=100)
+            self.tree.heading(col, text=col)
     
     def add_row(self, values, row_num=None, tags=None):
         """
@@ -212,6 +922,173 @@ class TableView:
         self.frame.grid(**kwargs)
 
 
+class CanvasTableView:
+    """
+    핵심: TableView와 같은 방식으로 사용하는 Canvas 기반 테이블 위젯.
+    
+    행 값은 목록에만 저장하고 VirtualGrid로 화면에 보이는 행만 캔버스 항목으로 그리므로,
+    캔버스 항목 수가 행 수가 아니라 화면 높이에 비례합니다. 행 높이는 고정이고,
+    열 머리글의 경계를 끌어 열 너비를 바꿀 수 있으며, "matched"/"unmatched" 태그는
+    TableView와 같은 배경색으로 표시됩니다.
+    """
+    
+    # 열 기본 너비, 행 번호 열 너비, 끌어서 줄일 수 있는 최소 너비 (픽셀)
+    DEFAULT_COLUMN_WIDTH = 100
+    ROW_NUMBER_WIDTH = 40
+    MIN_COLUMN_WIDTH = 30
+    
+    def __init__(self, parent, columns=None, show_row_numbers=True):
+        """
+        핵심: 캔버스 테이블 뷰 위젯을 생성합니다.
+        
+        매개변수:
+            parent: 부모 위젯
+            columns: 열 이름 목록
+            show_row_numbers: 행 번호 표시 여부
+        """
+        self.parent = parent
+        self.columns = list(columns or [])
+        self.show_row_numbers = show_row_numbers
+        self._rows = []  # (행 번호 텍스트, 값 목록, 배경색)
+        self._refresh_id = None
+        self._resizing = None  # 너비를 바꾸는 중인 (열 인덱스, 시작 x 좌표, 시작 너비)
+        
+        self.virtual_grid = VirtualGrid(parent, self._grid_columns(), self._row_provider,
+                                        row_height=22, header_height=25)
+        self.frame = self.virtual_grid.frame
+        
+        canvas = self.virtual_grid.canvas
+        canvas.bind("<Motion>", self._on_pointer_motion, add="+")
+        canvas.bind("<ButtonPress-1>", self._on_press, add="+")
+        canvas.bind("<B1-Motion>", self._on_drag, add="+")
+        canvas.bind("<ButtonRelease-1>", self._on_release, add="+")
+    
+    @property
+    def row_count(self):
+        """
+        핵심: 추가된 행 수를 반환합니다.
+        """
+        return len(self._rows)
+    
+    def clear(self):
+        """
+        핵심: 테이블에서 모든 행을 지웁니다.
+        """
+        self._rows = []
+        self.virtual_grid.set_data(self._row_provider, 0)
+    
+    def set_columns(self, columns):
+        """
+        핵심: 모든 행을 지우고 열 구성을 바꿉니다. 위젯은 다시 만들지 않습니다.
+        
+        매개변수:
+            columns: 새 열 이름 목록
+        """
+        self.clear()
+        columns = list(columns)
+        if columns == self.columns:
+            return
+        self.columns = columns
+        self.virtual_grid.set_columns(self._grid_columns())
+    
+    def add_row(self, values, row_num=None, tags=None):
+        """
+        핵심: 테이블에 행을 추가합니다. 화면 갱신은 유휴 시간에 한 번으로 모아서 합니다.
+        
+        매개변수:
+            values: 행의 값 목록
+            row_num: 표시할 행 번호 (None인 경우 비워 둠)
+            tags: 행 스타일링을 위한 태그 ("matched" 또는 "unmatched")
+            
+        반환값:
+            추가된 행의 위치
+        """
+        color = None
+        for tag in tags or ():
+            color = ROW_TAG_COLORS.get(tag, color)
+        self._rows.append((str(row_num) if row_num is not None else "", list(values), color))
+        if self._refresh_id is None:
+            self._refresh_id = self.virtual_grid.canvas.after_idle(self._flush_rows)
+        return len(self._rows) - 1
+    
+    def _flush_rows(self):
+        """
+        핵심: 추가된 행 수를 그리드에 반영합니다. 현재 스크롤 위치는 유지합니다.
+        """
+        self._refresh_id = None
+        if self.virtual_grid.canvas.winfo_exists():
+            self.virtual_grid.set_row_count(len(self._rows))
+    
+    def _grid_columns(self):
+        """
+        핵심: 열 이름 목록을 VirtualGrid의 (열 제목, 너비, 늘어나는 비율) 목록으로 바꿉니다.
+        """
+        grid_columns = [("행", self.ROW_NUMBER_WIDTH, 0)] if self.show_row_numbers else []
+        grid_columns.extend((col, self.DEFAULT_COLUMN_WIDTH, 0) for col in self.columns)
+        return grid_columns
+    
+    def _row_provider(self, index):
+        row_num, values, color = self._rows[index]
+        return ([row_num] + values if self.show_row_numbers else values), color
+    
+    def _on_pointer_motion(self, event):
+        """
+        핵심: 마우스가 머리글의 열 경계 위에 있으면 너비 조절 커서를 표시합니다.
+        """
+        if self._resizing is not None:
+            return
+        on_edge = event.y <= self.virtual_grid.header_height and \
+            self.virtual_grid.column_edge_at(event.x) is not None
+        self.virtual_grid.canvas.configure(cursor="sb_h_double_arrow" if on_edge else "")
+    
+    def _on_press(self, event):
+        if event.y > self.virtual_grid.header_height:
+            return
+        column = self.virtual_grid.column_edge_at(event.x)
+        if column is not None:
+            self._resizing = (column, event.x, self.virtual_grid.column_widths[column])
+    
+    def _on_drag(self, event):
+        if self._resizing is None:
+            return
+        column, start_x, start_width = self._resizing
+        self.virtual_grid.set_column_width(column, max(start_width + event.x - start_x, self.MIN_COLUMN_WIDTH))
+    
+    def _on_release(self, event):
+        self._resizing = None
+    
+    def pack(self, **kwargs):
+        """
+        핵심: 프레임을 패킹합니다.
+        """
+        self.frame.pack(**kwargs)
+    
+    def grid(self, **kwargs):
+        """
+        핵심: 프레임을 그리드 배치합니다.
+        """
+        self.frame.grid(**kwargs)
+
+
+def create_table_view(parent, columns=None, show_row_numbers=True):
+    """
+    핵심: USE_CANVAS_TABLES 설정에 따라 CanvasTableView 또는 TableView를 생성합니다.
+    
+    두 위젯은 columns, clear, set_columns, add_row, pack, grid를 같은 방식으로 제공하므로
+    호출하는 쪽은 어느 위젯인지 구분하지 않고 사용할 수 있습니다.
+    
+    매개변수:
+        parent: 부모 위젯
+        columns: 열 이름 목록
+        show_row_numbers: 행 번호 표시 여부
+        
+    반환값:
+        테이블 표시 위젯
+    """
+    table_class = CanvasTableView if USE_CANVAS_TABLES else TableView
+    return table_class(parent, columns, show_row_numbers)
+
+
 class ExplanationText(scrolledtext.ScrolledText):
     """
     핵심: 스타일이 지정된 텍스트를 지원하는 향상된 ScrolledText 위젯.
@@ -260,6 +1137,20 @@ class ExplanationText(scrolledtext.ScrolledText):
         """
         self.insert(tk.END, text, "excluded")
         
+    def add_segments(self, segments):
+        """
+        핵심: (스타일 태그, 텍스트) 목록을 insert 한 번으로 추가합니다.
+        
+        매개변수:
+            segments: (스타일 태그, 텍스트) 튜플 목록
+        """
+        if not segments:
+            return
+        arguments = []
+        for tag, text in segments:
+            arguments.extend((text, tag))
+        self.insert(tk.END, *arguments)
+        
     def set_read_only(self, read_only=True):
         """
         핵심: 위젯을 읽기 전용 모드로 설정합니다.